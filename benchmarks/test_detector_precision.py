@@ -0,0 +1,107 @@
+"""
+Accuracy / latency comparison of the FP32 and the INT8 detection model.
+
+The FP32 detections are the reference: an INT8 detection matches if it has the same
+class and an IoU of at least 0.5. The detector caches are bypassed, both models run
+on identical preprocessed inputs.
+
+Run with `make bench` (or `uv run pytest -s benchmarks/test_detector_precision.py`).
+Create the INT8 model first with `scripts/quantize_detector.py`.
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from Photo_Composition_Designer.image.ObjectDetector import Detection, ObjectDetector
+
+IMAGE_DIR = Path("images")
+REPEATS = 3
+MIN_RECALL = 0.8
+MIN_PRECISION = 0.8
+
+
+def _iou(a: tuple, b: tuple) -> float:
+    inter_w = max(0.0, min(a[2], b[2]) - max(a[0], b[0]))
+    inter_h = max(0.0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = inter_w * inter_h
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _count_matches(reference: list[Detection], candidate: list[Detection]) -> int:
+    unmatched = list(reference)
+    matches = 0
+    for det in sorted(candidate, key=lambda d: -d.confidence):
+        best = max(
+            (ref for ref in unmatched if ref.class_name == det.class_name),
+            key=lambda ref: _iou(ref.bbox, det.bbox),
+            default=None,
+        )
+        if best is not None and _iou(best.bbox, det.bbox) >= 0.5:
+            unmatched.remove(best)
+            matches += 1
+    return matches
+
+
+def _run(detector: ObjectDetector, inputs: list) -> tuple[list[list[Detection]], float]:
+    """Returns the detections per image and the mean inference latency in ms."""
+    detector.session.run(None, {detector.input_name: inputs[0][0]})  # warm-up
+
+    results = []
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        results = []
+        for tensor, scale, (pad_x, pad_y), (width, height) in inputs:
+            output = detector.session.run(None, {detector.input_name: tensor})[0][0]
+            results.append(detector._postprocess(output, scale, pad_x, pad_y, width, height))
+    latency_ms = (time.perf_counter() - start) / (REPEATS * len(inputs)) * 1000
+    return results, latency_ms
+
+
+@pytest.mark.skipif(
+    not all(Path(path).exists() for path in ObjectDetector.MODEL_PATHS.values()),
+    reason="FP32 and INT8 detection models are required",
+)
+def test_int8_vs_fp32(tmp_path):
+    inputs = []
+    for image_file in sorted(IMAGE_DIR.rglob("*.jpg")):
+        with Image.open(image_file) as image:
+            scale, _, padding = ObjectDetector._letterbox_geometry(*image.size)
+            inputs.append((ObjectDetector.prepare_input(image), scale, padding, image.size))
+    assert inputs
+
+    fp32 = ObjectDetector(ObjectDetector.MODEL_PATHS["fp32"], cache_dir=tmp_path)
+    int8 = ObjectDetector(ObjectDetector.MODEL_PATHS["int8"], cache_dir=tmp_path)
+
+    reference, fp32_ms = _run(fp32, inputs)
+    quantized, int8_ms = _run(int8, inputs)
+
+    matches = sum(_count_matches(r, q) for r, q in zip(reference, quantized, strict=True))
+    reference_count = sum(len(r) for r in reference)
+    quantized_count = sum(len(q) for q in quantized)
+    recall = matches / reference_count if reference_count else 1.0
+    precision = matches / quantized_count if quantized_count else 1.0
+    confidence_delta = np.mean(
+        [
+            abs(np.mean([d.confidence for d in r]) - np.mean([d.confidence for d in q]))
+            for r, q in zip(reference, quantized, strict=True)
+            if r and q
+        ]
+        or [0.0]
+    )
+
+    print()
+    print(f"{'model':<6} {'latency/img':>12} {'detections':>11}")
+    print(f"{'fp32':<6} {fp32_ms:>10.1f}ms {reference_count:>11}")
+    print(f"{'int8':<6} {int8_ms:>10.1f}ms {quantized_count:>11}")
+    print(
+        f"speedup x{fp32_ms / int8_ms:.2f}, recall {recall:.3f}, precision {precision:.3f}, "
+        f"mean confidence delta {confidence_delta:.3f} ({len(inputs)} images)"
+    )
+
+    assert recall >= MIN_RECALL
+    assert precision >= MIN_PRECISION
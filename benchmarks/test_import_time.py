@@ -0,0 +1,75 @@
+"""
+Import time regression test of the CLI (`python -X importtime`).
+
+Heavy libraries (geopandas/matplotlib for maps, onnxruntime for object detection,
+holidays/babel/astral for the calendar, tkinter for the GUI) are imported on first
+use, so `--help` and runs without maps or object recognition do not pay for them.
+
+Run with `make bench` (or `uv run pytest -s benchmarks/test_import_time.py`).
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+MODULES = {
+    "Photo_Composition_Designer.cli.cli": 600,
+    "Photo_Composition_Designer.core.base": 500,
+}
+REPEATS = 3
+
+LAZY_MODULES = (
+    "geopandas",
+    "matplotlib",
+    "shapely",
+    "onnxruntime",
+    "holidays",
+    "babel",
+    "astral",
+    "pytz",
+    "tkinter",
+    "ttkbootstrap",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per module, from a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|", 2)
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module, budget_ms", MODULES.items())
+def test_import_time(module, budget_ms):
+    runs = [_import_times(module) for _ in range(REPEATS)]
+    import_ms = min(times[module] for times in runs) / 1000
+
+    slowest = sorted(runs[0].items(), key=lambda item: -item[1])[1:8]
+    print()
+    print(f"{module}: {import_ms:.0f}ms (budget {budget_ms}ms)")
+    for name, cumulative in slowest:
+        print(f"  {cumulative / 1000:>7.1f}ms  {name}")
+
+    assert import_ms <= budget_ms
+
+
+def test_heavy_modules_are_lazy():
+    code = (
+        "import sys, Photo_Composition_Designer.cli.cli;"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,76 @@
+"""
+Encode time and file size of the output formats for one print-size page.
+
+The page is a 216 x 154 mm collage at 300 dpi built from the sample photos, with a
+flat background and text, similar to the generated calendar pages.
+
+Run with `make bench` (or `uv run pytest -s benchmarks/test_output_formats.py`).
+"""
+
+import io
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.core.OutputFormat import OutputFormat
+from Photo_Composition_Designer.tools.Helpers import mm_to_px
+
+IMAGE_DIR = Path("images")
+REPEATS = 3
+
+VARIANTS = {
+    "jpg baseline": {"outputFormat": "jpg"},
+    "jpg 4:4:4": {"outputFormat": "jpg", "jpgSubsampling": "4:4:4"},
+    "jpg optimized": {"outputFormat": "jpg", "jpgOptimize": True},
+    "jpg progressive+opt": {"outputFormat": "jpg", "jpgProgressive": True, "jpgOptimize": True},
+    "webp m4": {"outputFormat": "webp"},
+    "webp m6": {"outputFormat": "webp", "webpMethod": 6},
+    "webp lossless": {"outputFormat": "webp", "webpLossless": True, "webpMethod": 1},
+    "png level 1": {"outputFormat": "png", "pngCompressLevel": 1},
+    "png level 6": {"outputFormat": "png"},
+    "tiff lzw": {"outputFormat": "tiff"},
+    "tiff deflate": {"outputFormat": "tiff", "tiffCompression": "tiff_adobe_deflate"},
+    "tiff raw": {"outputFormat": "tiff", "tiffCompression": "raw"},
+}
+
+
+def _page(photos: list[Path]) -> Image.Image:
+    width, height = mm_to_px(216, 300), mm_to_px(154, 300)
+    page = Image.new("RGB", (width, height), (20, 20, 20))
+    cell_w = (width - 40) // 2
+    cell_h = (height - 400) // 2
+    for i, photo in enumerate(photos[:4]):
+        with Image.open(photo) as image:
+            tile = image.convert("RGB").resize((cell_w, cell_h))
+        page.paste(tile, (10 + (i % 2) * (cell_w + 20), 10 + (i // 2) * (cell_h + 20)))
+    draw = ImageDraw.Draw(page)
+    for row in range(5):
+        draw.text((40, height - 350 + row * 60), "Mo Di Mi Do Fr Sa So " * 8, fill="white")
+    return page
+
+
+@pytest.mark.skipif(not IMAGE_DIR.exists(), reason="sample photos are required")
+def test_output_formats():
+    page = _page(sorted(IMAGE_DIR.rglob("*.jpg")))
+
+    print()
+    print(f"page {page.width}x{page.height}")
+    print(f"{'format':<20} {'encode':>9} {'size':>9}")
+    for label, values in VARIANTS.items():
+        config = ConfigParameterManager(persist_last_used=False)
+        for name, value in values.items():
+            getattr(config.output, name).value = value
+        options = OutputFormat.from_config(config).save_options(300)
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            buffer = io.BytesIO()
+            page.save(buffer, **options)
+        encode_ms = (time.perf_counter() - start) / REPEATS * 1000
+
+        size_kb = buffer.tell() / 1024
+        print(f"{label:<20} {encode_ms:>7.0f}ms {size_kb:>7.0f}kB")
+        assert size_kb > 0
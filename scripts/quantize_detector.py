@@ -0,0 +1,134 @@
+"""
+Offline INT8 quantization of the YOLO detection model.
+
+Creates res/yolo/yolo26n_int8.onnx from the FP32 model with static quantization.
+The activation ranges are calibrated on sample photos, preprocessed exactly like
+ObjectDetector.detect() does (letterbox, 0..1 floats). Select the result with
+`detector.modelPrecision: int8` in the config.
+
+Usage:
+    uv run python scripts/quantize_detector.py --calibration images --samples 200
+
+Requires the `onnx` package (`uv pip install onnx`), which is only needed for this script.
+"""
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    CalibrationMethod,
+    QuantFormat,
+    QuantType,
+    quantize_static,
+)
+from onnxruntime.quantization.shape_inference import quant_pre_process
+from PIL import Image
+
+from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector
+
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png")
+
+
+class PhotoCalibrationReader(CalibrationDataReader):
+    """Feeds letterboxed sample photos to the calibration, one image per batch."""
+
+    def __init__(self, input_name: str, image_files: list[Path]):
+        self.input_name = input_name
+        self.image_files = iter(image_files)
+
+    def get_next(self) -> dict | None:
+        image_file = next(self.image_files, None)
+        if image_file is None:
+            return None
+        with Image.open(image_file) as image:
+            return {self.input_name: ObjectDetector.prepare_input(image)}
+
+
+def find_images(calibration_dir: Path, samples: int, seed: int) -> list[Path]:
+    image_files = sorted(
+        file for file in calibration_dir.rglob("*") if file.suffix.lower() in IMAGE_SUFFIXES
+    )
+    random.Random(seed).shuffle(image_files)
+    return image_files[:samples]
+
+
+def quantize(
+    model: Path,
+    output: Path,
+    image_files: list[Path],
+    per_channel: bool = True,
+    method: str = "minmax",
+) -> Path:
+    import onnx
+
+    input_name = onnx.load(str(model), load_external_data=False).graph.input[0].name
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # shape inference and graph cleanup improve the quantization result; the
+        # input shape is static, so the (sympy based) symbolic inference is not needed
+        prepared = Path(tmp) / "prepared.onnx"
+        quant_pre_process(str(model), str(prepared), skip_symbolic_shape=True)
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        quantize_static(
+            str(prepared),
+            str(output),
+            PhotoCalibrationReader(input_name, image_files),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+            calibrate_method={
+                "minmax": CalibrationMethod.MinMax,
+                "entropy": CalibrationMethod.Entropy,
+                "percentile": CalibrationMethod.Percentile,
+            }[method],
+        )
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create the INT8 detection model.")
+    parser.add_argument("--model", type=Path, default=Path(ObjectDetector.MODEL_PATHS["fp32"]))
+    parser.add_argument("--output", type=Path, default=Path(ObjectDetector.MODEL_PATHS["int8"]))
+    parser.add_argument(
+        "--calibration",
+        type=Path,
+        default=Path("images"),
+        help="Folder with sample photos (searched recursively)",
+    )
+    parser.add_argument("--samples", type=int, default=200, help="Number of calibration photos")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--method",
+        choices=["minmax", "entropy", "percentile"],
+        default="minmax",
+        help="Calibration method for the activation ranges",
+    )
+    parser.add_argument(
+        "--per-tensor",
+        action="store_true",
+        help="Quantize weights per tensor instead of per channel",
+    )
+    args = parser.parse_args()
+
+    image_files = find_images(args.calibration, args.samples, args.seed)
+    if not image_files:
+        parser.error(f"No calibration photos found in {args.calibration}")
+
+    print(f"Calibrating with {len(image_files)} photos from {args.calibration} ...")
+    output = quantize(
+        args.model,
+        args.output,
+        image_files,
+        per_channel=not args.per_tensor,
+        method=args.method,
+    )
+    print(f"Generated: {output}")
+
+
+if __name__ == "__main__":
+    main()
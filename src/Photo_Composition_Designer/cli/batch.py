@@ -0,0 +1,285 @@
+"""Batch CLI: renders several configurations in one warm process.
+
+Every job is a config file, optionally with parameter overrides. Jobs are given as
+config files on the command line or as a JSON job manifest:
+
+    {
+      "jobs": [
+        {"name": "family", "config": "family/config.yaml"},
+        {"config": "club/config.yaml", "overrides": {"size__dpi": 150}}
+      ]
+    }
+
+Relative paths in a manifest are relative to the manifest file. Overrides use the
+`category__param` keys of ConfigManager.apply_overrides().
+
+Heavy libraries, the detection model, shapefiles and fonts are loaded once and
+reused by all jobs. With --workers N the jobs run in N worker processes, which share
+a single detector service (one model and one detection cache) instead of loading
+their own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from logging import Logger
+from pathlib import Path
+from typing import Any
+
+from config_cli_gui.logging import get_logger, initialize_logging
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.core.base import CompositionDesigner
+from Photo_Composition_Designer.image.DetectorService import DetectorService
+from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector
+
+
+@dataclass
+class BatchJob:
+    name: str
+    config_file: Path
+    overrides: dict[str, Any] = field(default_factory=dict)
+
+    def load_config(self) -> ConfigParameterManager:
+        """
+        Loads the config file and applies the overrides. Relative paths in it are
+        resolved against the config file by ConfigParameterManager.resolve_path().
+        """
+        return ConfigParameterManager(
+            str(self.config_file), persist_last_used=False, **self.overrides
+        )
+
+
+@dataclass
+class JobResult:
+    name: str
+    seconds: float
+    output_dir: Path | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def load_jobs(inputs: list[Path]) -> list[BatchJob]:
+    """Creates the jobs from config files and JSON job manifests."""
+    jobs: list[BatchJob] = []
+    for path in inputs:
+        data = None
+        if path.suffix.lower() == ".json":
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+
+        if isinstance(data, dict) and "jobs" in data:
+            for index, entry in enumerate(data["jobs"]):
+                config_file = (path.parent / entry["config"]).resolve()
+                jobs.append(
+                    BatchJob(
+                        name=entry.get("name") or f"{path.stem}-{index + 1}",
+                        config_file=config_file,
+                        overrides=entry.get("overrides", {}),
+                    )
+                )
+        else:
+            jobs.append(BatchJob(path.parent.name or path.stem, path.resolve()))
+
+    # job names are used in the summary, keep them unique
+    seen: dict[str, int] = {}
+    for job in jobs:
+        count = seen.get(job.name, 0)
+        seen[job.name] = count + 1
+        if count:
+            job.name = f"{job.name}-{count + 1}"
+    return jobs
+
+
+def run_job(
+    job: BatchJob,
+    object_detector=None,
+    logger: Logger | None = None,
+    workers: int = 1,
+    config: ConfigParameterManager | None = None,
+) -> JobResult:
+    """
+    Renders one job; failures are returned, not raised. `workers` is the number of
+    jobs running in parallel, a detector created here shares the cores with them.
+    `config` is the already loaded config of the job, it is loaded here if omitted.
+    """
+    if logger is None:  # e.g. in a worker process
+        initialize_logging()
+        logger = get_logger("base")
+    start = time.perf_counter()
+    try:
+        logger.info(f"Starting job {job.name} ({job.config_file})")
+        if config is None:
+            config = job.load_config()
+        designer = CompositionDesigner(
+            config, logger, object_detector=object_detector, workers=workers
+        )
+        designer.generate_compositions_from_folders()
+        result = JobResult(job.name, time.perf_counter() - start, designer.outputDir)
+    except Exception as exc:
+        logger.error(f"Job {job.name} failed: {exc}")
+        logger.debug("Full traceback:", exc_info=True)
+        result = JobResult(job.name, time.perf_counter() - start, error=str(exc) or repr(exc))
+    logger.info(f"Finished job {job.name} in {result.seconds:.1f}s")
+    return result
+
+
+def _detector_key(config: ConfigParameterManager | None) -> tuple | None:
+    """Detector settings of a job config (None without object recognition)."""
+    if config is None or not config.layout.objectRecognition.value:
+        return None
+    return tuple(sorted(ObjectDetector.config_kwargs(config).items(), key=lambda item: item[0]))
+
+
+class BatchRunner:
+    """Runs jobs sequentially in this process or in parallel worker processes."""
+
+    def __init__(self, workers: int = 1, fail_fast: bool = False, logger: Logger | None = None):
+        if logger:
+            self.logger: Logger = logger
+        else:
+            initialize_logging()
+            self.logger: Logger = get_logger("base")
+        self.workers = max(1, workers)
+        self.fail_fast = fail_fast
+
+    def run(self, jobs: list[BatchJob]) -> list[JobResult]:
+        # every config is loaded once; jobs with equal detector settings share a detector
+        configs: dict[str, ConfigParameterManager | None] = {}
+        for job in jobs:
+            try:
+                configs[job.name] = job.load_config()
+            except Exception:  # reported when the job runs
+                configs[job.name] = None
+        keys = {name: _detector_key(config) for name, config in configs.items()}
+
+        if self.workers == 1:
+            return self._run_sequential(jobs, configs, keys)
+        return self._run_parallel(jobs, configs, keys)
+
+    def _run_sequential(self, jobs: list[BatchJob], configs: dict, keys: dict) -> list[JobResult]:
+        detectors: dict[tuple, ObjectDetector] = {}
+        results = []
+        for job in jobs:
+            key = keys[job.name]
+            detector = None
+            if key is not None:
+                try:
+                    if key not in detectors:
+                        detectors[key] = ObjectDetector(**dict(key))
+                    detector = detectors[key]
+                except Exception as exc:
+                    self.logger.warning(f"Shared detector not available ({exc})")
+            results.append(run_job(job, detector, self.logger, config=configs[job.name]))
+            if self.fail_fast and not results[-1].ok:
+                break
+        return results
+
+    def _run_parallel(self, jobs: list[BatchJob], configs: dict, keys: dict) -> list[JobResult]:
+        services: dict[tuple, DetectorService] = {}
+        try:
+            for key in {key for key in keys.values() if key is not None}:
+                try:
+                    services[key] = DetectorService(dict(key)).start()
+                except RuntimeError as exc:  # workers load their own detector instead
+                    self.logger.warning(f"Shared detector service not available ({exc})")
+
+            results: dict[str, JobResult] = {}
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(self.workers, mp_context=context) as executor:
+                futures = {
+                    executor.submit(
+                        run_job,
+                        job,
+                        services[keys[job.name]].client() if keys[job.name] in services else None,
+                        None,
+                        self.workers,
+                        configs[job.name],
+                    ): job
+                    for job in jobs
+                }
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        results[job.name] = future.result()
+                    except Exception as exc:  # worker process died
+                        results[job.name] = JobResult(job.name, 0.0, error=repr(exc))
+                    if self.fail_fast and not results[job.name].ok:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+            return [results[job.name] for job in jobs if job.name in results]
+        finally:
+            for service in services.values():
+                service.stop()
+
+
+def format_summary(results: list[JobResult], total_seconds: float) -> str:
+    """Summary table with the timing and the result of every job."""
+    width = max([len(result.name) for result in results] + [3])
+    lines = [f"{'Job':<{width}}  {'Status':<6}  {'Time':>8}  Output / Error"]
+    for result in results:
+        status = "ok" if result.ok else "FAILED"
+        detail = result.output_dir if result.ok else result.error
+        lines.append(f"{result.name:<{width}}  {status:<6}  {result.seconds:>7.1f}s  {detail}")
+    failed = sum(not result.ok for result in results)
+    lines.append(
+        f"{len(results) - failed} of {len(results)} jobs succeeded in {total_seconds:.1f}s"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="Photo-Composition-Designer-batch",
+        description="Render several calendar configurations in one process.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="Config files (.yaml/.json) or JSON job manifests",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of jobs rendered in parallel worker processes (default: 1)",
+    )
+    parser.add_argument("--fail-fast", action="store_true", help="Stop after the first failed job")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
+    verbosity.add_argument(
+        "-q", "--quiet", action="store_true", help="Show warnings and errors only"
+    )
+    args = parser.parse_args(argv)
+
+    log_level = "DEBUG" if args.verbose else "WARNING" if args.quiet else "INFO"
+    initialize_logging(log_level)
+    logger = get_logger("Photo_Composition_Designer.batch")
+
+    try:
+        jobs = load_jobs(args.inputs)
+    except (OSError, ValueError, KeyError) as exc:
+        logger.error(f"Invalid job list: {exc}")
+        return 1
+
+    start = time.perf_counter()
+    results = BatchRunner(args.workers, args.fail_fast, logger).run(jobs)
+    print(format_summary(results, time.perf_counter() - start))
+
+    return 0 if len(results) == len(jobs) and all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ from config_cli_gui.logging import initialize_logging
 
 from Photo_Composition_Designer.config.config import ConfigParameterManager
 from Photo_Composition_Designer.core.base import CompositionDesigner
+from Photo_Composition_Designer.core.PhotoWatcher import PhotoWatcher
 
 
 def validate_config(config_manager: ConfigParameterManager, logger: Logger) -> bool:
@@ -68,6 +69,14 @@ def run_main_processing(config_manager: ConfigParameterManager, logger: Logger)
         composition_designer.generate_compositions_from_folders()
         logger.info("Conversion process completed")
 
+        if config_manager.general.watch.value:
+            # the designer is reused: model and caches stay loaded between renders
+            watcher = PhotoWatcher.from_config(composition_designer, logger)
+            try:
+                watcher.run()
+            except KeyboardInterrupt:
+                logger.info("Watch mode stopped")
+
         logger.info("CLI processing completed successfully")
         return 0
 
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+@dataclass
+class ManifestWeek:
+    """
+    A virtual week folder: a name and the photo files that belong to it.
+    """
+
+    name: str
+    files: list[Path] = field(default_factory=list)
+    description: str = ""
+
+
+class AssignmentManifest:
+    """
+    Describes how photos are assigned to weeks without copying them into folders.
+
+    The manifest is stored as JSON or CSV (selected by file suffix). File paths are
+    written relative to the manifest file when they are located below it, so a
+    manifest can be moved together with the photo library.
+
+    JSON structure:
+
+        {
+          "version": 1,
+          "weeks": [
+            {"name": "00_Dec-29", "description": "", "files": ["2025/12/img_01.jpg"]}
+          ]
+        }
+
+    CSV structure (one row per file, weeks without photos have an empty file column):
+
+        week,file,description
+        00_Dec-29,2025/12/img_01.jpg,
+    """
+
+    VERSION = 1
+    CSV_FIELDS = ("week", "file", "description")
+    # matches the names created by week_name(), e.g. "00_Dec-29"
+    WEEK_NAME_RE = re.compile(r"^\d{2}_[A-Z][a-z]{2}-\d{2}$")
+
+    def __init__(self, weeks: list[ManifestWeek] | None = None):
+        self.weeks: list[ManifestWeek] = weeks or []
+
+    @staticmethod
+    def week_name(week: int, start_date: datetime) -> str:
+        """Returns the folder-like name of a week, e.g. '00_Dec-29'."""
+        week_start = start_date + timedelta(weeks=week)
+        return f"{week:02d}_{week_start.strftime('%b-%d')}"
+
+    @classmethod
+    def from_groups(
+        cls, grouped_photos: list[list], start_date: datetime, weeks_count: int | None = None
+    ) -> AssignmentManifest:
+        """
+        Creates a manifest from grouped Photo objects (e.g. from ImageDistributor).
+
+        Args:
+            grouped_photos: One list of photos per week.
+            start_date: Date of the first week, used for the week names.
+            weeks_count: Number of weeks to create. Defaults to the number of groups;
+                weeks without a group stay empty.
+        """
+        weeks_count = len(grouped_photos) if weeks_count is None else weeks_count
+        weeks = []
+        for week in range(weeks_count):
+            photos = grouped_photos[week] if week < len(grouped_photos) else []
+            weeks.append(
+                ManifestWeek(
+                    name=cls.week_name(week, start_date),
+                    files=[Path(photo.file_path) for photo in photos],
+                )
+            )
+        return cls(weeks)
+
+    def week_names(self) -> list[str]:
+        return [week.name for week in self.weeks]
+
+    def get(self, name: str) -> ManifestWeek | None:
+        return next((week for week in self.weeks if week.name == name), None)
+
+    def index(self, name: str) -> int:
+        return self.week_names().index(name)
+
+    def __iter__(self):
+        return iter(self.weeks)
+
+    def __len__(self):
+        return len(self.weeks)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, manifest_file: Path | str) -> Path:
+        """Writes the manifest as JSON or CSV, depending on the file suffix."""
+        manifest_file = Path(manifest_file)
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        base_dir = manifest_file.parent.resolve()
+
+        if manifest_file.suffix.lower() == ".csv":
+            with open(manifest_file, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(self.CSV_FIELDS)
+                for week in self.weeks:
+                    if not week.files:
+                        writer.writerow((week.name, "", week.description))
+                    for file in week.files:
+                        writer.writerow(
+                            (week.name, self._to_manifest_path(file, base_dir), week.description)
+                        )
+        else:
+            data = {
+                "version": self.VERSION,
+                "weeks": [
+                    {
+                        "name": week.name,
+                        "description": week.description,
+                        "files": [self._to_manifest_path(file, base_dir) for file in week.files],
+                    }
+                    for week in self.weeks
+                ],
+            }
+            with open(manifest_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+        return manifest_file
+
+    @classmethod
+    def load(cls, manifest_file: Path | str) -> AssignmentManifest:
+        """Reads a manifest from a JSON or CSV file. Relative paths are resolved against it."""
+        manifest_file = Path(manifest_file)
+        if not manifest_file.exists():
+            raise FileNotFoundError(f"Manifest not found: {manifest_file}")
+        base_dir = manifest_file.parent.resolve()
+
+        if manifest_file.suffix.lower() == ".csv":
+            weeks: dict[str, ManifestWeek] = {}
+            with open(manifest_file, "r", encoding="utf-8", newline="") as f:
+                for row in csv.DictReader(f):
+                    name = (row.get("week") or "").strip()
+                    if not name:
+                        continue
+                    week = weeks.setdefault(
+                        name, ManifestWeek(name, description=(row.get("description") or ""))
+                    )
+                    file = (row.get("file") or "").strip()
+                    if file:
+                        week.files.append(cls._from_manifest_path(file, base_dir))
+            return cls(list(weeks.values()))
+
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        return cls(
+            [
+                ManifestWeek(
+                    name=str(week["name"]),
+                    files=[cls._from_manifest_path(file, base_dir) for file in week["files"]],
+                    description=str(week.get("description", "")),
+                )
+                for week in data.get("weeks", [])
+            ]
+        )
+
+    @staticmethod
+    def _to_manifest_path(file: Path, base_dir: Path) -> str:
+        file = Path(file).resolve()
+        try:
+            return file.relative_to(base_dir).as_posix()
+        except ValueError:
+            return str(file)
+
+    @staticmethod
+    def _from_manifest_path(file: str, base_dir: Path) -> Path:
+        path = Path(os.path.expanduser(file))
+        return path if path.is_absolute() else base_dir / path
@@ -1,4 +1,5 @@
 import os
+import re
 from collections import defaultdict
 
 from path_handler import get_base_path
@@ -26,6 +27,8 @@ class Locations:
             locations_file = base_path / "locations_en.ini"
 
         self.locations_dict = defaultdict(tuple)  # Dictionary for the locations
+        self._pattern: re.Pattern | None = None  # name matcher, built on first use
+        self._pattern_keys: dict[str, str] = {}
 
         if not os.path.exists(locations_file):
             return
@@ -66,15 +69,50 @@ class Locations:
         """
         self.locations_dict[city.lower()] = coordinates
 
+    def find_in_name(self, name: str) -> tuple[float, float] | None:
+        """
+        Returns the coordinates of the location that appears as a whole word in the
+        name (e.g. a file name), or None. If several locations appear, the first one
+        in the name wins; at the same position the longer one ("new york city").
+        """
+        if self._pattern is None:
+            self._compile_pattern()
+        match = self._pattern.search(name.lower())
+        if match is None:
+            return None
+        return self.locations_dict.get(self._pattern_keys[match.group(1)])
+
+    def _compile_pattern(self):
+        """
+        Builds one regex alternation of all locations, so a name is scanned once
+        instead of once per location.
+        """
+        self._pattern_keys = {}
+        for key in self.locations_dict:
+            self._pattern_keys.setdefault(key.lower(), key)
+        if not self._pattern_keys:
+            self._pattern = re.compile(r"(?!)")  # matches nothing
+            return
+        # longest first: the alternation takes the first alternative that matches
+        places = sorted(self._pattern_keys, key=len, reverse=True)
+        self._pattern = re.compile(rf"\b({'|'.join(map(re.escape, places))})\b")
+
     def __getitem__(self, key):
         return self.locations_dict.get(key)
 
     def __setitem__(self, key, value):
         self.locations_dict[key] = value
+        self._pattern = None
 
     def __contains__(self, key):
         return key in self.locations_dict
 
+    def __len__(self):
+        return len(self.locations_dict)
+
+    def __iter__(self):
+        return iter(self.locations_dict)
+
     def items(self):
         return self.locations_dict.items()
 
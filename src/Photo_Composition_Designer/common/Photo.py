@@ -1,11 +1,35 @@
+from __future__ import annotations
+
 import os
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 import exifread
+from config_cli_gui.logging import get_logger, initialize_logging
 from PIL import Image
 
+from Photo_Composition_Designer.common.Locations import Locations
+from Photo_Composition_Designer.common.PhotoScanner import PhotoScanner
+from Photo_Composition_Designer.image.ImageSource import ImageSource
+
+# files read ahead of the consumer per reader thread (see iter_photos)
+READ_AHEAD_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class PhotoMetadata:
+    """Header data of a photo, read in a single pass over the start of the file."""
+
+    date: datetime | None = None  # EXIF DateTimeOriginal
+    location: tuple[float, float] | None = None  # EXIF GPS position
+    size: tuple[int, int] | None = None  # (width, height) from the image header
+    orientation: int = 1  # EXIF orientation, 1 = upright
+
 
 class Photo:
     """
@@ -18,12 +42,51 @@ class Photo:
     )
     DATE_PATTERN_NO_TIME: re.Pattern = re.compile(r"(?:(\d{4})[-_]?(\d{2})[-_]?(\d{2}))")
 
-    def __init__(self, file_path: Path, locations=None):
+    def __init__(self, file_path: Path, locations: Locations | dict | None = None):
         self.file_path: Path = Path(file_path)
-        self._locations: dict[str, tuple[float, float]] = locations
+        self._locations: Locations | dict[str, tuple[float, float]] | None = locations
+        self._metadata: PhotoMetadata | None = None
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry, locations: Locations | dict | None = None) -> Photo:
+        """
+        Creates a Photo for a file found by a directory scan (see PhotoScanner.iter_entries).
+        The file is known to exist, so it is not checked again.
+        """
+        photo = cls.__new__(cls)
+        photo.file_path = Path(entry.path)
+        photo._locations = locations
+        photo._metadata = None
+        return photo
+
+    @property
+    def metadata(self) -> PhotoMetadata:
+        """EXIF date, GPS position, orientation and image size, read on first access."""
+        if self._metadata is None:
+            self._metadata = self.read_metadata()
+        return self._metadata
+
+    def read_metadata(self) -> PhotoMetadata:
+        """Reads the EXIF tags and the image size with one open file."""
+        with open(self.file_path, "rb") as img_file:
+            tags = exifread.process_file(img_file, details=False)
+            img_file.seek(0)
+            try:
+                with Image.open(img_file) as image:
+                    size = image.size
+            except (OSError, SyntaxError):
+                size = None
+
+        orientation = tags.get("Image Orientation")
+        return PhotoMetadata(
+            date=self._date_from_tags(tags),
+            location=self._location_from_tags(tags),
+            size=size,
+            orientation=int(orientation.values[0]) if orientation else 1,
+        )
+
     def get_location(self) -> tuple[float, float] | None:
         """
         Returns the GPS coordinates if available
@@ -33,16 +96,17 @@ class Photo:
 
     def get_location_from_exif(self) -> tuple[float, float] | None:
         """Returns the GPS coordinates from EXIF data if available."""
-        with open(self.file_path, "rb") as img_file:
-            tags = exifread.process_file(img_file, details=False)
-            if "GPS GPSLatitude" in tags and "GPS GPSLongitude" in tags:
-                lat = self._convert_to_decimal(tags["GPS GPSLatitude"].values)
-                lon = self._convert_to_decimal(tags["GPS GPSLongitude"].values)
-                if tags.get("GPS GPSLatitudeRef") and tags["GPS GPSLatitudeRef"].values[0] == "S":
-                    lat = -lat
-                if tags.get("GPS GPSLongitudeRef") and tags["GPS GPSLongitudeRef"].values[0] == "W":
-                    lon = -lon
-                return lat, lon
+        return self.metadata.location
+
+    def _location_from_tags(self, tags: dict) -> tuple[float, float] | None:
+        if "GPS GPSLatitude" in tags and "GPS GPSLongitude" in tags:
+            lat = self._convert_to_decimal(tags["GPS GPSLatitude"].values)
+            lon = self._convert_to_decimal(tags["GPS GPSLongitude"].values)
+            if tags.get("GPS GPSLatitudeRef") and tags["GPS GPSLatitudeRef"].values[0] == "S":
+                lat = -lat
+            if tags.get("GPS GPSLongitudeRef") and tags["GPS GPSLongitudeRef"].values[0] == "W":
+                lon = -lon
+            return lat, lon
         return None
 
     def get_location_from_name(self) -> tuple[float, float] | None:
@@ -50,8 +114,13 @@ class Photo:
         Extracts location from the filename based on predefined locations.
         """
         location = self._locations
-        file_name = self.file_path.name.lower()
+        if not location:
+            return None
+        if isinstance(location, Locations):
+            # one precompiled scan for all locations
+            return location.find_in_name(self.file_path.name)
 
+        file_name = self.file_path.name.lower()
         for place in location:
             if re.search(rf"\b{re.escape(place.lower())}\b", file_name):
                 return location[place]
@@ -73,6 +142,17 @@ class Photo:
             print(f"Error opening image: {e}")
             return None
 
+    def get_image_source(self) -> ImageSource | None:
+        """
+        Returns a lazy ImageSource (size from the file header, pixels decoded on demand)
+        if the file can be opened.
+        """
+        try:
+            return ImageSource(self.file_path, self.metadata.size)
+        except (OSError, SyntaxError) as e:
+            print(f"Error opening image: {e}")
+            return None
+
     @staticmethod
     def _convert_to_decimal(dms) -> float:
         """Converts degrees, minutes, and seconds to decimal degrees."""
@@ -80,14 +160,16 @@ class Photo:
 
     def _extract_date_from_exif(self) -> datetime | None:
         """Reads EXIF date, if available."""
-        with open(self.file_path, "rb") as img_file:
-            tags = exifread.process_file(img_file, details=False)
-            if "EXIF DateTimeOriginal" in tags:
-                try:
-                    date_str = str(tags["EXIF DateTimeOriginal"])
-                    return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                except ValueError:
-                    pass
+        return self.metadata.date
+
+    @staticmethod
+    def _date_from_tags(tags: dict) -> datetime | None:
+        if "EXIF DateTimeOriginal" in tags:
+            try:
+                date_str = str(tags["EXIF DateTimeOriginal"])
+                return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+            except ValueError:
+                pass
         return None
 
     def _extract_date_from_filename(self) -> datetime:
@@ -112,24 +194,93 @@ class Photo:
 
 
 def get_photos_from_dir(
-    image_folder: Path, locations: dict[str, tuple[float, float]] = None
+    image_folder: Path,
+    locations: Locations | dict[str, tuple[float, float]] | None = None,
+    max_workers: int | None = None,
+    scanner: PhotoScanner | None = None,
 ) -> list[Photo]:
     """
-    Reads all image files from a folder and returns a list of Photo objects.
+    Reads all image files from a folder (see PhotoScanner: recursion, glob patterns)
+    and returns a list of Photo objects with their metadata (see iter_photos).
     """
     folder_path = Path(image_folder)
 
     if not folder_path.is_dir():
         raise ValueError(f"Folder '{image_folder}' does not exist.")
 
-    # Collect all image files
-    image_files = [
-        os.path.join(image_folder, file)
-        for file in sorted(os.listdir(image_folder))
-        if file.lower().endswith((".png", ".jpg", ".jpeg"))
-    ]
+    scanner = scanner or PhotoScanner()
+    return list(iter_photos(scanner.iter_entries(folder_path), locations, max_workers))
+
+
+def scan_photos(
+    files: Iterable[Path | str | os.DirEntry],
+    locations: Locations | dict[str, tuple[float, float]] | None = None,
+    max_workers: int | None = None,
+    missing_ok: bool = False,
+) -> list[Photo]:
+    """Like iter_photos(), but returns all photos as a list."""
+    return list(iter_photos(files, locations, max_workers, missing_ok))
+
+
+def iter_photos(
+    files: Iterable[Path | str | os.DirEntry],
+    locations: Locations | dict[str, tuple[float, float]] | None = None,
+    max_workers: int | None = None,
+    missing_ok: bool = False,
+) -> Iterator[Photo]:
+    """
+    Yields Photo objects with their metadata (date, GPS position, orientation, size)
+    already read. The files are read concurrently: reading a file header is mostly
+    waiting for the disk or, on network shares, for the server. Only a few files per
+    thread are read ahead of the consumer, so huge libraries are streamed.
+
+    Args:
+        files: Image files, the order is kept. May be a generator (e.g.
+            PhotoScanner.iter_entries): headers are read while the scan continues.
+            Directory entries are not checked for existence again (see Photo.from_entry).
+        max_workers: Reader threads, defaults to 4 per CPU (at most 16).
+        missing_ok: Skip files that do not exist instead of raising FileNotFoundError.
+            Files that exist but cannot be read are always skipped with a warning.
+    """
+
+    def load(file: Path | str | os.DirEntry) -> Photo | None:
+        if isinstance(file, os.DirEntry):
+            photo = Photo.from_entry(file, locations)
+        else:
+            try:
+                photo = Photo(Path(file), locations)
+            except FileNotFoundError:
+                if missing_ok:
+                    return None
+                raise
+        try:
+            photo._metadata = photo.read_metadata()  # read in this thread
+        except OSError as e:
+            initialize_logging()
+            get_logger("base").warning("Skipping unreadable photo %s: %s", photo.file_path, e)
+            return None
+        return photo
+
+    workers = max_workers or min(16, (os.cpu_count() or 1) * 4)
+    if workers <= 1:
+        yield from filter(None, map(load, files))
+        return
 
-    return [Photo(Path(file), locations) for file in image_files]
+    # threads are only started as needed, small folders use few of them
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="PhotoScan")
+    pending: deque[Future[Photo | None]] = deque()
+    try:
+        for file in files:
+            pending.append(executor.submit(load, file))
+            if len(pending) > workers * READ_AHEAD_PER_WORKER:
+                if photo := pending.popleft().result():
+                    yield photo
+        while pending:
+            if photo := pending.popleft().result():
+                yield photo
+    finally:
+        # the consumer stopped early or a file failed: drop the files not started yet
+        executor.shutdown(cancel_futures=True)
 
 
 def get_photo_dates(photos: list[Photo]) -> str:
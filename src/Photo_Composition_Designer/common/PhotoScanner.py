@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".tif", ".tiff", ".webp")
+HEIF_EXTENSIONS = (".heic", ".heif")
+
+
+@lru_cache(maxsize=1)
+def supported_extensions() -> tuple[str, ...]:
+    """
+    Image file extensions PIL can open here. HEIC/HEIF photos (iPhone) are supported
+    if the optional pillow-heif plugin is installed.
+    """
+    try:
+        from pillow_heif import register_heif_opener
+    except ImportError:
+        return IMAGE_EXTENSIONS
+    register_heif_opener()
+    return IMAGE_EXTENSIONS + HEIF_EXTENSIONS
+
+
+def split_patterns(value: str) -> tuple[str, ...]:
+    """Comma separated glob patterns, e.g. "*.jpg, 2024/*"."""
+    return tuple(pattern.strip() for pattern in value.split(",") if pattern.strip())
+
+
+def _matches(patterns: tuple[str, ...], relative_path: str, name: str) -> bool:
+    return any(fnmatch(relative_path, pattern) or fnmatch(name, pattern) for pattern in patterns)
+
+
+@dataclass(frozen=True)
+class PhotoScanner:
+    """
+    Finds the photos of a folder with os.scandir, optionally in nested folders
+    (e.g. a library sorted by YYYY/MM/).
+
+    The file type of each directory entry comes from the directory listing itself, so
+    no extra stat() call is made per file. Files are yielded as a generator, folder by
+    folder in name order, so huge libraries are streamed instead of listed up front.
+
+    Glob patterns match the path relative to the scanned folder ("2024/05/*.jpg") or
+    the file name ("IMG_*"). Excluded folders are not entered. Hidden files and
+    folders (".thumbnails") are skipped.
+    """
+
+    extensions: tuple[str, ...] = field(default_factory=supported_extensions)
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    recursive: bool = False
+
+    @classmethod
+    def from_config(cls, config: ConfigParameterManager) -> PhotoScanner:
+        """Creates the PhotoScanner from a ConfigParameterManager instance."""
+        general = config.general
+        return cls(
+            include=split_patterns(general.includePatterns.value),
+            exclude=split_patterns(general.excludePatterns.value),
+            recursive=general.recursiveScan.value,
+        )
+
+    def iter_files(self, folder: Path | str) -> Iterator[Path]:
+        """Paths of the photos in the folder (and its subfolders, if recursive)."""
+        for entry in self.iter_entries(folder):
+            yield Path(entry.path)
+
+    def iter_entries(self, folder: Path | str) -> Iterator[os.DirEntry]:
+        """Like iter_files(), but yields the os.DirEntry objects."""
+        yield from self._scan(Path(folder), "")
+
+    def subfolders(self, folder: Path | str) -> list[str]:
+        """Sorted names of the (not hidden or excluded) subfolders, e.g. the week folders."""
+        try:
+            with os.scandir(folder) as entries:
+                return sorted(
+                    entry.name
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and entry.is_dir()
+                    and not _matches(self.exclude, entry.name, entry.name)
+                )
+        except OSError:
+            return []
+
+    def _scan(self, folder: Path, prefix: str) -> Iterator[os.DirEntry]:
+        try:
+            with os.scandir(folder) as iterator:
+                entries = sorted(iterator, key=lambda entry: entry.name)
+        except OSError:  # removed or not readable
+            return
+
+        subfolders = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            relative_path = prefix + entry.name
+            if self.exclude and _matches(self.exclude, relative_path, entry.name):
+                continue
+            # symlinked folders are not followed, they may point back up the tree
+            if entry.is_dir(follow_symlinks=False):
+                if self.recursive:
+                    subfolders.append(entry)
+            elif entry.name.lower().endswith(self.extensions) and entry.is_file():
+                if not self.include or _matches(self.include, relative_path, entry.name):
+                    yield entry
+
+        for entry in subfolders:
+            yield from self._scan(Path(entry.path), f"{prefix}{entry.name}/")
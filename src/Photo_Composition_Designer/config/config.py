@@ -2,7 +2,7 @@
 Central configuration management for the new project.
 
 This module provides a single source of truth for all configuration parameters
-organized in categories (GENERAL, CALENDAR, COLORS, GEO, SIZE, LAYOUT).
+organized in categories (GENERAL, CALENDAR, COLORS, GEO, SIZE, LAYOUT, DETECTOR, OUTPUT).
 It can generate config files, CLI modules, and documentation from the parameter definitions.
 """
 
@@ -48,6 +48,53 @@ class GeneralConfig(ConfigCategory):
         help="This is the title of the composition on the first page. Leave empty if not required.",
     )
 
+    assignmentManifest: ConfigParameter = ConfigParameter(
+        name="assignmentManifest",
+        value="",
+        help="Optional week assignment manifest (.json or .csv). If set, weeks are defined "
+        "by its file lists instead of week folders and no photos are copied",
+    )
+
+    recursiveScan: ConfigParameter = ConfigParameter(
+        name="recursiveScan",
+        value=False,
+        help="Also read photos from nested folders (e.g. YYYY/MM/) of the week folders "
+        "and of the photo directory when distributing photos (week folders of earlier "
+        "distributions are skipped)",
+    )
+
+    includePatterns: ConfigParameter = ConfigParameter(
+        name="includePatterns",
+        value="",
+        help="Comma separated glob patterns of the photos to use, matched against the file "
+        "name or the relative path (e.g. 'IMG_*, 2024/*'). Empty: all photos",
+    )
+
+    excludePatterns: ConfigParameter = ConfigParameter(
+        name="excludePatterns",
+        value="",
+        help="Comma separated glob patterns of photos and folders to skip (e.g. '*_edit.jpg, raw')",
+    )
+
+    watch: ConfigParameter = ConfigParameter(
+        name="watch",
+        value=False,
+        help="Keep running after rendering and re-render the weeks whose photos change",
+        is_cli=True,
+    )
+
+    watchInterval: ConfigParameter = ConfigParameter(
+        name="watchInterval",
+        value=1.0,
+        help="Watch mode: seconds between two scans of the photo directory",
+    )
+
+    watchDebounce: ConfigParameter = ConfigParameter(
+        name="watchDebounce",
+        value=2.0,
+        help="Watch mode: seconds without further changes before the changed weeks are rendered",
+    )
+
 
 class CalendarConfig(ConfigCategory):
     """CALENDAR configuration parameters."""
@@ -191,7 +238,7 @@ class SizeConfig(ConfigCategory):
     jpgQuality: ConfigParameter = ConfigParameter(
         name="jpgQuality",
         value=90,
-        help="JPG compression quality (1-100)",
+        help="JPG compression quality (1-100), also used for WebP and JPEG compressed TIFF",
     )
 
 
@@ -270,6 +317,131 @@ class LayoutConfig(ConfigCategory):
     )
 
 
+class DetectorConfig(ConfigCategory):
+    """DETECTOR configuration parameters (ONNX Runtime session of the object detection)."""
+
+    def get_category_name(self) -> str:
+        return "detector"
+
+    modelPrecision: ConfigParameter = ConfigParameter(
+        name="modelPrecision",
+        value="fp32",
+        choices=["fp32", "int8"],
+        help="Precision of the detection model. int8 uses the quantized model created by "
+        "scripts/quantize_detector.py (faster on CPU, slightly less accurate)",
+    )
+
+    intraOpThreads: ConfigParameter = ConfigParameter(
+        name="intraOpThreads",
+        value=0,
+        help="Threads used within one operator of the detection model. 0 = automatic "
+        "(all cores, or cores divided by the number of parallel workers)",
+    )
+
+    interOpThreads: ConfigParameter = ConfigParameter(
+        name="interOpThreads",
+        value=0,
+        help="Threads used to run independent operators concurrently. 0 = automatic "
+        "(1 when running with parallel workers)",
+    )
+
+    executionMode: ConfigParameter = ConfigParameter(
+        name="executionMode",
+        value="sequential",
+        choices=["sequential", "parallel"],
+        help="ONNX Runtime execution mode of the operators",
+    )
+
+    graphOptimization: ConfigParameter = ConfigParameter(
+        name="graphOptimization",
+        value="all",
+        choices=["disabled", "basic", "extended", "all"],
+        help="ONNX Runtime graph optimization level",
+    )
+
+    optimizedModelPath: ConfigParameter = ConfigParameter(
+        name="optimizedModelPath",
+        value="",
+        help="Optional file to cache the optimized detection model. Reused as long as it is "
+        "newer than the model; delete it after changing graphOptimization or the machine",
+    )
+
+
+class OutputConfig(ConfigCategory):
+    """OUTPUT configuration parameters (file format and encoder options of the pages)."""
+
+    def get_category_name(self) -> str:
+        return "output"
+
+    outputFormat: ConfigParameter = ConfigParameter(
+        name="outputFormat",
+        value="jpg",
+        choices=["jpg", "webp", "png", "tiff"],
+        help="File format of the generated collages. png and tiff are lossless (print), "
+        "webp and optimized progressive jpg give smaller files (web)",
+        is_cli=True,
+    )
+
+    jpgSubsampling: ConfigParameter = ConfigParameter(
+        name="jpgSubsampling",
+        value="4:2:0",
+        choices=["4:4:4", "4:2:2", "4:2:0"],
+        help="JPG chroma subsampling. 4:4:4 keeps fine colored details (text), "
+        "4:2:0 gives the smallest files",
+    )
+
+    jpgProgressive: ConfigParameter = ConfigParameter(
+        name="jpgProgressive",
+        value=False,
+        help="Write progressive JPG files (load gradually in web browsers)",
+    )
+
+    jpgOptimize: ConfigParameter = ConfigParameter(
+        name="jpgOptimize",
+        value=False,
+        help="Optimize the JPG Huffman tables (smaller files, slower encoding)",
+    )
+
+    webpLossless: ConfigParameter = ConfigParameter(
+        name="webpLossless",
+        value=False,
+        help="Write lossless WebP files instead of lossy ones (jpgQuality)",
+    )
+
+    webpMethod: ConfigParameter = ConfigParameter(
+        name="webpMethod",
+        value=4,
+        help="WebP encoder effort (0 = fast, 6 = smallest files)",
+    )
+
+    pngCompressLevel: ConfigParameter = ConfigParameter(
+        name="pngCompressLevel",
+        value=6,
+        help="PNG compression level (0 = none/fast, 9 = smallest files/slow)",
+    )
+
+    tiffCompression: ConfigParameter = ConfigParameter(
+        name="tiffCompression",
+        value="tiff_lzw",
+        choices=["raw", "tiff_lzw", "tiff_adobe_deflate", "jpeg"],
+        help="TIFF compression (raw = uncompressed, jpeg uses jpgQuality)",
+    )
+
+    extraResolutions: ConfigParameter = ConfigParameter(
+        name="extraResolutions",
+        value="",
+        help="Additional smaller page sizes from the same render as name:dpi pairs, "
+        "e.g. web:96,thumb:24. Written to a subfolder per name of the collages folder",
+    )
+
+    iccProfile: ConfigParameter = ConfigParameter(
+        name="iccProfile",
+        value="",
+        help="ICC color profile embedded in the collages: empty for none, sRGB for the "
+        "built-in sRGB profile, or the path to an .icc file (e.g. of the print shop)",
+    )
+
+
 class ConfigParameterManager(ConfigManager):
     """Main configuration manager that handles all parameter categories."""
 
@@ -279,8 +451,12 @@ class ConfigParameterManager(ConfigManager):
     geo: GeoConfig
     size: SizeConfig
     layout: LayoutConfig
+    detector: DetectorConfig
+    output: OutputConfig
 
     def __init__(self, config_file: str | None = None, **kwargs):
+        # directory of the loaded config file, relative path parameters refer to it
+        self.config_dir: Path | None = None
         categories = (
             GeneralConfig(),
             CalendarConfig(),
@@ -288,9 +464,28 @@ class ConfigParameterManager(ConfigManager):
             GeoConfig(),
             SizeConfig(),
             LayoutConfig(),
+            DetectorConfig(),
+            OutputConfig(),
         )
         super().__init__(categories, config_file, **kwargs)
 
+    def load_from_file(self, config_file: str, persist_last_used: bool = True) -> None:
+        super().load_from_file(config_file, persist_last_used=persist_last_used)
+        self.config_dir = Path(config_file).expanduser().resolve().parent
+
+    def resolve_path(self, value: Path | str) -> Path:
+        """
+        Resolves a path parameter: absolute paths as they are, relative paths against
+        the directory of the loaded config file if they exist there, otherwise against
+        the working directory.
+        """
+        path = Path(value).expanduser()
+        if not path.is_absolute() and self.config_dir is not None:
+            candidate = self.config_dir / path
+            if candidate.exists():
+                return candidate.resolve()
+        return path.resolve()
+
     @staticmethod
     def get_app_name():
         return "photo-composition-designer"
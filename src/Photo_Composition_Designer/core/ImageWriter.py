@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import Logger
+from pathlib import Path
+
+from config_cli_gui.logging import get_logger, initialize_logging
+from PIL import Image
+
+
+class ImageWriter:
+    """
+    Writes finished pages in background threads while the next page is rendered.
+
+    PIL releases the GIL while encoding, so the encoding of page N overlaps with the
+    rendering of page N+1. The number of pages in flight (queued or being encoded) is
+    bounded: submit() blocks when the limit is reached, so a fast renderer can not
+    pile up finished pages in memory.
+
+        with ImageWriter() as writer:
+            for page, path in pages:
+                writer.submit(page, path, quality=90)
+        # all pages are written here, encoding errors are raised
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        logger: Logger | None = None,
+    ):
+        """
+        Args:
+            max_workers: Encoder threads. Defaults to 2 (limited by the CPU count).
+            max_pending: Maximum number of pages held by the writer. Defaults to
+                max_workers + 1, so one page can wait while the others are encoded.
+        """
+        if logger:
+            self.logger: Logger = logger
+        else:
+            initialize_logging()
+            self.logger: Logger = get_logger("base")
+
+        self.max_workers = max_workers or min(2, os.cpu_count() or 1)
+        self.max_pending = max_pending or self.max_workers + 1
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="ImageWriter")
+        self._futures: list[Future] = []
+
+    def submit(self, image: Image.Image, path: Path | str, **save_kwargs) -> Future:
+        """
+        Queues the image for saving (PIL save arguments as keywords). Blocks while the
+        writer holds max_pending pages. The image must not be modified afterwards.
+        """
+        self._raise_errors()
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._save, image, Path(path), save_kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._futures.append(future)
+        return future
+
+    def wait(self) -> None:
+        """Waits until all queued pages are written; raises the first encoding error."""
+        for future in self._futures:
+            future.exception()
+        self._raise_errors()
+
+    def close(self) -> None:
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _save(self, image: Image.Image, path: Path, save_kwargs: dict) -> Path:
+        try:
+            image.save(path, **save_kwargs)
+            self.logger.info(f"Composition saved: {path}")
+            return path
+        finally:
+            self._slots.release()
+
+    def _raise_errors(self) -> None:
+        """Forgets finished pages and re-raises the first failure."""
+        done = [future for future in self._futures if future.done()]
+        self._futures = [future for future in self._futures if not future.done()]
+        for future in done:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
+
+    def __enter__(self) -> ImageWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # do not hide the original error behind an encoding error
+            self._executor.shutdown(wait=True)
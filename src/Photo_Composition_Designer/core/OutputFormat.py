@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+
+@dataclass(frozen=True)
+class OutputFormat:
+    """
+    File format and encoder options of the generated pages.
+
+    - jpg: baseline or progressive JPEG, chroma subsampling and Huffman optimization
+    - webp: lossy (quality) or lossless, encoder effort (method 0-6)
+    - png: lossless, zlib compression level (0-9)
+    - tiff: uncompressed, LZW, Deflate or JPEG compression, for print shops
+
+    All formats can embed an ICC profile (the built-in sRGB profile or an .icc file).
+    The encoder options are stored as sorted (key, value) pairs, so instances are
+    immutable and hashable; a dict passed as options is converted.
+    """
+
+    name: str = "jpg"
+    options: tuple[tuple[str, object], ...] = ()
+
+    FORMATS = {
+        "jpg": ("JPEG", ".jpg"),
+        "webp": ("WEBP", ".webp"),
+        "png": ("PNG", ".png"),
+        "tiff": ("TIFF", ".tif"),
+    }
+
+    def __post_init__(self):
+        if self.name not in self.FORMATS:
+            raise ValueError(f"Unknown output format: {self.name}")
+        options = self.options.items() if isinstance(self.options, dict) else self.options
+        object.__setattr__(self, "options", tuple(sorted(options)))
+
+    @classmethod
+    def from_config(cls, config: ConfigParameterManager) -> OutputFormat:
+        """Creates the OutputFormat from a ConfigParameterManager instance."""
+        output = config.output
+        name = output.outputFormat.value
+        quality = int(config.size.jpgQuality.value)
+
+        if name == "jpg":
+            options = {
+                "quality": quality,
+                "subsampling": output.jpgSubsampling.value,
+                "progressive": output.jpgProgressive.value,
+                "optimize": output.jpgOptimize.value,
+            }
+        elif name == "webp":
+            options = {
+                "quality": quality,
+                "lossless": output.webpLossless.value,
+                "method": int(output.webpMethod.value),
+            }
+        elif name == "png":
+            options = {"compress_level": int(output.pngCompressLevel.value)}
+        else:
+            options = {"compression": output.tiffCompression.value}
+            if options["compression"] == "jpeg":
+                options["quality"] = quality
+
+        icc_profile = load_icc_profile(output.iccProfile.value)
+        if icc_profile:
+            options["icc_profile"] = icc_profile
+        return cls(name, options)
+
+    @property
+    def pil_format(self) -> str:
+        return self.FORMATS[self.name][0]
+
+    @property
+    def extension(self) -> str:
+        return self.FORMATS[self.name][1]
+
+    def save_options(self, dpi: int | None = None) -> dict:
+        """Keyword arguments for PIL's Image.save(), a new dict on every call."""
+        options = {"format": self.pil_format, **dict(self.options)}
+        if dpi:
+            options["dpi"] = (dpi, dpi)
+        return options
+
+    def save(self, image: Image.Image, path: Path | str, dpi: int | None = None) -> None:
+        image.save(path, **self.save_options(dpi))
+
+
+@dataclass(frozen=True)
+class OutputResolution:
+    """
+    An additional, smaller version of every page (e.g. for a web gallery), downscaled
+    from the rendered page and written to its own subfolder of the output directory.
+    """
+
+    name: str
+    dpi: int
+
+    @classmethod
+    def parse_list(cls, value: str) -> list[OutputResolution]:
+        """Parses comma separated name:dpi pairs, e.g. "web:96, thumb:24"."""
+        resolutions = []
+        for item in filter(None, (part.strip() for part in value.split(","))):
+            name, separator, dpi = item.partition(":")
+            name = name.strip()
+            if not separator or not name or not dpi.strip().isdigit() or int(dpi) <= 0:
+                raise ValueError(f"Invalid output resolution '{item}', expected name:dpi")
+            # the name is the subfolder of the output directory
+            if "/" in name or "\\" in name or ".." in name or name == ".":
+                raise ValueError(f"Invalid output resolution name '{name}', expected a folder name")
+            if any(resolution.name == name for resolution in resolutions):
+                raise ValueError(f"Duplicate output resolution name '{name}'")
+            resolutions.append(cls(name, int(dpi)))
+        return resolutions
+
+    def scaled_size(self, size: tuple[int, int], dpi: int) -> tuple[int, int]:
+        """Pixel size of a page of the given size and dpi at this resolution."""
+        return (
+            max(1, round(size[0] * self.dpi / dpi)),
+            max(1, round(size[1] * self.dpi / dpi)),
+        )
+
+
+@lru_cache(maxsize=8)
+def load_icc_profile(profile: str) -> bytes | None:
+    """
+    Returns the ICC profile to embed: None for "", the built-in sRGB profile for
+    "sRGB", otherwise the content of the given .icc file.
+    """
+    if not profile:
+        return None
+    if profile.lower() == "srgb":
+        from PIL import ImageCms
+
+        return ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+    return Path(profile).expanduser().read_bytes()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from logging import Logger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config_cli_gui.logging import get_logger, initialize_logging
+
+from Photo_Composition_Designer.common.AssignmentManifest import AssignmentManifest
+
+if TYPE_CHECKING:
+    from Photo_Composition_Designer.common.PhotoScanner import PhotoScanner
+    from Photo_Composition_Designer.core.base import CompositionDesigner
+
+# key of the files shared by all weeks (descriptions.txt, assignment manifest)
+SOURCES = ""
+
+
+def _file_state(path: Path | str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _folder_state(folder: Path, scanner: PhotoScanner | None = None) -> tuple:
+    """
+    (path, mtime, size) of the description files in a folder and, with a scanner, of
+    the photos it finds there. Editor backups, thumbnails etc. are ignored.
+    """
+    files = []
+    try:
+        with os.scandir(folder) as listing:
+            entries = [
+                entry
+                for entry in listing
+                if entry.name.lower().endswith(".txt") and entry.is_file()
+            ]
+        if scanner is not None:
+            entries += scanner.iter_entries(folder)
+        for entry in entries:
+            stat = entry.stat()
+            files.append((os.path.relpath(entry.path, folder), stat.st_mtime_ns, stat.st_size))
+    except OSError:  # removed while scanning, the next scan sees the final state
+        return ()
+    return tuple(sorted(files))
+
+
+class PhotoWatcher:
+    """
+    Watches the photo directory and re-renders only the weeks whose photos changed.
+
+    The directory is scanned every `interval` seconds, or, if the optional `watchdog`
+    package is installed, whenever the file system reports a change (inotify, FSEvents,
+    ReadDirectoryChangesW). A burst of changes (e.g. copying a whole folder) is
+    rendered once, after no further change was seen for `debounce` seconds.
+
+    The designer instance is kept between the renders, so the detection model, the
+    detection cache, fonts and map data stay loaded. The PDF is regenerated once
+    after every render, not per week.
+    """
+
+    def __init__(
+        self,
+        designer: CompositionDesigner,
+        interval: float = 1.0,
+        debounce: float = 2.0,
+        logger: Logger | None = None,
+    ):
+        if logger:
+            self.logger: Logger = logger
+        else:
+            initialize_logging()
+            self.logger: Logger = get_logger("base")
+
+        self.designer = designer
+        self.interval = max(0.05, float(interval))
+        self.debounce = max(0.0, float(debounce))
+        self._stop = threading.Event()
+        self._changed = threading.Event()
+        self._observer = None
+        self._state = self.snapshot()
+
+    @classmethod
+    def from_config(
+        cls, designer: CompositionDesigner, logger: Logger | None = None
+    ) -> PhotoWatcher:
+        """Creates the PhotoWatcher from the designer's ConfigParameterManager."""
+        general = designer.config.general
+        return cls(
+            designer,
+            interval=general.watchInterval.value,
+            debounce=general.watchDebounce.value,
+            logger=logger or designer.logger,
+        )
+
+    def snapshot(self) -> dict[str, tuple]:
+        """State of the shared source files and of every week, in rendering order."""
+        designer = self.designer
+        sources = [_folder_state(designer.photoDir)]
+        if designer.manifest_path is not None:
+            sources.append(_file_state(designer.manifest_path))
+        state: dict[str, tuple] = {SOURCES: tuple(sources)}
+
+        if designer.manifest is not None:
+            for week in designer.manifest:
+                files = tuple((str(file), _file_state(file)) for file in week.files)
+                state[week.name] = (files, week.description)
+        else:
+            for name in designer.get_week_names():
+                state[name] = _folder_state(designer.photoDir / name, designer.scanner)
+        return state
+
+    def changed_weeks(self, old: dict[str, tuple], new: dict[str, tuple]) -> list[str]:
+        """
+        Weeks of the new state that have to be rendered: weeks with changed files and
+        weeks that moved (their dates depend on the position). All weeks if a shared
+        source file changed.
+        """
+        old_weeks = [name for name in old if name != SOURCES]
+        new_weeks = [name for name in new if name != SOURCES]
+        if old.get(SOURCES) != new.get(SOURCES):
+            return new_weeks
+        return [
+            name
+            for index, name in enumerate(new_weeks)
+            if old.get(name) != new[name] or index >= len(old_weeks) or old_weeks[index] != name
+        ]
+
+    def update(self) -> list[str]:
+        """
+        Renders the weeks that changed since the last update and removes the pages
+        of weeks that no longer exist or have no photos. Returns the rendered weeks.
+        """
+        state = self.snapshot()
+        if state == self._state:
+            return []
+        old, self._state = self._state, state
+        designer = self.designer
+
+        if old.get(SOURCES) != state.get(SOURCES):
+            self._reload_sources()
+            # the manifest may define other weeks now
+            state = self._state = self.snapshot()
+
+        changed = self.changed_weeks(old, state)
+        self.logger.info(f"Changes detected, rendering: {', '.join(changed) or '-'}")
+        rendered = designer.generate_compositions_from_folders(changed, pdf=False)
+
+        removed = [name for name in old if name != SOURCES and name not in state]
+        for name in removed + [name for name in changed if name not in rendered]:
+            for path in designer.output_files(name):
+                if path.exists():
+                    path.unlink()
+                    self.logger.info(f"Removed outdated page: {path}")
+
+        # the PDF contains all pages, it is regenerated once after all weeks
+        if designer.config.layout.generatePdf.value:
+            designer.generate_pdf(designer.outputDir)
+        return rendered
+
+    def run(self) -> None:
+        """Watches until stop() is called (or KeyboardInterrupt)."""
+        self._stop.clear()
+        self._start_observer()
+        self.logger.info(
+            f"Watching {self.designer.photoDir} for changes "
+            f"({'file system events' if self._observer else f'polling every {self.interval}s'})"
+        )
+        try:
+            while not self._stop.is_set():
+                # without file system events the directory is polled
+                self._wait(60.0 if self._observer else self.interval)
+                if self._stop.is_set():
+                    break
+                if self.snapshot() != self._state:
+                    self._wait_until_quiet()
+                    if not self._stop.is_set():
+                        try:
+                            self.update()
+                        except Exception as exc:  # keep watching, e.g. a half-copied photo
+                            self.logger.error(f"Rendering failed: {exc}")
+                            self.logger.debug("Full traceback:", exc_info=True)
+        finally:
+            self._stop_observer()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._changed.set()
+
+    def _wait(self, timeout: float) -> None:
+        self._changed.wait(timeout)
+        self._changed.clear()
+
+    def _wait_until_quiet(self) -> None:
+        """Waits until the directory did not change for `debounce` seconds."""
+        state = self.snapshot()
+        quiet_since = time.monotonic()
+        while not self._stop.is_set():
+            remaining = self.debounce - (time.monotonic() - quiet_since)
+            if remaining <= 0:
+                return
+            self._wait(min(self.interval, remaining))
+            current = self.snapshot()
+            if current != state:
+                state, quiet_since = current, time.monotonic()
+
+    def _reload_sources(self) -> None:
+        designer = self.designer
+        designer.descriptions = designer._get_description(designer.photoDir)
+        if designer.manifest_path is not None and designer.manifest_path.exists():
+            try:
+                designer.manifest = AssignmentManifest.load(designer.manifest_path)
+            except (OSError, ValueError, KeyError) as exc:
+                self.logger.warning(f"Assignment manifest could not be reloaded: {exc}")
+
+    def _start_observer(self) -> None:
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return
+
+        changed = self._changed
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                changed.set()
+
+        observer = Observer()
+        observer.schedule(Handler(), str(self.designer.photoDir), recursive=True)
+        if self.designer.manifest_path is not None:
+            observer.schedule(Handler(), str(self.designer.manifest_path.parent))
+        try:
+            observer.start()
+        except OSError as exc:  # e.g. inotify watch limit reached
+            self.logger.warning(f"File system events not available, polling instead ({exc})")
+            return
+        self._observer = observer
+
+    def _stop_observer(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
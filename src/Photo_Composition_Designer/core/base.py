@@ -1,28 +1,39 @@
 # Photo_Composition_Designer/core/base.py
 from __future__ import annotations
 
+import dataclasses
 import os
 import re
-from datetime import timedelta
+import shutil
+from datetime import datetime, timedelta
 from logging import Logger
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from config_cli_gui.logging import get_logger, initialize_logging
 from PIL import Image, ImageDraw
 
+from Photo_Composition_Designer.common.AssignmentManifest import AssignmentManifest
 from Photo_Composition_Designer.common.Locations import Locations
 from Photo_Composition_Designer.common.Photo import (
     Photo,
     get_photo_dates,
     get_photos_from_dir,
+    scan_photos,
 )
+from Photo_Composition_Designer.common.PhotoScanner import PhotoScanner
 from Photo_Composition_Designer.config.config import ConfigParameterManager
-from Photo_Composition_Designer.image.CalendarRenderer import CalendarRenderer
+from Photo_Composition_Designer.core.ImageWriter import ImageWriter
+from Photo_Composition_Designer.core.OutputFormat import OutputFormat, OutputResolution
 from Photo_Composition_Designer.image.CollageRenderer import CollageRenderer
 from Photo_Composition_Designer.image.DescriptionRenderer import DescriptionRenderer
 from Photo_Composition_Designer.image.MapRenderer import MapRenderer
 from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector  # Import ObjectDetector
-from Photo_Composition_Designer.tools.Helpers import mm_to_px
+from Photo_Composition_Designer.tools.Helpers import get_image_font, mm_to_px
+
+if TYPE_CHECKING:
+    from Photo_Composition_Designer.image.CalendarRenderer import CalendarRenderer
+    from Photo_Composition_Designer.image.DetectorService import RemoteObjectDetector
 
 
 class CompositionDesigner:
@@ -34,7 +45,13 @@ class CompositionDesigner:
     - Accesses parameters through config.<category>.<param>.value
     """
 
-    def __init__(self, config: ConfigParameterManager | None, logger: Logger = None):
+    def __init__(
+        self,
+        config: ConfigParameterManager | None,
+        logger: Logger = None,
+        object_detector: ObjectDetector | RemoteObjectDetector | None = None,
+        workers: int = 1,
+    ):
         self.config = config or ConfigParameterManager()
         if logger:
             self.logger: Logger = logger
@@ -44,23 +61,47 @@ class CompositionDesigner:
 
         self.dpi: int = int(self.config.size.dpi.value)
         # load locations config path and create Locations instance
-        locations_cfg_path = Path(self.config.general.locationsConfig.value)
-        self.locations = Locations(locations_cfg_path).locations_dict
+        locations_cfg_path = self.config.resolve_path(self.config.general.locationsConfig.value)
+        self.locations = Locations(locations_cfg_path)
+        self.scanner: PhotoScanner = PhotoScanner.from_config(self.config)
 
         # mm-based -> pixel helper bound to this instance
         self._mm_to_px = lambda mm: mm_to_px(mm, self.dpi)
 
         # basic properties
         self.compositionTitle: str | None = self.config.general.compositionTitle.value or ""
-        self.photoDir: Path = Path(self.config.general.photoDirectory.value).expanduser().resolve()
+        self.photoDir: Path = self.config.resolve_path(self.config.general.photoDirectory.value)
         self.outputDir: Path = (self.photoDir.parent / "collages").resolve()
+        self.output_format: OutputFormat = OutputFormat.from_config(self.config)
+        self.output_resolutions: list[OutputResolution] = []
+        for resolution in OutputResolution.parse_list(self.config.output.extraResolutions.value):
+            if resolution.dpi < self.dpi:
+                self.output_resolutions.append(resolution)
+            else:
+                self.logger.warning(
+                    f"Output resolution {resolution.name} ({resolution.dpi} dpi) is not "
+                    f"smaller than the page ({self.dpi} dpi), skipped."
+                )
         os.makedirs(self.outputDir, exist_ok=True)
         self.descriptions = self._get_description(self.photoDir)
 
+        # optional assignment manifest: virtual week folders instead of photo subfolders
+        self.manifest: AssignmentManifest | None = None
+        self.manifest_path: Path | None = None
+        manifest_cfg = self.config.general.assignmentManifest.value
+        if manifest_cfg:
+            manifest_path = self.config.resolve_path(manifest_cfg)
+            if manifest_path.exists():
+                self.manifest = AssignmentManifest.load(manifest_path)
+                self.manifest_path = manifest_path
+                self.logger.info(f"Using assignment manifest: {manifest_path}")
+            else:
+                self.logger.info(f"Assignment manifest {manifest_path} not found, using folders.")
+
         # size in pixels
         self.width_px = self._mm_to_px(self.config.size.width.value)
         self.height_px = self._mm_to_px(self.config.size.height.value)
-        self.use_object_recognition = self.config.layout.objectRecognition
+        self.use_object_recognition = self.config.layout.objectRecognition.value
 
         # margins / spacing in pixels
         self.margin_top_px = self._mm_to_px(self.config.layout.marginTop.value)
@@ -72,14 +113,23 @@ class CompositionDesigner:
         self.calendar_height_px = self._mm_to_px(self.config.size.calendarHeight.value)
 
         # colors (Color objects have .to_pil() in your calendar factory)
-        # Use the calendar factory which expects the full config object
+        # Use the calendar factory which expects the full config object. Imported here:
+        # holidays, babel and astral are slow to import and not needed for --help
+        from Photo_Composition_Designer.image.CalendarRenderer import CalendarRenderer
+
         self.calendarObj: CalendarRenderer = CalendarRenderer.from_config(self.config)
 
         # colors
         background_color = self.config.style.backgroundColor.value.to_pil()
 
-        # Create ObjectDetector instance once
-        self.object_detector = ObjectDetector() if self.use_object_recognition else None
+        # Create ObjectDetector instance once, or use the given (e.g. shared service) detector
+        if not self.use_object_recognition:
+            self.object_detector = None
+        elif object_detector is not None:
+            self.object_detector = object_detector
+        else:
+            # with parallel worker processes, automatic thread counts share the cores
+            self.object_detector = ObjectDetector.from_config(self.config, workers)
 
         # Create other helpers/generators — pass config object for them to pull values from.
         self.mapGenerator: MapRenderer = MapRenderer.from_config(self.config)
@@ -193,7 +243,9 @@ class CompositionDesigner:
         background_color = self.config.style.backgroundColor.value.to_pil()
         text_color2 = self.config.style.fontSmall.value.color.to_pil()
 
-        composition = Image.new("RGBA", (self.width_px, self.height_px), (*background_color, 255))
+        # The page is composed in RGB: the collage is rendered directly into it and
+        # RGBA elements are pasted with their alpha channel as mask
+        composition = Image.new("RGB", (self.width_px, self.height_px), background_color)
         available_cal_width = self.width_px
 
         # Process photo description for tags
@@ -260,21 +312,24 @@ class CompositionDesigner:
             else:
                 # If no calendar, description goes above the bottom margin
                 y = self.height_px - desc_h - self.margin_bottom_px
-            composition.alpha_composite(description_img, (x, y))
+            composition.paste(description_img, (x, y), description_img)
 
         if len(photos) == 0:
             self.logger.info("No pictures found.")
             return composition
 
         # Arrange image composition
-        collage = self.layoutManager.generate([photo.get_image() for photo in photos])
-        composition.paste(collage, (self.margin_sides_px, self.margin_top_px))
+        self.layoutManager.generate(
+            [photo.get_image_source() for photo in photos],
+            canvas=composition,
+            offset=(self.margin_sides_px, self.margin_top_px),
+        )
 
         if not is_title and not no_calendar_flag:
             # draw the image dates in
             date_str = get_photo_dates(photos)
             draw = ImageDraw.Draw(composition)
-            font = self.config.style.fontAnniversaries.value.get_image_font(self.dpi)
+            font = get_image_font(self.config.style.fontAnniversaries.value, self.dpi)
 
             # Anchor rd expects coordinates relative to lower-right;
             # to put text inside margins we shift left/up
@@ -282,7 +337,7 @@ class CompositionDesigner:
             y = self.height_px - self.margin_bottom_px
             draw.text((x, y), date_str, font=font, fill=text_color2, anchor="rd")
 
-        return composition.convert("RGB")
+        return composition
 
     @staticmethod
     def _get_description(folder_path: Path) -> list[str]:
@@ -307,41 +362,111 @@ class CompositionDesigner:
                 photo_description = [text_file.stem]
         return photo_description
 
+    def get_week_names(self) -> list[str]:
+        """
+        Returns the names of all weeks in rendering order: the week names of the
+        assignment manifest if one is configured, otherwise the sorted photo subfolders.
+        """
+        if self.manifest is not None:
+            return self.manifest.week_names()
+        return self.scanner.subfolders(self.photoDir)
+
+    def get_photos_to_distribute(self) -> list[Photo]:
+        """
+        Reads the photos of the photo directory that are distributed to the weeks.
+        Week folders of earlier distributions (named like week_name()) are skipped,
+        also when nested folders are scanned, so their copies are not distributed again.
+        """
+        scanner = self.scanner
+        if scanner.recursive:
+            week_folders = [
+                name
+                for name in scanner.subfolders(self.photoDir)
+                if AssignmentManifest.WEEK_NAME_RE.match(name)
+            ]
+            for name in week_folders:
+                self.logger.info(f"Skipping week folder {self.photoDir / name}")
+            scanner = dataclasses.replace(scanner, exclude=scanner.exclude + tuple(week_folders))
+        return get_photos_from_dir(self.photoDir, self.locations, scanner=scanner)
+
+    def copy_to_week_folders(
+        self, grouped_photos: list[list[Photo]], start_date: datetime, weeks_count: int
+    ) -> list[Path]:
+        """
+        Copies each group of photos into its week folder of the photo directory and
+        returns the week folders. Weeks without a group get an empty folder.
+        """
+        folders = []
+        for week in range(weeks_count):
+            folder_name = AssignmentManifest.week_name(week, start_date)
+            folder_path = self.photoDir / folder_name
+            folder_path.mkdir(parents=True, exist_ok=True)
+            self.logger.info(f"Folder created: {folder_path}")
+            folders.append(folder_path)
+
+            for photo in grouped_photos[week] if week < len(grouped_photos) else []:
+                shutil.copy2(photo.file_path, folder_path / photo.file_path.name)
+                self.logger.info(f"  --> Image {photo.file_path.name} sorted into {folder_name}")
+        return folders
+
+    def _get_photos_from_files(self, files: list[Path]) -> list[Photo]:
+        photos = scan_photos(files, self.locations, missing_ok=True)
+        found = {photo.file_path for photo in photos}
+        for file in files:
+            if Path(file) not in found:
+                self.logger.warning(f"Photo {file} from assignment manifest not found, skipping.")
+        return photos
+
     def generate_compositions_from_folder(
         self,
         folder_name: str,
     ) -> Image.Image | None:
         """
-        Generates a single collage for the given folder name.
-        Returns True if a composition was generated, False if skipped.
+        Generates a single collage for the given folder name
+        (or week name, if an assignment manifest is used).
+        Returns the composition or None if skipped.
         """
-        folder_path = self.photoDir / folder_name
-
-        if not folder_path.is_dir():
-            self.logger.info(f"{folder_path} is not a valid directory. Skipping...")
-            return None
-
-        # Extract photos
-        photos = get_photos_from_dir(folder_path, self.locations)
-        if not photos:
-            self.logger.info(f"No images found in {folder_path}, skipping...")
-            return None
+        if self.manifest is not None:
+            week = self.manifest.get(folder_name)
+            if week is None:
+                self.logger.info(f"Week '{folder_name}' not found in assignment manifest.")
+                return None
+
+            photos = self._get_photos_from_files(week.files)
+            if not photos:
+                self.logger.info(f"No images assigned to week {folder_name}, skipping...")
+                return None
+
+            week_index = self.manifest.index(folder_name)
+            folder_description = week.description
+        else:
+            folder_path = self.photoDir / folder_name
+
+            if not folder_path.is_dir():
+                self.logger.info(f"{folder_path} is not a valid directory. Skipping...")
+                return None
+
+            # Extract photos
+            photos = get_photos_from_dir(folder_path, self.locations, scanner=self.scanner)
+            if not photos:
+                self.logger.info(f"No images found in {folder_path}, skipping...")
+                return None
+
+            # Week index must be inferred from folder ordering
+            try:
+                week_index = self.get_week_names().index(folder_name)
+            except ValueError:
+                self.logger.info(
+                    f"Folder '{folder_name}' not found in photoDirectory (unexpected)."
+                )
+                return None
+            folder_description = self._get_description(folder_path)[0]
 
         # Determine description (folder-level overrides global)
-        # Week index must be inferred from folder ordering
-        sorted_folders = sorted(
-            [f for f in os.listdir(self.photoDir) if (self.photoDir / f).is_dir()]
-        )
-        try:
-            week_index = sorted_folders.index(folder_name)
-        except ValueError:
-            self.logger.info(f"Folder '{folder_name}' not found in photoDirectory (unexpected).")
-            return None
-
         global_description = (
             self.descriptions[week_index] if week_index < len(self.descriptions) else ""
         )
-        collage_description: str = self._get_description(folder_path)[0] or global_description
+        collage_description: str = folder_description or global_description
 
         start_date = self.startDate + timedelta(weeks=week_index)
 
@@ -351,10 +476,16 @@ class CompositionDesigner:
 
         return composition
 
-    def generate_compositions_from_folders(self):
-        sorted_folders = sorted(
-            [f for f in os.listdir(self.photoDir) if (self.photoDir / f).is_dir()]
-        )
+    def generate_compositions_from_folders(
+        self, folder_names: list[str] | None = None, pdf: bool = True
+    ) -> list[str]:
+        """
+        Generates the compositions of the given folders (or week names), of all weeks
+        if None, and (if pdf and generatePdf are set) the PDF of all pages in the
+        output directory. Returns the names of the weeks that were rendered.
+        """
+        sorted_folders = self.get_week_names() if folder_names is None else folder_names
+        rendered = []
 
         total = len(sorted_folders)
 
@@ -362,28 +493,57 @@ class CompositionDesigner:
         if hasattr(self, "progress_callback"):
             self.progress_callback(0, total)
 
-        for idx, folder_name in enumerate(sorted_folders, start=1):
-            self.logger.info(f"Processing folder: {folder_name}")
+        # pages are encoded in background threads while the next folder is rendered
+        with ImageWriter(logger=self.logger) as writer:
+            for idx, folder_name in enumerate(sorted_folders, start=1):
+                self.logger.info(f"Processing folder: {folder_name}")
 
-            composition = self.generate_compositions_from_folder(folder_name)
-            if composition:
-                self.save(composition, folder_name)
+                composition = self.generate_compositions_from_folder(folder_name)
+                if composition:
+                    self.save(composition, folder_name, writer)
+                    rendered.append(folder_name)
 
-            # Fortschritt melden
-            if hasattr(self, "progress_callback"):
-                self.progress_callback(idx, total)
+                # Fortschritt melden
+                if hasattr(self, "progress_callback"):
+                    self.progress_callback(idx, total)
 
-        if self.config.layout.generatePdf.value:
+        if pdf and self.config.layout.generatePdf.value:
             self.generate_pdf(self.outputDir)
+        return rendered
+
+    def output_files(self, element: str) -> list[Path]:
+        """Paths of the page and its extra resolutions written by save()."""
+        output_file_name = f"{element}{self.output_format.extension}"
+        return [self.outputDir / output_file_name] + [
+            self.outputDir / resolution.name / output_file_name
+            for resolution in self.output_resolutions
+        ]
 
-    def save(self, composition: Image.Image, element: str):
-        # save with configured quality/dpi
+    def save(self, composition: Image.Image, element: str, writer: ImageWriter | None = None):
+        # save in the configured format with its encoder options and the original dpi
         output_prefix = f"{element}"
-        output_file_name = f"{output_prefix}.jpg"
-        output_path = self.outputDir / output_file_name
-        jpg_quality = int(self.config.size.jpgQuality.value)
-        dpi_tuple = (self.dpi, self.dpi)  # Use original DPI for saving
-        composition.save(output_path, quality=jpg_quality, dpi=dpi_tuple)
+        output_file_name = f"{output_prefix}{self.output_format.extension}"
+        self._write(composition, self.outputDir / output_file_name, self.dpi, writer)
+
+        # smaller versions are downscaled from the rendered page: photo decoding,
+        # detection and layout are done only once for all resolutions
+        for resolution in self.output_resolutions:
+            output_dir = self.outputDir / resolution.name
+            output_dir.mkdir(exist_ok=True)
+            scaled = composition.resize(
+                resolution.scaled_size(composition.size, self.dpi),
+                Image.Resampling.LANCZOS,
+                reducing_gap=3.0,
+            )
+            self._write(scaled, output_dir / output_file_name, resolution.dpi, writer)
+
+    def _write(self, image: Image.Image, output_path: Path, dpi: int, writer: ImageWriter | None):
+        save_options = self.output_format.save_options(dpi)
+        if writer:
+            # asynchronous: the writer logs when the file is written
+            writer.submit(image, output_path, **save_options)
+            return
+        image.save(output_path, **save_options)
         self.logger.info(f"Composition saved: {output_path}")
 
     def generate_pdf(self, collages_dir: Path | str, output_pdf: str = "output.pdf"):
@@ -391,7 +551,7 @@ class CompositionDesigner:
         Creates a PDF file from all images in a directory.
         """
         collages_dir = Path(collages_dir)
-        image_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".gif"}
+        image_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tif", ".tiff"}
 
         image_files = sorted(
             [
@@ -9,14 +9,12 @@ run gui: python -m Photo_Composition_Designer.gui
 import copy
 import logging
 import os
-import shutil
 import subprocess
 import sys
 import threading
 import tkinter as tk
 import traceback
 import webbrowser
-from datetime import timedelta
 from functools import partial
 from pathlib import Path
 from tkinter import filedialog, font, messagebox, ttk
@@ -32,7 +30,7 @@ from config_cli_gui.logging import (
 from config_cli_gui.persistence import read_last_used_config
 from PIL import Image, ImageTk
 
-from Photo_Composition_Designer.common.Photo import Photo, get_photos_from_dir
+from Photo_Composition_Designer.common.Photo import Photo
 from Photo_Composition_Designer.config.config import ConfigParameterManager
 from Photo_Composition_Designer.core.base import CompositionDesigner
 from Photo_Composition_Designer.gui.GuiLogWriter import GuiLogWriter
@@ -49,6 +47,7 @@ class MainGui:
         ("distribute_equally", "Distribute photos equally"),
         ("distribute_randomly", "Distribute photos randomly"),
         ("distribute_group_matching_dates", "Distribute photos by date"),
+        ("distribute_optimal", "Distribute photos by date (optimal)"),
     ]
 
     composition_modes = [
@@ -115,6 +114,7 @@ class MainGui:
         self.preview_image_original = None
 
         self.photo_folders = []
+        self.week_names = []
         self.generated_compositions = []
 
         # Load initial folder list
@@ -425,7 +425,7 @@ class MainGui:
                 f"No photo folders available in directory {self.composition_designer.photoDir}"
             )
             return
-        folder_name = self.photo_folders[selection_index].name
+        folder_name = self.week_names[selection_index]
 
         # Get current dimensions of the preview_label
         w = self.preview_label.winfo_width()
@@ -476,6 +476,21 @@ class MainGui:
         # Clear previous content
         self.photo_dir_listbox.delete(0, tk.END)
         self.photo_folders = []
+        self.week_names = []
+
+        # Weeks from an assignment manifest replace the week subfolders
+        manifest = self.composition_designer.manifest
+        if manifest is not None:
+            for week in manifest:
+                # folder of the week's photos (opened on double click), they may be anywhere
+                folder = (
+                    week.files[0].parent if week.files else self.composition_designer.manifest_path
+                )
+                self.photo_folders.append(folder)
+                self.week_names.append(week.name)
+                self.photo_dir_listbox.insert(tk.END, week.name)
+            self.logger.info(f"Loaded {len(self.week_names)} weeks from assignment manifest.")
+            return
 
         if (
             not self.composition_designer.photoDir.exists()
@@ -495,6 +510,7 @@ class MainGui:
         # Populate internal list AND the listbox
         for folder in subfolders:
             self.photo_folders.append(folder)
+            self.week_names.append(folder.name)
             self.photo_dir_listbox.insert(tk.END, folder.name)
 
         self.logger.info(f"Loaded {len(self.photo_folders)} photo subfolders.")
@@ -544,8 +560,8 @@ class MainGui:
         if selection_index == -1:  # No item clicked
             return
 
-        file_path_str = file_list_source[selection_index]["path"]
-        file_path = Path(file_path_str)
+        entry = file_list_source[selection_index]
+        file_path = Path(entry["path"] if isinstance(entry, dict) else entry)
 
         if not file_path.exists():
             self.logger.error(f"File not found: {file_path}")
@@ -628,7 +644,7 @@ class MainGui:
             messagebox.showwarning("No Folders", "No photo folders available.")
             return
 
-        folder_name = self.photo_folders[selection_index].name
+        folder_name = self.week_names[selection_index]
 
         self.logger.info(f"Rendering and saving preview for folder: {folder_name}")
 
@@ -661,11 +677,9 @@ class MainGui:
                 )
                 return
 
-            # Save the image to the output folder
-            output_dir = preview_designer.outputDir
-            output_file = output_dir / f"{folder_name}.jpg"
-            preview_image.save(output_file, quality=95)
-            self.logger.info(f"Preview saved to: {output_file}")
+            # Save the image to the output folder, in the configured format, dpi and
+            # extra resolutions like a regular render
+            preview_designer.save(preview_image, folder_name)
 
         except Exception as e:
             self.logger.error(f"Error rendering preview: {e}", exc_info=True)
@@ -758,7 +772,7 @@ class MainGui:
             self.logger.info("Processing files...")
 
             # prepare image sorting:
-            photos: list[Photo] = get_photos_from_dir(self.composition_designer.photoDir)
+            photos: list[Photo] = self.composition_designer.get_photos_to_distribute()
             if not photos:
                 self.logger.warning(
                     f"No photos found in directory {self.composition_designer.photoDir}"
@@ -774,28 +788,26 @@ class MainGui:
                 grouped_images = image_distributor.distribute_randomly()
             elif mode == "distribute_group_matching_dates":
                 grouped_images = image_distributor.distribute_group_matching_dates()
+            elif mode == "distribute_optimal":
+                grouped_images = image_distributor.distribute_optimal()
             else:
                 self.logger.warning(f"Unknown mode: {mode}")
 
             start_date = self._config.calendar.startDate.value
-            output_dir = self.composition_designer.photoDir
-            for week in range(collages_to_generate):
-                week_start = start_date + timedelta(weeks=week)
-                folder_name = f"{week:02d}_{week_start.strftime('%b-%d')}"
-                folder_path = os.path.join(output_dir, folder_name)
-                os.makedirs(folder_path, exist_ok=True)
-                self.logger.info(f"Folder created: {folder_path}")
-
-                if not grouped_images:
-                    continue
-                images_in_group = grouped_images.pop(0)
-                for photo in images_in_group:
-                    image_file_name = photo.file_path.name
-                    destination_path = os.path.join(folder_path, image_file_name)
-                    shutil.copy2(photo.file_path, destination_path)
-                    self.logger.info(
-                        f"  --> Image {photo.file_path.name} sorted into {folder_name}"
-                    )
+
+            # Virtual week folders: write an assignment manifest instead of copying files
+            manifest_cfg = self._config.general.assignmentManifest.value
+            if manifest_cfg:
+                manifest = image_distributor.create_manifest(grouped_images, start_date)
+                manifest_path = manifest.save(self._config.resolve_path(manifest_cfg))
+                self.logger.info(f"Assignment manifest written: {manifest_path}")
+                self.logger.info("=== All files processed successfully! ===")
+                self._reload_config()
+                return
+
+            self.composition_designer.copy_to_week_folders(
+                grouped_images, start_date, collages_to_generate
+            )
 
             self.logger.info(f"Completed: {len(grouped_images)} files processed")
             self.logger.info("=== All files processed successfully! ===")
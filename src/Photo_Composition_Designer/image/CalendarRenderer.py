@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import calendar
+import json
 import logging
-from datetime import datetime, timedelta
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 import holidays
@@ -16,7 +20,9 @@ from PIL import Image, ImageDraw
 from Photo_Composition_Designer.common.Anniversaries import Anniversaries
 from Photo_Composition_Designer.common.MoonPhase import MoonPhase
 from Photo_Composition_Designer.config.config import ConfigParameterManager
-from Photo_Composition_Designer.tools.Helpers import mm_to_px
+from Photo_Composition_Designer.tools.Helpers import get_image_font, mm_to_px
+
+HOLIDAY_CACHE_DIR = Path(tempfile.gettempdir()) / "photo_composition_holiday_cache"
 
 
 class CalendarRenderer:
@@ -73,7 +79,7 @@ class CalendarRenderer:
         # if a file path (or string) is provided, load it via Anniversaries
         anniv_cfg = config.general.anniversariesConfig.value
         if isinstance(anniv_cfg, (str, Path)):
-            anniversaries_obj = Anniversaries(anniv_cfg)
+            anniversaries_obj = Anniversaries(config.resolve_path(anniv_cfg) if anniv_cfg else None)
         else:
             anniversaries_obj = anniv_cfg
 
@@ -115,7 +121,7 @@ class CalendarRenderer:
         draw.text(
             (0, height - self.font_holiday.size * self.dpi / 25.4),
             header_text,
-            font=self.font_large.get_image_font(self.dpi),
+            font=get_image_font(self.font_large, self.dpi),
             fill=self.font_small.color.to_pil(),
             anchor="ld",
         )
@@ -133,7 +139,7 @@ class CalendarRenderer:
         draw.text(
             (0, height),
             sun_string,
-            font=self.font_holiday.get_image_font(self.dpi),
+            font=get_image_font(self.font_holiday, self.dpi),
             fill=self.font_small.color.to_pil(),
             anchor="ld",
         )
@@ -173,7 +179,7 @@ class CalendarRenderer:
                     - self.font_large.size * self.dpi / 25.4 * 1.15,
                 ),
                 day_name,
-                font=self.font_small.get_image_font(self.dpi),
+                font=get_image_font(self.font_small, self.dpi),
                 fill=self.font_small.color.to_pil(),
                 anchor="md",
             )
@@ -181,7 +187,7 @@ class CalendarRenderer:
             draw.text(
                 (x, height - self.font_holiday.size * self.dpi / 25.4),
                 str(day_date.day),
-                font=self.font_large.get_image_font(self.dpi),
+                font=get_image_font(self.font_large, self.dpi),
                 fill=color_day,
                 anchor="md",
             )
@@ -200,7 +206,7 @@ class CalendarRenderer:
                 draw.text(
                     (x, height),
                     label,
-                    font=self.font_holiday.get_image_font(self.dpi),
+                    font=get_image_font(self.font_holiday, self.dpi),
                     fill=self.font_holiday.color.to_pil(),
                     anchor="md",
                 )
@@ -214,7 +220,7 @@ class CalendarRenderer:
         img = Image.new("RGB", (width, height), self.backgroundColor)
         draw = ImageDraw.Draw(img)
 
-        font_large_pil = self.font_large.get_image_font(self.dpi)
+        font_large_pil = get_image_font(self.font_large, self.dpi)
 
         draw.text(
             (width // 2, height - self.font_holiday.size * self.dpi / 25.4),
@@ -262,10 +268,10 @@ class CalendarRenderer:
         language: Optional locale string like 'de_DE' or 'en_US'. The function will extract
         the language code (e.g. 'de') and pass it to python-holidays so names are returned
         in the requested language when supported.
-        """
-        years = (year, year + 1)
-        combined = holidays.HolidayBase()
 
+        The merged table is cached per process and on disk (see load_holidays), so only
+        the first renderer for a country/subdivision/year/language builds it.
+        """
         # Determine language code for python-holidays (e.g., 'de' from 'de_DE')
         lang_code = None
         if language:
@@ -274,28 +280,89 @@ class CalendarRenderer:
             except Exception:
                 lang_code = language
 
-        # Load base country holidays with language if provided
-        if lang_code:
-            combined.update(holidays.country_holidays(country, years=years, language=lang_code))
-        else:
-            combined.update(holidays.country_holidays(country, years=years))
+        combined = holidays.HolidayBase()
+        combined.update(load_holidays(year, country, tuple(subdivs or ()), lang_code))
+        return combined
 
-        # Load subdivisions (if any).
-        # Handle errors per subdivision so one bad subdiv won't break all.
-        for sub in subdivs or []:
-            try:
-                if lang_code:
-                    combined.update(
-                        holidays.country_holidays(
-                            country, years=years, subdiv=sub, language=lang_code
-                        )
-                    )
-                else:
-                    combined.update(holidays.country_holidays(country, years=years, subdiv=sub))
-            except Exception as e:
-                logging.warning(f"Unable to load holiday subdivision {sub}: {e}")
 
-        return combined
+def _build_holidays(
+    year: int, country: str, subdivs: tuple[str, ...], lang_code: str | None
+) -> tuple[dict[date, str], bool]:
+    """Returns the merged table and whether every subdivision could be loaded."""
+    years = (year, year + 1)
+    combined = holidays.HolidayBase()
+
+    # Load base country holidays with language if provided
+    if lang_code:
+        combined.update(holidays.country_holidays(country, years=years, language=lang_code))
+    else:
+        combined.update(holidays.country_holidays(country, years=years))
+
+    # Load subdivisions (if any).
+    # Handle errors per subdivision so one bad subdiv won't break all.
+    complete = True
+    for sub in subdivs:
+        try:
+            if lang_code:
+                combined.update(
+                    holidays.country_holidays(country, years=years, subdiv=sub, language=lang_code)
+                )
+            else:
+                combined.update(holidays.country_holidays(country, years=years, subdiv=sub))
+        except Exception as e:
+            logging.warning(f"Unable to load holiday subdivision {sub}: {e}")
+            complete = False
+
+    return dict(combined), complete
+
+
+@lru_cache(maxsize=32)
+def load_holidays(
+    year: int, country: str, subdivs: tuple[str, ...] = (), lang_code: str | None = None
+) -> dict[date, str]:
+    """Merged holidays of the country and its subdivisions for year and year + 1.
+
+    python-holidays computes every table from its rules (about 100 ms per country and
+    subdivision). The result is kept per process and as a small JSON file in
+    HOLIDAY_CACHE_DIR, keyed by the arguments and the python-holidays version, so
+    later renderers and processes only load a dictionary. Tables with a subdivision
+    that failed to load are not written to disk. Do not modify the result.
+    """
+    name = "-".join(
+        [
+            country,
+            "_".join(subdivs) or "all",
+            str(year),
+            lang_code or "default",
+            holidays.__version__,
+        ]
+    )
+    cache_file = HOLIDAY_CACHE_DIR / f"{name}.json"
+    try:
+        with open(cache_file, encoding="utf-8") as fh:
+            return {date.fromisoformat(day): label for day, label in json.load(fh).items()}
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as exc:
+        logging.warning(f"Failed to read holiday cache {cache_file} ({exc}), rebuilding")
+
+    table, complete = _build_holidays(year, country, subdivs, lang_code)
+    if not complete:  # e.g. a transient error, retried by the next process
+        return table
+    try:
+        HOLIDAY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                {day.isoformat(): label for day, label in sorted(table.items())},
+                fh,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, cache_file)
+    except OSError as exc:  # the cache is optional
+        logging.warning(f"Failed to write holiday cache {cache_file} ({exc})")
+    return table
 
 
 # -----------------------------------------------------------------------------
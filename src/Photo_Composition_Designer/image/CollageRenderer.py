@@ -1,16 +1,24 @@
+from __future__ import annotations
+
 import math
 import os
 from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from logging import Logger
-from operator import itemgetter
+from typing import TYPE_CHECKING
 
+import numpy as np
 from config_cli_gui.logging import get_logger, initialize_logging
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFile
 
-from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector
+from Photo_Composition_Designer.image.ImageSource import ImageSource
 from Photo_Composition_Designer.image.SmartCrop import SmartCrop
 
+if TYPE_CHECKING:
+    from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector
+
 PATTERNS = [
     ["P", "L", "L", "P"],
     ["L", "P", "P", "L"],
@@ -28,7 +36,7 @@ class LayoutNode:
 
 @dataclass
 class ImageNode(LayoutNode):
-    image: Image.Image
+    image: Image.Image | ImageSource
 
 
 @dataclass
@@ -38,60 +46,109 @@ class SplitNode(LayoutNode):
     weights: list[float]
 
 
+@lru_cache(maxsize=128)
+def rounded_corner_mask(width: int, height: int, radius: int) -> Image.Image:
+    """
+    Returns an "L" mask of the given size that is 255 in the four corner areas
+    outside a rounded rectangle and 0 inside. Cached per (width, height, radius),
+    so cells of equal size share one mask. Treat the result as read-only.
+    """
+    mask = Image.new("L", (width, height), 255)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, width, height), radius=radius, fill=0)
+    return mask
+
+
 def linear_partition_table(seq, k):
-    n = len(seq)
-    table = [[0] * k for x in range(n)]
-    solution = [[0] * (k - 1) for x in range(n - 1)]
-    for i in range(n):
-        table[i][0] = seq[i] + (table[i - 1][0] if i else 0)
-    for j in range(k):
-        table[0][j] = seq[0]
-    for i in range(1, n):
-        for j in range(1, k):
-            table[i][j], solution[i - 1][j - 1] = min(
-                ((max(table[x][j - 1], table[i][0] - table[x][0]), x) for x in range(i)),
-                key=itemgetter(0),
-            )
+    """
+    Dynamic programming table of the linear partition problem.
+
+    table[i, j] is the minimal largest partition sum when splitting seq[: i + 1]
+    into j + 1 parts, solution[i - 1, j - 1] the index after which the last part starts.
+    Uses prefix sums and a vectorized minimum over all split positions per column.
+    """
+    values = np.asarray(seq, dtype=float)
+    n = len(values)
+    prefix = np.cumsum(values)
+
+    table = np.empty((n, k))
+    solution = np.zeros((max(n - 1, 0), max(k - 1, 0)), dtype=np.int64)
+    table[:, 0] = prefix
+    table[0, :] = values[0]
+    if n < 2:
+        return table, solution
+
+    # part_sums[i - 1, x] = sum(seq[x + 1 : i + 1]), only valid for split positions x < i
+    part_sums = prefix[1:, None] - prefix[None, :-1]
+    invalid = np.triu(np.ones((n - 1, n - 1), dtype=bool), k=1)
+    rows = np.arange(n - 1)
+
+    for j in range(1, k):
+        candidates = np.maximum(table[None, :-1, j - 1], part_sums)
+        candidates[invalid] = np.inf
+        best = np.argmin(candidates, axis=1)
+        table[1:, j] = candidates[rows, best]
+        solution[:, j - 1] = best
+
     return table, solution
 
 
-def linear_partition(seq, k, data_list=None, do_rotate=False):
-    if k <= 0:
-        return []
+def _partition_items(seq, data_list=None):
+    return seq if data_list is None or len(data_list) != len(seq) else data_list
+
+
+def _partition_from_solution(seq, k, solution, data_list=None, do_rotate=False):
+    """Reconstructs the k rows of a linear partition from a solution table."""
+    items = _partition_items(seq, data_list)
     n = len(seq) - 1
-    if k > n:
-        return ([x] for x in seq)
-    _, solution = linear_partition_table(seq, k)
     k, ans = k - 2, []
-    if data_list is None or len(data_list) != len(seq):
-        while k >= 0:
-            row = [[seq[i] for i in range(solution[n - 1][k] + 1, n + 1)]]
-            if do_rotate:
-                ans += row
-            else:
-                ans = row + ans
-            n, k = solution[n - 1][k], k - 1
-        row = [[seq[i] for i in range(0, n + 1)]]
+    while k >= 0:
+        row = [[items[i] for i in range(solution[n - 1][k] + 1, n + 1)]]
         if do_rotate:
             ans += row
         else:
             ans = row + ans
+        n, k = solution[n - 1][k], k - 1
+    row = [[items[i] for i in range(0, n + 1)]]
+    if do_rotate:
+        ans += row
     else:
-        while k >= 0:
-            row = [[data_list[i] for i in range(solution[n - 1][k] + 1, n + 1)]]
-            if do_rotate:
-                ans += row
-            else:
-                ans = row + ans
-            n, k = solution[n - 1][k], k - 1
-        row = [[data_list[i] for i in range(0, n + 1)]]
-        if do_rotate:
-            ans += row
-        else:
-            ans = row + ans
+        ans = row + ans
     return ans
 
 
+def linear_partition(seq, k, data_list=None, do_rotate=False):
+    if k <= 0:
+        return []
+    n = len(seq) - 1
+    if k > n:
+        return [[x] for x in _partition_items(seq, data_list)]
+    _, solution = linear_partition_table(seq, k)
+    return _partition_from_solution(seq, k, solution, data_list, do_rotate)
+
+
+def linear_partition_batch(seq, ks, data_list=None, do_rotate=False) -> dict:
+    """
+    Solves the linear partition for several partition counts in one pass.
+
+    The DP table for the largest k contains the columns of all smaller k,
+    so it is computed only once.
+
+    Returns:
+        A dict mapping each k to the result of linear_partition(seq, k, ...).
+    """
+    n = len(seq) - 1
+    valid_ks = [k for k in ks if 0 < k <= n]
+    solution = linear_partition_table(seq, max(valid_ks))[1] if valid_ks else None
+
+    result = {}
+    for k in ks:
+        if k in valid_ks:
+            result[k] = _partition_from_solution(seq, k, solution, data_list, do_rotate)
+        else:
+            result[k] = linear_partition(seq, k, data_list, do_rotate)
+    return result
+
+
 class CollageRenderer:
     """
     Renders a collage of images with various layout options,
@@ -99,6 +156,7 @@ class CollageRenderer:
     """
 
     DEFAULT_IMAGE_SCORE_FACTOR = 1.0
+    LAYOUT_CACHE_SIZE = 256
 
     def __init__(
         self,
@@ -122,32 +180,18 @@ class CollageRenderer:
         self.detector = object_detector  # Use the passed object_detector
         self.cropper = SmartCrop()
 
+        # Memoization for the layout search: best candidate per image set and size,
+        # partitions of the current image set, per-run detections and importance values
+        self._layout_choice_cache: dict[tuple, tuple] = {}
+        self._partition_cache: dict = {}
+        self._detections: dict[int, tuple] = {}
+        self._importance: dict[int, tuple] = {}
+
         # Initialize logging system
         initialize_logging()
         self.logger: Logger = get_logger("base")
         self.logger.info("CollageRenderer initialized.")
 
-    def _applyRoundedCorners(self, image):
-        if not self.rounded_corners:
-            return image
-
-        radius = self.spacing
-
-        mask = Image.new("L", image.size, 0)
-
-        draw = ImageDraw.Draw(mask)
-
-        draw.rounded_rectangle(
-            (0, 0, image.width, image.height),
-            radius=radius,
-            fill=255,
-        )
-
-        image = image.convert("RGBA")
-        image.putalpha(mask)
-
-        return image
-
     def _flip_layout(self, node):
         if isinstance(node, ImageNode):
             return node
@@ -176,9 +220,23 @@ class CollageRenderer:
         Berücksichtigt:
         - Bildinhalt (Personen/Tiere/etc.)
         """
-        score = self._calculateImageScore(image)
+        return self._memo(
+            self._importance,
+            image,
+            lambda: 1.0 + (self._calculateImageScore(image) / 100.0) * self.image_score_factor,
+        )
 
-        return 1.0 + (score / 100.0) * self.image_score_factor
+    @staticmethod
+    def _memo(cache: dict, image, compute):
+        """
+        Per-image memoization. The entry holds the image itself, so its id cannot be
+        reused by another image while the entry exists, and a different object with
+        a recycled id is a cache miss.
+        """
+        entry = cache.get(id(image))
+        if entry is None or entry[0] is not image:
+            entry = cache[id(image)] = (image, compute())
+        return entry[1]
 
     def _calculateCombinedWeight(self, image):
         """
@@ -315,6 +373,10 @@ class CollageRenderer:
         """
         Erzeugt ein stabil balanciertes Layout basierend auf echter Partitionierung
         statt greedy rekursiven Splits.
+
+        Ab vier Bildern werden mehrere Kandidaten (Zeilenanzahl, Zeilen-Muster,
+        gespiegelte Bäume) analytisch über den Beschnitt bewertet, ohne Pixel zu rendern.
+        Die beste Wahl wird pro Bildsatz und Zielgröße gemerkt.
         """
 
         n = len(images)
@@ -329,42 +391,104 @@ class CollageRenderer:
         if n == 3:
             return self._chooseBestThreeLayout(images, direction)
 
-        # Special handling for 4 images: prefer nested/grouped layouts similar to
-        # PhotoCollage.makeCollage. This results in nicer, more balanced
-        # compositions (e.g. portrait on one side and three landscapes stacked
-        # on the other, or two nested groups of two images).
-        portraits = [img for img in images if img.width < img.height]
-        landscapes = [img for img in images if img.width >= img.height]
-        if n == 4 and len(portraits) == 1 and direction == "vertical":
-            p_img = portraits[0]
-            right_node = self._chooseBestThreeLayout(landscapes, direction)
-            left_node = ImageNode(p_img)
-            # choose split direction according to canvas ratio
-            # direction = "vertical" if target_width >= target_height else "horizontal"
-            return SplitNode(
-                direction=direction,
-                children=[left_node, right_node],
-                weights=[self._calculateLayoutWeight(p_img) * 2, 1],
+        cache_key = (
+            tuple(self._layoutKey(img) for img in images),
+            int(target_width),
+            int(target_height),
+            self.spacing,
+        )
+        cached_choice = self._layout_choice_cache.get(cache_key)
+        if cached_choice is not None:
+            return self._buildLayoutCandidate(images, target_width, target_height, cached_choice)
+
+        best_choice = None
+        best_layout = None
+        best_score = math.inf
+        for choice in self._layoutCandidates(images, target_width, target_height):
+            layout = self._buildLayoutCandidate(images, target_width, target_height, choice)
+            score = self._scoreLayout(layout, target_width, target_height)
+            if score < best_score:
+                best_choice, best_layout, best_score = choice, layout, score
+
+        self.logger.debug(f"Best layout {best_choice} with crop score {best_score:.3f}")
+        self._layout_choice_cache[cache_key] = best_choice
+        return best_layout
+
+    def _layoutKey(self, image) -> tuple:
+        """
+        Everything the layout score of an image depends on: its size, its importance
+        and, with object detection, where the detected objects are. Images of other
+        photos with the same size but different subjects must not share a layout.
+        """
+        key = (image.width, image.height, round(self._calculateImageImportance(image), 3))
+        if self.detector:
+            key += tuple(
+                (d.class_name, round(d.confidence, 3), tuple(round(v, 1) for v in d.bbox))
+                for d in self._detect(image)
             )
+        return key
 
-        # Gewichte berechnen (wie vorher)
-        weights = [self._calculateLayoutWeight(img) for img in images]
+    def _layoutCandidates(self, images, target_width, target_height):
+        """
+        Zählt die Kandidaten für die Layout-Suche auf. Der bisherige heuristische
+        Kandidat kommt zuerst, damit er bei gleicher Bewertung gewinnt.
+        """
+        n = len(images)
+        direction = self._get_splitter_direction(target_width, target_height)
+        portraits = [img for img in images if img.width < img.height]
 
         # Ziel: Anzahl "Zeilen" heuristisch bestimmen
         canvas_ratio = target_width / target_height
         num_rows = max(1, min(n, int(round(math.sqrt(n / canvas_ratio)))))
         if n == 4 and len(portraits) == 1:
+            if direction == "vertical":
+                yield ("portrait_group",)
             num_rows = 3
 
-        # Partitionierung (wie im Referenzalgorithmus)
-        rows = linear_partition(weights, num_rows, images)
+        max_rows = min(n, max(3, 2 * num_rows + 1))
+        row_counts = [num_rows] + [r for r in range(1, max_rows + 1) if r != num_rows]
+
+        for rows in row_counts:
+            for balanced in (True, False):
+                for flipped in (False, True):
+                    yield ("rows", rows, balanced, flipped)
+
+    def _buildLayoutCandidate(self, images, target_width, target_height, choice):
+        if choice[0] == "portrait_group":
+            # Special handling for 4 images: prefer nested/grouped layouts similar to
+            # PhotoCollage.makeCollage (portrait on one side, three landscapes on the other).
+            direction = self._get_splitter_direction(target_width, target_height)
+            p_img = next(img for img in images if img.width < img.height)
+            landscapes = [img for img in images if img.width >= img.height]
+            return SplitNode(
+                direction=direction,
+                children=[ImageNode(p_img), self._chooseBestThreeLayout(landscapes, direction)],
+                weights=[self._calculateLayoutWeight(p_img) * 2, 1],
+            )
+
+        _, num_rows, balanced, flipped = choice
+        layout = self._generateRowLayout(images, num_rows, balanced)
+        return self._flip_layout(layout) if flipped else layout
+
+    def _generateRowLayout(self, images, num_rows, balanced=True):
+        # Partitionierung (wie im Referenzalgorithmus); die Partitionen aller
+        # Zeilenanzahlen werden für einen Bildsatz nur einmal berechnet
+        cached = self._partition_cache.get("images", ())
+        if len(cached) != len(images) or any(a is not b for a, b in zip(cached, images)):
+            weights = [self._calculateLayoutWeight(img) for img in images]
+            self._partition_cache = {
+                "images": list(images),
+                "rows": linear_partition_batch(weights, range(1, len(images) + 1), images),
+            }
+        rows = self._partition_cache["rows"][num_rows]
 
         # Jede Zeile wird ein SplitNode (horizontal = Bilder nebeneinander)
         row_nodes = []
         row_weights = []
 
         for idx, row in enumerate(rows):
-            row = self._balance_row(row)
+            if balanced:
+                row = self._balance_row(row)
 
             if (idx + len(row)) % 2 == 0:
                 row = list(reversed(row))
@@ -372,7 +496,6 @@ class CollageRenderer:
             if len(row) == 1:
                 row_nodes.append(ImageNode(row[0]))
                 row_weights.append(self._calculateCombinedWeight(row[0]))
-                # row_weights.append(sum([self._calculateLayoutWeight(img) for img in row]))
             else:
                 w = self._adjust_row_weights(row)
                 row_nodes.append(
@@ -390,6 +513,44 @@ class CollageRenderer:
 
         return SplitNode(direction="horizontal", children=row_nodes, weights=row_weights)
 
+    def _scoreLayout(self, layout, width, height) -> float:
+        """
+        Bewertet ein Layout analytisch (kleiner ist besser): flächengewichteter
+        Beschnitt je Zelle relativ zum Seitenverhältnis des Bildes plus der Anteil
+        erkannter Objekte, der außerhalb des Ausschnitts liegt.
+        """
+        total_area = float(width * height)
+        score = 0.0
+        for image, _, _, cell_w, cell_h in self._layout_cells(layout, 0, 0, width, height):
+            if cell_w <= 0 or cell_h <= 0:
+                return math.inf
+            area_share = cell_w * cell_h / total_area
+            score += area_share * self._calculateCropLoss(image, cell_w, cell_h)
+        return score
+
+    def _calculateCropLoss(self, image, cell_w, cell_h) -> float:
+        image_ratio = image.width / image.height
+        cell_ratio = cell_w / cell_h
+        loss = 1.0 - min(image_ratio / cell_ratio, cell_ratio / image_ratio)
+
+        detections = self._detect(image) if self.detector else None
+        if detections:
+            left, top, right, bottom = self.cropper.get_crop_box(
+                image.width, image.height, cell_w, cell_h, detections
+            )
+            visible_area = 0.0
+            object_area = 0.0
+            for d in detections:
+                x1, y1, x2, y2 = d.bbox
+                object_area += max(0.0, x2 - x1) * max(0.0, y2 - y1)
+                visible_area += max(0.0, min(x2, right) - max(x1, left)) * max(
+                    0.0, min(y2, bottom) - max(y1, top)
+                )
+            if object_area > 0:
+                loss += 1.0 - visible_area / object_area
+
+        return loss * self._calculateImageImportance(image)
+
     def _interleave_portrait_landscape(self, images):
         portraits = [img for img in images if img.width < img.height]
         landscapes = [img for img in images if img.width >= img.height]
@@ -441,15 +602,40 @@ class CollageRenderer:
         return result
 
     def _renderLayout(self, collage, node, x, y, width, height):
-        # Leaf node: an actual image
-        if isinstance(node, ImageNode):
-            img = self._cropAndResize(node.image, width, height)
-            img = self._applyRoundedCorners(img)
-            pos = (int(x), int(y))
+        # Rounded corners: collect the (cached) corner masks of all cells in one
+        # mask and fill the corners with the background color in a single paste
+        corner_mask = Image.new("L", (int(width), int(height)), 0) if self.rounded_corners else None
+
+        for image, cell_x, cell_y, cell_w, cell_h in self._layout_cells(node, x, y, width, height):
+            try:
+                img = self._cropAndResize(image, cell_w, cell_h)
+            except (OSError, SyntaxError, ValueError) as e:
+                # decoding only happens here, so broken pixel data shows up late
+                self.logger.warning(f"Could not decode image, leaving cell empty: {e}")
+                continue
+            pos = (int(cell_x), int(cell_y))
             if "A" in img.getbands():
                 collage.paste(img, pos, img)
             else:
                 collage.paste(img, pos)
+
+            if corner_mask is not None:
+                corner_mask.paste(
+                    rounded_corner_mask(img.width, img.height, self.spacing),
+                    (pos[0] - int(x), pos[1] - int(y)),
+                )
+
+        if corner_mask is not None:
+            collage.paste(self.color, (int(x), int(y)), corner_mask)
+
+    def _layout_cells(self, node, x, y, width, height):
+        """
+        Yields (image, x, y, width, height) for every image cell of a layout tree.
+        Pure geometry, shared by rendering and layout scoring.
+        """
+        # Leaf node: an actual image
+        if isinstance(node, ImageNode):
+            yield node.image, x, y, width, height
             return
 
         # Defensive check: if a SplitNode somehow has no children, do nothing.
@@ -477,55 +663,66 @@ class CollageRenderer:
                 else:
                     cw = int(usable_width * w_ratio)
 
-                self._renderLayout(collage, child, current_x, y, cw, height)
+                yield from self._layout_cells(child, current_x, y, cw, height)
 
                 current_x += cw + self.spacing
 
             return
 
-        # --- VERTICAL = OBEN/UNTEN ---
+        # --- HORIZONTAL SPLIT (oben/unten) ---
         current_y = y
+        total_spacing = self.spacing * (len(node.children) - 1)
+        usable_height = height - total_spacing
 
         for i, child in enumerate(node.children):
-            total_spacing = self.spacing * (len(node.children) - 1)
-            usable_height = height - total_spacing
-
             h = node.weights[i] if node.weights else 1
             h_ratio = h / weight_sum
 
             if i == len(node.children) - 1:
-                ch = (x + width) - current_y  # Rest füllen
+                ch = y + height - current_y  # Rest füllen
             else:
                 ch = int(usable_height * h_ratio)
 
-            if i == len(node.children) - 1:
-                ch = y + height - current_y
-
-            self._renderLayout(collage, child, x, current_y, width, ch)
+            yield from self._layout_cells(child, x, current_y, width, ch)
 
             current_y += ch + self.spacing
 
-    def generate(self, images: list[Image.Image]) -> Image.Image:
+    def generate(
+        self,
+        images: list[Image.Image | ImageSource],
+        canvas: Image.Image | None = None,
+        offset: tuple[int, int] = (0, 0),
+    ) -> Image.Image:
         """
         Arranges images dynamically based on canvas ratio and content,
         generating a complete collage image.
 
         Args:
-            images: A list of PIL Image objects to be arranged in the collage.
+            images: A list of PIL Image objects or lazy ImageSource objects to be
+                arranged in the collage. ImageSources are laid out from their header
+                size and decoded one cell at a time, so the memory peak is set by the
+                largest single photo instead of the number of photos.
+            canvas: Optional RGB target image (e.g. the composition page). If given,
+                the cells are pasted directly into it and no separate collage buffer
+                is allocated.
+            offset: Upper left corner of the collage area within ``canvas``.
 
         Returns:
-            A PIL Image object representing the generated collage.
+            A PIL Image object representing the generated collage, or ``canvas``
+            with the collage rendered into it.
             Returns an empty canvas if no valid images are provided or
             if an unrecoverable error occurs.
         """
 
         self.logger.info("Starting collage generation.")
 
+        target, x, y = self._prepareCanvas(canvas, offset)
+
         if not images:
             self.logger.warning(
                 "No images provided for collage generation. Returning empty canvas."
             )
-            return Image.new("RGB", (self.width, self.height), self.color)
+            return target
 
         # Filter out non-PIL Image objects and corrupted images
         images = self._sanitize(images)
@@ -538,53 +735,74 @@ class CollageRenderer:
                 "All provided images were invalid or corrupted after sanitization. "
                 "Returning empty canvas."
             )
-            return Image.new("RGB", (self.width, self.height), self.color)
+            return target
         self.logger.info(f"Starting collage generation for {len(images)} images.")
 
-        layout = self._generateLayout(
-            images,
-            self.width,
-            self.height,
-        )
+        if len(self._layout_choice_cache) > self.LAYOUT_CACHE_SIZE:
+            self._layout_choice_cache.clear()
 
-        collage = Image.new(
-            "RGB",
-            (self.width, self.height),
-            self.color,
-        )
+        try:
+            layout = self._generateLayout(
+                images,
+                self.width,
+                self.height,
+            )
 
-        self._renderLayout(
-            collage,
-            layout,
-            0,
-            0,
-            self.width,
-            self.height,
-        )
+            self._renderLayout(
+                target,
+                layout,
+                x,
+                y,
+                self.width,
+                self.height,
+            )
+        finally:
+            # per-run memoization holds the images, release them with the run
+            self._detections = {}
+            self._importance = {}
+            self._partition_cache = {}
+
+        return target
+
+    def _prepareCanvas(self, canvas, offset):
+        """
+        Returns (target image, x, y): a new collage image, or the given canvas with
+        the collage area filled with the background color.
+        """
+        if canvas is None:
+            return Image.new("RGB", (self.width, self.height), self.color), 0, 0
 
-        return collage
+        x, y = int(offset[0]), int(offset[1])
+        canvas.paste(self.color, (x, y, x + self.width, y + self.height))
+        return canvas, x, y
 
-    def _sanitize(self, images: list[Image.Image]) -> list[Image.Image]:
+    def _sanitize(self, images: list) -> list[Image.Image | ImageSource]:
         """
-        Filters out non-PIL Image objects from the input list.
+        Filters out objects that are neither PIL Images nor ImageSources from the input list.
 
         Args:
-            images: A list of potential PIL Image objects.
+            images: A list of potential PIL Image / ImageSource objects.
 
         Returns:
-            A list containing only valid PIL Image objects.
+            A list containing only PIL Image and ImageSource objects.
         """
-        valid_images = [img for img in images if isinstance(img, Image.Image)]
+        valid_images = [img for img in images if isinstance(img, (Image.Image, ImageSource))]
         if len(valid_images) < len(images):
             self.logger.warning(
                 f"Removed {len(images) - len(valid_images)} non-Image objects from input."
             )
         return valid_images
 
-    def _filter_valid(self, images: list[Image.Image]) -> list[Image.Image]:
+    def _filter_valid(
+        self, images: list[Image.Image | ImageSource]
+    ) -> list[Image.Image | ImageSource]:
         """
         Filters out images that cause errors during basic PIL operations (e.g., corrupted files).
 
+        Only header information is checked, pixel data is not decoded here: file based
+        images are verified on a separate file handle, so the passed image objects stay
+        lazy until their cell is rendered.
+
         Args:
             images: A list of PIL Image objects.
 
@@ -594,14 +812,57 @@ class CollageRenderer:
         valid = []
         for img in images:
             try:
-                # Attempt a simple operation to check image validity (e.g., access a pixel)
-                img.getpixel((0, 0))
+                if img.width <= 0 or img.height <= 0:
+                    raise ValueError(f"Invalid image size {img.size}")
+                if isinstance(img, ImageSource):
+                    img.verify()
+                elif self._isLazyFile(img):
+                    with Image.open(img.filename) as probe:
+                        probe.verify()
                 valid.append(img)
             except Exception as e:
                 self.logger.warning(f"Invalid or corrupted image detected and removed: {e}")
                 continue
         return valid
 
+    @staticmethod
+    def _isLazyFile(image) -> bool:
+        """True if the image was opened from a file and its pixels are not decoded yet."""
+        return (
+            isinstance(image, ImageFile.ImageFile)
+            and bool(getattr(image, "filename", ""))
+            and bool(image.tile)
+        )
+
+    @contextmanager
+    def _pixels(self, image):
+        """
+        Provides an image with pixel access. ImageSources and lazy file based images
+        are decoded from a separate handle that is closed (and its pixel buffer
+        released) afterwards, so the caller's image object is never decoded and at
+        most one full resolution source is held in memory at a time.
+        """
+        if isinstance(image, ImageSource):
+            with image.open() as source:
+                yield source
+            return
+
+        if not self._isLazyFile(image):
+            yield image
+            return
+
+        with Image.open(image.filename) as source:
+            yield source
+
+    def _detect(self, image):
+        """Runs the object detector once per image and collage generation."""
+
+        def detect():
+            with self._pixels(image) as source:
+                return self.detector.detect(source)
+
+        return self._memo(self._detections, image, detect)
+
     def _cropAndResize(self, image, target_width, target_height):
         """
         Crops an image proportionally and then scales it to the desired size.
@@ -610,17 +871,18 @@ class CollageRenderer:
         detections = None
         if self.detector:
             self.logger.debug("Object detection enabled. Detecting objects for smart crop.")
-            detections = self.detector.detect(image)
+            detections = self._detect(image)
             self.logger.debug(f"Detected {len(detections)} objects.")
         else:
             self.logger.debug("Object detection disabled. Performing standard crop.")
 
-        cropped_image, _ = self.cropper.crop(
-            image=image,
-            target_width=target_width,
-            target_height=target_height,
-            detections=detections,
-        )
+        with self._pixels(image) as source:
+            cropped_image, _ = self.cropper.crop(
+                image=source,
+                target_width=target_width,
+                target_height=target_height,
+                detections=detections,
+            )
         return cropped_image
 
     def _adjust_row_weights(self, row_images):
@@ -675,9 +937,10 @@ class CollageRenderer:
             self.logger.info("Object detector not initialized, returning score 0.")
             return 0.0
 
-        detections = self.detector.detect(image)
+        detections = self._detect(image)
+        name = getattr(image, "file_path", None) or getattr(image, "filename", "")
         self.logger.info(
-            f"Calculating score for image {os.path.split(image.filename)[-1]} "
+            f"Calculating score for image {os.path.basename(name)} "
             f"with {len(detections)} detections."
         )
 
@@ -4,7 +4,7 @@ from config_cli_gui.configtypes.font import Font
 from PIL import Image, ImageDraw
 
 from Photo_Composition_Designer.config.config import ConfigParameterManager
-from Photo_Composition_Designer.tools.Helpers import mm_to_px
+from Photo_Composition_Designer.tools.Helpers import get_image_font, mm_to_px
 
 
 class DescriptionRenderer:
@@ -51,7 +51,7 @@ class DescriptionRenderer:
         draw = ImageDraw.Draw(img)
 
         # Use the font object to get the PIL font with the correct DPI
-        pil_font = self.font.get_image_font(self.dpi)
+        pil_font = get_image_font(self.font, self.dpi)
 
         if alignment == "left":
             text_x = self.margin_side_px
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from logging import Logger
+from multiprocessing.connection import Client, Connection, Listener, wait
+
+from config_cli_gui.logging import get_logger, initialize_logging
+from PIL import Image
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.image.ObjectDetector import Detection, ObjectDetector, PreparedImage
+
+
+class DetectorService:
+    """
+    Local object detection server for multi-process rendering.
+
+    Runs one ObjectDetector in a separate process, so that parallel workers share a
+    single ONNX session and a single detection cache instead of loading their own.
+    Workers connect over a local socket (Unix domain socket, named pipe on Windows)
+    with a RemoteObjectDetector, which can be passed to worker processes:
+
+        with DetectorService.from_config(config) as service:
+            designer = CompositionDesigner(config, object_detector=service.client())
+
+    Requests arriving close together are run through the model as one batch (if the
+    model has a dynamic batch dimension).
+    """
+
+    START_TIMEOUT = 120.0
+    STOP_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        detector_kwargs: dict | None = None,
+        batch_size: int = 8,
+        batch_timeout: float = 0.005,
+        detector_class: type[ObjectDetector] = ObjectDetector,
+    ):
+        """
+        Args:
+            detector_kwargs: Constructor arguments of the ObjectDetector in the server.
+            batch_size: Maximum number of images per inference run.
+            batch_timeout: Seconds to wait for further requests before running a batch.
+            detector_class: ObjectDetector (sub)class created in the server process.
+        """
+        initialize_logging()
+        self.logger: Logger = get_logger("base")
+
+        self.detector_kwargs = detector_kwargs or {}
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.detector_class = detector_class
+        self.address = None
+        self._authkey = os.urandom(16)
+        self._process: multiprocessing.process.BaseProcess | None = None
+
+    @classmethod
+    def from_config(cls, config: ConfigParameterManager, **kwargs) -> DetectorService:
+        """Creates a DetectorService from a ConfigParameterManager instance."""
+        # the server is the only process running inference, it may use all cores
+        return cls(ObjectDetector.config_kwargs(config, workers=1), **kwargs)
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> DetectorService:
+        """Starts the server process and waits until the model is loaded."""
+        if self.running:
+            return self
+
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_serve,
+            args=(
+                child_conn,
+                self._authkey,
+                self.detector_class,
+                self.detector_kwargs,
+                self.batch_size,
+                self.batch_timeout,
+            ),
+            name="DetectorService",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        if not parent_conn.poll(self.START_TIMEOUT):
+            self._process.terminate()
+            raise RuntimeError("Detector service did not start in time")
+        status, value = parent_conn.recv()
+        parent_conn.close()
+        if status != "ready":
+            self._process.join(self.STOP_TIMEOUT)
+            raise RuntimeError(f"Detector service failed to start: {value}")
+
+        self.address = value
+        self.logger.info(f"Detector service listening on {self.address}")
+        return self
+
+    def stop(self) -> None:
+        """Stops the server process."""
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                with Client(self.address, authkey=self._authkey) as conn:
+                    conn.send(("shutdown",))
+            except OSError:
+                pass
+            self._process.join(self.STOP_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+        self._process = None
+
+    def client(self) -> RemoteObjectDetector:
+        """Returns a detector connected to this service (picklable for worker processes)."""
+        if not self.running:
+            raise RuntimeError("Detector service is not running")
+        return RemoteObjectDetector(self.address, self._authkey)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the request, cache hit, inference and batch counters of the server."""
+        return self.client().stats()
+
+    def __enter__(self) -> DetectorService:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+class RemoteObjectDetector:
+    """
+    Client of a DetectorService with the detect() interface of ObjectDetector.
+
+    Decoding, fingerprinting and the letterbox resize happen in the calling process;
+    only the small resized image is sent to the server, and only on a cache miss.
+    The connection is opened on first use, so instances can be pickled to workers.
+    Errors of the server (e.g. a failed inference) are raised as RuntimeError.
+    """
+
+    def __init__(self, address, authkey: bytes):
+        self.address = address
+        self._authkey = authkey
+        self._conn: Connection | None = None
+        self._cache_key_suffix = ""
+        self._lock = threading.Lock()
+        self._memory_cache: dict[str, list[Detection]] = {}
+
+    def __getstate__(self) -> dict:
+        return {"address": self.address, "authkey": self._authkey}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["address"], state["authkey"])
+
+    def detect(self, image: Image.Image) -> list[Detection]:
+        with self._lock:
+            conn = self._connect()
+
+        # decoding and fingerprinting do not need the connection
+        prepared = ObjectDetector.prepare_image(image, self._cache_key_suffix)
+        result = self._memory_cache.get(prepared.cache_key)
+        if result is not None:
+            return result
+
+        with self._lock:
+            conn.send(("lookup", prepared.cache_key))
+            result = self._receive(conn)
+
+        if result is None:
+            # same resize the server would do, but on the client side: only the small
+            # letterbox sized image is transferred
+            _, letterbox_size, _ = ObjectDetector._letterbox_geometry(
+                prepared.width, prepared.height
+            )
+            prepared.image = ObjectDetector.letterbox_resize(prepared.image, letterbox_size)
+            with self._lock:
+                conn.send(("detect", prepared))
+                result = self._receive(conn)
+
+        self._memory_cache[prepared.cache_key] = result
+        return result
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            conn = self._connect()
+            conn.send(("stats",))
+            return self._receive(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _receive(conn: Connection):
+        result = conn.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _connect(self) -> Connection:
+        if self._conn is None:
+            self._conn = Client(self.address, authkey=self._authkey)
+            self._conn.send(("hello",))
+            self._cache_key_suffix = self._conn.recv()
+        return self._conn
+
+
+def _serve(
+    ready_conn: Connection,
+    authkey: bytes,
+    detector_class: type[ObjectDetector],
+    detector_kwargs: dict,
+    batch_size: int,
+    batch_timeout: float,
+) -> None:
+    """Main loop of the server process."""
+    try:
+        detector = detector_class(**detector_kwargs)
+        listener = Listener(authkey=authkey)
+    except Exception as exc:
+        ready_conn.send(("error", repr(exc)))
+        return
+
+    connections: list[Connection] = []
+    connections_lock = threading.Lock()
+    # wakes the main loop when a client connected, so it never polls
+    wake_reader, wake_writer = multiprocessing.Pipe(duplex=False)
+
+    def accept() -> None:
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError:  # listener closed
+                return
+            except Exception:  # failed authentication
+                continue
+            with connections_lock:
+                connections.append(conn)
+            wake_writer.send(None)
+
+    threading.Thread(target=accept, name="DetectorServiceAccept", daemon=True).start()
+    ready_conn.send(("ready", listener.address))
+    ready_conn.close()
+
+    stats = {"requests": 0, "cache_hits": 0, "inferences": 0, "batches": 0}
+    pending: list[tuple[Connection, PreparedImage]] = []
+    running = True
+
+    while running:
+        with connections_lock:
+            active = list(connections)
+
+        # blocks until a request or a new client arrives, or the batch timeout expires
+        ready = wait([wake_reader, *active], batch_timeout if pending else None)
+        for conn in ready:
+            if conn is wake_reader:
+                wake_reader.recv()
+                continue
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                with connections_lock:
+                    connections.remove(conn)
+                continue
+
+            kind = message[0]
+            try:
+                if kind == "hello":
+                    conn.send(detector.cache_key_suffix)
+                elif kind == "lookup":
+                    stats["requests"] += 1
+                    result = detector.lookup(message[1])
+                    if result is not None:
+                        stats["cache_hits"] += 1
+                    conn.send(result)
+                elif kind == "detect":
+                    pending.append((conn, message[1]))
+                elif kind == "stats":
+                    conn.send(dict(stats))
+                elif kind == "shutdown":
+                    running = False
+            except Exception as exc:  # answer the request, keep serving the others
+                _send(conn, _server_error(kind, exc))
+
+        # run the batch once it is full or no further request arrived in time
+        if pending and (len(pending) >= batch_size or not ready or not running):
+            _run_batch(detector, pending, stats)
+            pending = []
+
+    listener.close()
+    with connections_lock:
+        for conn in connections:
+            conn.close()
+
+
+def _run_batch(
+    detector: ObjectDetector,
+    pending: list[tuple[Connection, PreparedImage]],
+    stats: dict[str, int],
+) -> None:
+    """
+    Runs the pending requests through the model; duplicate images are inferred once.
+    If the batch fails, the error is sent to all waiting clients instead of a result.
+    """
+    unique: dict[str, PreparedImage] = {}
+    for _, prepared in pending:
+        unique.setdefault(prepared.cache_key, prepared)
+
+    try:
+        results = dict(zip(unique, detector.infer_batch(list(unique.values())), strict=True))
+        for cache_key, result in results.items():
+            detector.store(cache_key, result)
+    except Exception as exc:
+        error = _server_error("detect", exc)
+        for conn, _ in pending:
+            _send(conn, error)
+        return
+
+    stats["inferences"] += len(unique)
+    stats["batches"] += 1
+    for conn, prepared in pending:
+        _send(conn, results[prepared.cache_key])
+
+
+def _server_error(kind: str, exc: Exception) -> RuntimeError:
+    # the original exception may not be picklable, its description always is
+    return RuntimeError(f"Detector service failed to handle '{kind}': {exc!r}")
+
+
+def _send(conn: Connection, value) -> None:
+    try:
+        conn.send(value)
+    except OSError:  # client disconnected meanwhile
+        pass
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PIL import Image
+
+
+class ImageSource:
+    """
+    Lazy, file based image for the collage layout.
+
+    Width, height and aspect ratio are read from the file header once; no file handle
+    is kept open and no pixels are decoded. The pixels are only decoded when open() is
+    called, typically for a single collage cell, and released again when the returned
+    image is closed:
+
+        with source.open() as image:
+            tile = image.crop(box).resize(size)
+    """
+
+    def __init__(self, file_path: Path | str, size: tuple[int, int] | None = None):
+        """
+        Args:
+            file_path: Path to the image file.
+            size: Known (width, height), e.g. from a metadata index. Read from the
+                file header if omitted.
+        """
+        self.file_path: Path = Path(file_path)
+        if size is None:
+            with Image.open(self.file_path) as image:
+                size = image.size
+        self.width: int = int(size[0])
+        self.height: int = int(size[1])
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    @property
+    def aspect(self) -> float:
+        return self.width / self.height
+
+    def open(self) -> Image.Image:
+        """Opens the file for decoding. Use as context manager to release the pixels."""
+        return Image.open(self.file_path)
+
+    def verify(self) -> None:
+        """Checks the file structure without decoding the pixels."""
+        with Image.open(self.file_path) as image:
+            image.verify()
+
+    def __repr__(self) -> str:
+        return f"ImageSource({str(self.file_path)!r}, size={self.size})"
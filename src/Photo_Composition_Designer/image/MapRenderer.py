@@ -6,7 +6,6 @@ from pathlib import Path
 from PIL import Image
 
 from Photo_Composition_Designer.config.config import ConfigParameterManager
-from Photo_Composition_Designer.tools.GeoPlotter import GeoPlotter
 from Photo_Composition_Designer.tools.Helpers import mm_to_px
 
 
@@ -45,7 +44,9 @@ class MapRenderer:
         :param coordinates: Liste von (Breitengrad, Längengrad)-Tupeln.
         :return: PIL.Image-Objekt mit der Karte.
         """
-        # Plotter initialisieren
+        # Plotter initialisieren (geopandas/matplotlib erst bei der ersten Karte laden)
+        from Photo_Composition_Designer.tools.GeoPlotter import GeoPlotter
+
         border = 15  # unwanted border to be eliminated
         plotter = GeoPlotter(
             minimalExtension=self.minimalExtension,
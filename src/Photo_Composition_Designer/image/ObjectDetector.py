@@ -1,15 +1,23 @@
+from __future__ import annotations
+
 import hashlib
 import json
 import os
 import tempfile
+import threading
 from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-import onnxruntime as ort
 from config_cli_gui.logging import get_logger, initialize_logging
-from PIL import Image
+from PIL import Image, ImageFile
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+if TYPE_CHECKING:
+    import onnxruntime as ort
 
 
 @dataclass(slots=True)
@@ -19,11 +27,46 @@ class Detection:
     bbox: tuple[float, float, float, float]
 
 
+@dataclass(slots=True)
+class PreparedImage:
+    """An image ready for inference: cache key, RGB pixels and its original size."""
+
+    cache_key: str
+    image: Image.Image
+    width: int
+    height: int
+
+
 class ObjectDetector:
     """
     YOLO ONNX wrapper.
+
+    Images are letterboxed (scaled with preserved aspect ratio and padded) into the
+    square model input. The float32 NCHW input tensor is preallocated once and reused
+    for every call; JPEG sources are decoded at a reduced scale when possible.
     """
 
+    INPUT_SIZE = 640
+    LETTERBOX_VALUE = 114  # gray padding, as used for YOLO training
+
+    GRAPH_OPTIMIZATION_LEVELS = {
+        "disabled": "ORT_DISABLE_ALL",
+        "basic": "ORT_ENABLE_BASIC",
+        "extended": "ORT_ENABLE_EXTENDED",
+        "all": "ORT_ENABLE_ALL",
+    }
+    EXECUTION_MODES = {
+        "sequential": "ORT_SEQUENTIAL",
+        "parallel": "ORT_PARALLEL",
+    }
+
+    # FP32 reference model and the INT8 variant from scripts/quantize_detector.py
+    DEFAULT_MODEL_PATH = "res/yolo/yolo26n.onnx"
+    MODEL_PATHS = {
+        "fp32": DEFAULT_MODEL_PATH,
+        "int8": "res/yolo/yolo26n_int8.onnx",
+    }
+
     # https://docs.ultralytics.com/datasets/segment/coco#sample-images-and-annotations
     # https://gist.github.com/rcland12/dc48e1963268ff98c8b2c4543e7a9be8
     WANTED_CLASSES = {
@@ -48,9 +91,16 @@ class ObjectDetector:
 
     def __init__(
         self,
-        model_path: str = "res/yolo/yolo26n.onnx",
+        model_path: str = DEFAULT_MODEL_PATH,
         confidence_threshold: float = 0.25,
         cache_dir: Path | str | None = None,
+        nms_iou_threshold: float | None = None,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        execution_mode: str = "sequential",
+        graph_optimization: str = "all",
+        optimized_model_path: Path | str | None = None,
+        workers: int = 1,
     ) -> None:
         """Create an ObjectDetector.
 
@@ -59,21 +109,59 @@ class ObjectDetector:
             confidence_threshold: Minimum confidence for detections.
             cache_dir: Directory to store per-image cache JSON files. If None,
                 a temp subfolder will be used.
+            nms_iou_threshold: If set, class-wise non-maximum suppression with this
+                IoU threshold is applied. Not needed for NMS-free (end-to-end) models
+                like YOLO26, which already return one box per object.
+            intra_op_threads: ONNX Runtime threads within one operator (0 = automatic).
+            inter_op_threads: ONNX Runtime threads across operators (0 = automatic).
+            execution_mode: "sequential" or "parallel" operator execution.
+            graph_optimization: "disabled", "basic", "extended" or "all".
+            optimized_model_path: Optional file to cache the optimized model.
+            workers: Number of processes running detection concurrently. With more
+                than one worker, automatic thread counts are divided among them to
+                avoid oversubscribing the cores.
         """
         initialize_logging()
 
         self.logger: Logger = get_logger("base")
 
         self.confidence_threshold = confidence_threshold
+        self.nms_iou_threshold = nms_iou_threshold
+        self._wanted_ids = np.fromiter(self.WANTED_CLASSES, dtype=np.int64)
 
-        # Initialize ONNX session
-        self.session = ort.InferenceSession(
+        # Initialize ONNX session (onnxruntime is imported on first use: slow to import)
+        import onnxruntime as ort
+
+        session_model, session_options = self._create_session_options(
             model_path,
+            intra_op_threads,
+            inter_op_threads,
+            execution_mode,
+            graph_optimization,
+            optimized_model_path,
+            workers,
+        )
+        self.session = ort.InferenceSession(
+            session_model,
+            sess_options=session_options,
             providers=["CPUExecutionProvider"],
         )
 
         self.input_name = self.session.get_inputs()[0].name
 
+        # detections of other models (e.g. the quantized one) get their own cache entries
+        model_stem = Path(model_path).stem
+        self._cache_tag = "" if model_stem == Path(self.DEFAULT_MODEL_PATH).stem else model_stem
+
+        # Reusable model input (NCHW, float32); the lock protects it between threads
+        self._input_buffer = np.empty((1, 3, self.INPUT_SIZE, self.INPUT_SIZE), dtype=np.float32)
+        self._batch_buffer: np.ndarray | None = None
+        self._input_lock = threading.Lock()
+
+        # models exported with a dynamic batch dimension can run several images at once
+        batch_dim = self.session.get_inputs()[0].shape[0]
+        self.supports_batch = batch_dim is None or isinstance(batch_dim, str)
+
         # In-memory per-process cache for speed
         self._memory_cache: dict[str, list[Detection]] = {}
 
@@ -86,13 +174,157 @@ class ObjectDetector:
         base.mkdir(parents=True, exist_ok=True)
         self.cache_dir: Path = base
 
+    @classmethod
+    def from_config(cls, config: ConfigParameterManager, workers: int = 1) -> ObjectDetector:
+        """Creates an ObjectDetector from a ConfigParameterManager instance."""
+        return cls(**cls.config_kwargs(config, workers))
+
+    @classmethod
+    def config_kwargs(cls, config: ConfigParameterManager, workers: int = 1) -> dict:
+        """Constructor arguments from the config, e.g. to create the detector in another process."""
+        detector = config.detector
+        return {
+            "model_path": cls.resolve_model_path(detector.modelPrecision.value),
+            "intra_op_threads": detector.intraOpThreads.value,
+            "inter_op_threads": detector.interOpThreads.value,
+            "execution_mode": detector.executionMode.value,
+            "graph_optimization": detector.graphOptimization.value,
+            "optimized_model_path": detector.optimizedModelPath.value or None,
+            "workers": workers,
+        }
+
+    @classmethod
+    def resolve_model_path(cls, precision: str) -> str:
+        """
+        Returns the model file for the precision ("fp32" or "int8"). Falls back to the
+        FP32 model if the quantized model has not been created yet.
+        """
+        model_path = cls.MODEL_PATHS[precision]
+        if precision != "fp32" and not Path(model_path).exists():
+            get_logger("base").warning(
+                "Model %s not found (create it with scripts/quantize_detector.py), using %s",
+                model_path,
+                cls.DEFAULT_MODEL_PATH,
+            )
+            return cls.DEFAULT_MODEL_PATH
+        return model_path
+
+    @staticmethod
+    def resolve_thread_counts(
+        intra_op_threads: int, inter_op_threads: int, workers: int = 1
+    ) -> tuple[int, int]:
+        """
+        Resolves automatic (0) thread counts. A single worker keeps the ONNX Runtime
+        defaults (0 = all physical cores); parallel workers share the available cores.
+        """
+        if workers <= 1:
+            return intra_op_threads, inter_op_threads
+
+        if hasattr(os, "sched_getaffinity"):
+            cpus = len(os.sched_getaffinity(0))
+        else:
+            cpus = os.cpu_count() or 1
+
+        return (
+            intra_op_threads or max(1, cpus // workers),
+            inter_op_threads or 1,
+        )
+
+    def _create_session_options(
+        self,
+        model_path: str,
+        intra_op_threads: int,
+        inter_op_threads: int,
+        execution_mode: str,
+        graph_optimization: str,
+        optimized_model_path: Path | str | None,
+        workers: int,
+    ) -> tuple[str, ort.SessionOptions]:
+        """Returns the model file to load and the session options."""
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+
+        intra, inter = self.resolve_thread_counts(intra_op_threads, inter_op_threads, workers)
+        options.intra_op_num_threads = intra
+        options.inter_op_num_threads = inter
+        options.execution_mode = getattr(ort.ExecutionMode, self.EXECUTION_MODES[execution_mode])
+        options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel, self.GRAPH_OPTIMIZATION_LEVELS[graph_optimization]
+        )
+
+        if optimized_model_path:
+            cached = Path(optimized_model_path)
+            model_file = Path(model_path)
+            if (
+                cached.exists()
+                and model_file.exists()
+                and cached.stat().st_mtime >= model_file.stat().st_mtime
+            ):
+                # already optimized: load it directly and skip the optimization passes
+                self.logger.debug("Using optimized detection model %s", cached)
+                options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+                model_path = str(cached)
+            else:
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                options.optimized_model_filepath = str(cached)
+
+        self.logger.debug(
+            "ONNX session: intra_op_threads=%s, inter_op_threads=%s, mode=%s, optimization=%s",
+            intra,
+            inter,
+            execution_mode,
+            graph_optimization,
+        )
+        return model_path, options
+
+    @property
+    def cache_key_suffix(self) -> str:
+        """
+        Part of the cache key that depends on the detector settings, so that changes
+        to the threshold, model or NMS result in different cache entries.
+        """
+        suffix = f"-{self.confidence_threshold:.3f}"
+        if self._cache_tag:
+            suffix += f"-{self._cache_tag}"
+        if self.nms_iou_threshold is not None:
+            suffix += f"-nms{self.nms_iou_threshold:.2f}"
+        return suffix
+
     def detect(self, image: Image.Image) -> list[Detection]:
-        # Compute a fast, stable fingerprint for the image and include the
-        # current confidence threshold so that changes to the threshold
-        # result in different cache entries.
-        image_hash = self._compute_image_fingerprint(image)
-        cache_key = f"{image_hash}-{self.confidence_threshold:.3f}"
+        return self.detect_many([image])[0]
+
+    def detect_many(self, images: list[Image.Image]) -> list[list[Detection]]:
+        """
+        Detects objects on several images. Images without cache entry are run through
+        the model together, as one batch if the model has a dynamic batch dimension.
+        """
+        prepared = [self.prepare_image(image, self.cache_key_suffix) for image in images]
+        results = [self.lookup(item.cache_key) for item in prepared]
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            inferred = self.infer_batch([prepared[i] for i in missing])
+            for i, result in zip(missing, inferred, strict=True):
+                self.store(prepared[i].cache_key, result)
+                results[i] = result
+
+        return results
+
+    @classmethod
+    def prepare_image(cls, image: Image.Image, cache_key_suffix: str) -> PreparedImage:
+        """
+        Decodes the image (reduced if possible) and computes its cache key: a fast,
+        stable fingerprint of the image plus the settings dependent suffix.
+        """
+        orig_w, orig_h = image.size
+        _, letterbox_size, _ = cls._letterbox_geometry(orig_w, orig_h)
+        rgb = cls._load_rgb(image, letterbox_size)
+        image_hash = cls._compute_image_fingerprint(rgb, (orig_w, orig_h))
+        return PreparedImage(f"{image_hash}{cache_key_suffix}", rgb, orig_w, orig_h)
 
+    def lookup(self, cache_key: str) -> list[Detection] | None:
+        """Returns cached detections from memory or the cache directory, else None."""
         # Fast in-memory hit
         if cache_key in self._memory_cache:
             self.logger.debug(
@@ -121,70 +353,219 @@ class ObjectDetector:
                     cache_file,
                     exc,
                 )
+        return None
 
-        self.logger.debug("Performing YOLO detection for cache key: %s", cache_key)
-
-        orig_w, orig_h = image.size
-
-        resized = image.resize((640, 640))
-
-        img = np.asarray(resized, dtype=np.float32)
-        img /= 255.0
-        img = np.transpose(img, (2, 0, 1))
-        img = np.expand_dims(img, axis=0)
-
-        outputs = self.session.run(
-            None,
-            {self.input_name: img},
-        )
-
-        detections = outputs[0][0]
-
-        scale_x = orig_w / 640.0
-        scale_y = orig_h / 640.0
+    def store(self, cache_key: str, result: list[Detection]) -> None:
+        """Persists detections to the cache directory (atomic write) and memory cache."""
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            serial = [self._detection_to_dict(d) for d in result]
+            tmp_path = cache_file.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(serial, fh, ensure_ascii=False)
+            os.replace(tmp_path, cache_file)
+        except Exception as exc:  # do not raise for cache write failures
+            self.logger.warning("Failed to write cache file %s (%s)", cache_file, exc)
 
-        result: list[Detection] = []
+        self._memory_cache[cache_key] = result
 
-        for det in detections:
-            x1, y1, x2, y2, conf, cls_id = det
+    def infer_batch(self, prepared: list[PreparedImage]) -> list[list[Detection]]:
+        """
+        Runs the model on prepared images, batched if the model supports it. The cache
+        is not used; detect_many() and the DetectorService combine it with lookup() and
+        store().
+        """
+        batch_size = len(prepared) if self.supports_batch else 1
+        results: list[list[Detection]] = []
+
+        for start in range(0, len(prepared), batch_size):
+            chunk = prepared[start : start + batch_size]
+            for item in chunk:
+                self.logger.debug("Performing YOLO detection for cache key: %s", item.cache_key)
+
+            with self._input_lock:
+                buffer = self._batch_input(len(chunk))
+                paddings = [
+                    self.letterbox_into(buffer[i : i + 1], item.image, item.width, item.height)
+                    for i, item in enumerate(chunk)
+                ]
+                outputs = self.session.run(
+                    None,
+                    {self.input_name: buffer},
+                )
 
-            cls_id = int(cls_id)
+            for i, item in enumerate(chunk):
+                scale, _, _ = self._letterbox_geometry(item.width, item.height)
+                pad_x, pad_y = paddings[i]
+                result = self._postprocess(
+                    outputs[0][i], scale, pad_x, pad_y, item.width, item.height
+                )
+                self.logger.debug(
+                    "Objects detected: %s",
+                    ", ".join(f"{d.class_name}: {d.confidence:.3f}" for d in result) or "none",
+                )
+                results.append(result)
 
-            if conf < self.confidence_threshold:
-                continue
+        return results
 
-            if cls_id not in self.WANTED_CLASSES:
-                continue
+    def _batch_input(self, batch_size: int) -> np.ndarray:
+        """Returns the reusable input buffer for a batch of the given size."""
+        if batch_size == 1:
+            return self._input_buffer
+        if self._batch_buffer is None or len(self._batch_buffer) < batch_size:
+            self._batch_buffer = np.empty(
+                (batch_size, 3, self.INPUT_SIZE, self.INPUT_SIZE), dtype=np.float32
+            )
+        return self._batch_buffer[:batch_size]
 
-            class_name = self.WANTED_CLASSES[cls_id]
+    @classmethod
+    def _letterbox_geometry(
+        cls, width: int, height: int
+    ) -> tuple[float, tuple[int, int], tuple[int, int]]:
+        """
+        Returns (scale, (new_w, new_h), (pad_x, pad_y)) for letterboxing an image of
+        the given size into the square model input.
+        """
+        scale = min(cls.INPUT_SIZE / width, cls.INPUT_SIZE / height)
+        new_w = max(1, min(cls.INPUT_SIZE, int(round(width * scale))))
+        new_h = max(1, min(cls.INPUT_SIZE, int(round(height * scale))))
+        return (
+            scale,
+            (new_w, new_h),
+            ((cls.INPUT_SIZE - new_w) // 2, (cls.INPUT_SIZE - new_h) // 2),
+        )
 
-            self.logger.info(f"Object detected: {class_name}: {conf:.3f}")
+    def _postprocess(
+        self,
+        output: np.ndarray,
+        scale: float,
+        pad_x: int,
+        pad_y: int,
+        orig_w: int,
+        orig_h: int,
+    ) -> list[Detection]:
+        """
+        Converts the raw model output rows (x1, y1, x2, y2, confidence, class_id) in
+        letterbox coordinates into detections on the original image.
 
-            result.append(
-                Detection(
-                    class_name=class_name,
-                    confidence=float(conf),
-                    bbox=(
-                        float(x1 * scale_x),
-                        float(y1 * scale_y),
-                        float(x2 * scale_x),
-                        float(y2 * scale_y),
-                    ),
-                )
+        Threshold, class filter, back-mapping and NMS work on the whole array; Detection
+        objects are only created for the remaining rows.
+        """
+        output = np.asarray(output, dtype=np.float32).reshape(-1, 6)
+
+        class_ids = output[:, 5].astype(np.int64)
+        keep = (output[:, 4] >= self.confidence_threshold) & np.isin(class_ids, self._wanted_ids)
+        output, class_ids = output[keep], class_ids[keep]
+
+        boxes = (output[:, :4] - np.array([pad_x, pad_y, pad_x, pad_y], np.float32)) / scale
+        np.clip(boxes[:, 0::2], 0.0, orig_w, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0.0, orig_h, out=boxes[:, 1::2])
+        confidences = output[:, 4]
+
+        if self.nms_iou_threshold is not None and len(boxes) > 1:
+            order = self._nms(boxes, confidences, class_ids, self.nms_iou_threshold)
+            boxes, confidences, class_ids = boxes[order], confidences[order], class_ids[order]
+
+        return [
+            Detection(
+                class_name=self.WANTED_CLASSES[cls_id],
+                confidence=conf,
+                bbox=tuple(bbox),
+            )
+            for bbox, conf, cls_id in zip(
+                boxes.tolist(), confidences.tolist(), class_ids.tolist(), strict=True
             )
+        ]
+
+    @staticmethod
+    def _nms(
+        boxes: np.ndarray,
+        confidences: np.ndarray,
+        class_ids: np.ndarray,
+        iou_threshold: float,
+    ) -> np.ndarray:
+        """
+        Class-wise greedy non-maximum suppression. Returns the indices of the kept
+        boxes, sorted by descending confidence.
+        """
+        # shift the boxes of each class apart, so boxes of different classes never overlap
+        offset = class_ids[:, None] * (float(boxes.max()) + 1.0)
+        shifted = boxes + offset
+        areas = (shifted[:, 2] - shifted[:, 0]) * (shifted[:, 3] - shifted[:, 1])
+
+        order = np.argsort(-confidences, kind="stable")
+        keep = []
+        while order.size:
+            best, rest = order[0], order[1:]
+            keep.append(best)
+
+            x1 = np.maximum(shifted[best, 0], shifted[rest, 0])
+            y1 = np.maximum(shifted[best, 1], shifted[rest, 1])
+            x2 = np.minimum(shifted[best, 2], shifted[rest, 2])
+            y2 = np.minimum(shifted[best, 3], shifted[rest, 3])
+            inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+            iou = inter / np.maximum(areas[best] + areas[rest] - inter, 1e-9)
+
+            order = rest[iou <= iou_threshold]
+
+        return np.array(keep, dtype=np.int64)
+
+    @staticmethod
+    def _load_rgb(image: Image.Image, min_size: tuple[int, int]) -> Image.Image:
+        """
+        Returns the RGB pixels of the image. Lazy JPEG files are decoded on a separate
+        handle by the DCT scaler, directly at the smallest scale that is still at least
+        ``min_size`` (the passed image object itself stays untouched).
+        """
+        if isinstance(image, ImageFile.ImageFile) and image.tile and getattr(image, "filename", ""):
+            with Image.open(image.filename) as source:
+                source.draft("RGB", min_size)
+                return source.convert("RGB")
+        return image.convert("RGB")
 
-        # Persist to filesystem (atomic write) and memory cache
-        try:
-            serial = [self._detection_to_dict(d) for d in result]
-            tmp_path = cache_file.with_suffix(".tmp")
-            with open(tmp_path, "w", encoding="utf-8") as fh:
-                json.dump(serial, fh, ensure_ascii=False)
-            os.replace(tmp_path, cache_file)
-        except Exception as exc:  # do not raise for cache write failures
-            self.logger.warning("Failed to write cache file %s (%s)", cache_file, exc)
+    def _preprocess(self, image: Image.Image, orig_w: int, orig_h: int) -> tuple[int, int]:
+        """
+        Letterboxes the RGB image into the reusable input buffer (values 0..1, NCHW).
 
-        self._memory_cache[cache_key] = result
-        return result
+        orig_w/orig_h is the size before a reduced decode, so the geometry matches the
+        back-mapping of the boxes. Returns the padding (pad_x, pad_y).
+        """
+        return self.letterbox_into(self._input_buffer, image, orig_w, orig_h)
+
+    @classmethod
+    def prepare_input(cls, image: Image.Image) -> np.ndarray:
+        """
+        Returns a new model input tensor (1, 3, 640, 640) for the image, preprocessed
+        exactly like in detect(), e.g. for calibration data or benchmarks.
+        """
+        orig_w, orig_h = image.size
+        _, letterbox_size, _ = cls._letterbox_geometry(orig_w, orig_h)
+        buffer = np.empty((1, 3, cls.INPUT_SIZE, cls.INPUT_SIZE), dtype=np.float32)
+        cls.letterbox_into(buffer, cls._load_rgb(image, letterbox_size), orig_w, orig_h)
+        return buffer
+
+    @staticmethod
+    def letterbox_resize(image: Image.Image, size: tuple[int, int]) -> Image.Image:
+        """Scales the image to the letterbox size (a copy if it already has that size)."""
+        return image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    @classmethod
+    def letterbox_into(
+        cls, buffer: np.ndarray, image: Image.Image, orig_w: int, orig_h: int
+    ) -> tuple[int, int]:
+        """Letterboxes the RGB image into ``buffer``. Returns the padding (pad_x, pad_y)."""
+        _, (new_w, new_h), (pad_x, pad_y) = cls._letterbox_geometry(orig_w, orig_h)
+
+        resized = cls.letterbox_resize(image, (new_w, new_h))
+        pixels = np.asarray(resized).transpose(2, 0, 1)  # HWC -> CHW view, no copy
+
+        buffer.fill(cls.LETTERBOX_VALUE / 255.0)
+        np.multiply(
+            pixels,
+            np.float32(1.0 / 255.0),
+            out=buffer[0, :, pad_y : pad_y + new_h, pad_x : pad_x + new_w],
+        )
+        return pad_x, pad_y
 
     def clear_cache(self, key: str | None = None) -> None:
         """Clear the detector cache.
@@ -232,12 +613,14 @@ class ObjectDetector:
             bbox=tuple(float(x) for x in data["bbox"]),
         )
 
-    def _compute_image_fingerprint(self, image: Image.Image) -> str:
+    @staticmethod
+    def _compute_image_fingerprint(image: Image.Image, size: tuple[int, int] | None = None) -> str:
         """Compute a fast fingerprint for an image.
 
         Strategy: convert to RGB, create a small thumbnail (32x32) and compute
         MD5 over the thumbnail bytes combined with the original image size to
-        reduce collisions while remaining fast.
+        reduce collisions while remaining fast. ``size`` is the original size if the
+        image was decoded at a reduced scale.
         """
         # Use a small thumbnail to be fast but robust. Prefer the LANCZOS
         # resampling filter when available; otherwise fall back to the
@@ -252,6 +635,7 @@ class ObjectDetector:
         m = hashlib.md5()
         # include original size to reduce collisions for images with same
         # downsampled content
-        m.update(f"{image.size[0]}x{image.size[1]}".encode())
+        width, height = size or image.size
+        m.update(f"{width}x{height}".encode())
         m.update(thumb.tobytes())
         return m.hexdigest()
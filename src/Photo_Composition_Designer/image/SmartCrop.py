@@ -4,10 +4,12 @@ import colorsys
 import math
 from dataclasses import dataclass
 from hashlib import blake2b
+from typing import TYPE_CHECKING
 
 from PIL import Image, ImageDraw, ImageFont
 
-from .ObjectDetector import Detection
+if TYPE_CHECKING:
+    from .ObjectDetector import Detection
 
 
 @dataclass(frozen=True)
@@ -51,6 +53,12 @@ class SmartCrop:
 
     PADDING_FACTOR = 0.15
 
+    #
+    # Fast downscale: large reductions are first done by an integer box reduce()
+    # down to about REDUCING_GAP times the target size, the final step is LANCZOS.
+    #
+    REDUCING_GAP = 2.0
+
     DEFAULT_OBJECT_PRIORITIES = {
         "person": 5,
         "dog": 4,
@@ -78,17 +86,25 @@ class SmartCrop:
         "bird": 0.35,
     }
 
-    def __init__(self, object_priorities: dict[str, int] | None = None):
+    def __init__(
+        self,
+        object_priorities: dict[str, int] | None = None,
+        fast_downscale: bool = True,
+    ):
         """
         Initialize SmartCrop.
 
         Args:
             object_priorities:
                 Optional mapping of class name to priority.
+            fast_downscale:
+                Use two-stage resampling (integer reduce, then LANCZOS) for large
+                downscale ratios instead of a single full LANCZOS pass.
         """
         self.object_priorities = (
             object_priorities if object_priorities is not None else self.DEFAULT_OBJECT_PRIORITIES
         )
+        self.fast_downscale = fast_downscale
 
     def _calculate_effective_region(
         self,
@@ -319,6 +335,24 @@ class SmartCrop:
             detections,
         )
 
+    def get_crop_box(
+        self,
+        img_width: int,
+        img_height: int,
+        target_width: int,
+        target_height: int,
+        detections: list[Detection] | None = None,
+    ) -> tuple[int, int, int, int]:
+        """
+        Returns the crop box that crop() would use, without touching any pixels.
+        """
+        return self._get_crop_coordinates(
+            img_width=img_width,
+            img_height=img_height,
+            target_ratio=target_width / target_height,
+            detections=detections,
+        )
+
     def crop(
         self,
         image: Image.Image,
@@ -348,12 +382,22 @@ class SmartCrop:
             detections=detections,
         )
 
-        cropped = image.crop(crop_box)
+        if self.fast_downscale:
+            # resize straight from the crop box: no intermediate crop copy, and
+            # Pillow reduces by an integer factor before the final LANCZOS pass
+            resized = image.resize(
+                (target_width, target_height),
+                Image.Resampling.LANCZOS,
+                box=crop_box,
+                reducing_gap=self.REDUCING_GAP,
+            )
+        else:
+            cropped = image.crop(crop_box)
 
-        resized = cropped.resize(
-            (target_width, target_height),
-            Image.Resampling.LANCZOS,
-        )
+            resized = cropped.resize(
+                (target_width, target_height),
+                Image.Resampling.LANCZOS,
+            )
 
         return resized, crop_box
 
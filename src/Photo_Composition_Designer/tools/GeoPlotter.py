@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from pathlib import Path
 
 import geopandas as gpd
@@ -12,6 +13,15 @@ from shapely.geometry import Point
 from path_handler import get_base_path
 
 
+@lru_cache(maxsize=8)
+def read_shapefile(shapefile_path: Path) -> gpd.GeoDataFrame:
+    """
+    Reads a shapefile once per process. The data frames are only plotted, never
+    modified, so all maps (and all jobs of a batch run) share them.
+    """
+    return gpd.read_file(shapefile_path)
+
+
 class GeoPlotter:
     """
     Class for plotting a map section with optional layers such as federal states or bodies of water.
@@ -119,7 +129,7 @@ class GeoPlotter:
         :param edgecolor: Color of the edges.
         :param alpha: Transparency of the layer.
         """
-        gdf = gpd.read_file(shapefile_path)
+        gdf = read_shapefile(Path(shapefile_path))
         self.layers[name] = {
             "gdf": gdf,
             "color": color,
@@ -134,7 +144,7 @@ class GeoPlotter:
         :return: Plottable matplotlib.pyplot object.
         """
         # Shapefile für Ländergrenzen laden
-        world = gpd.read_file(self.shapefile_path)
+        world = read_shapefile(self.shapefile_path)
         size_marker = self.size_marker
 
         # Kartengrenzen berechnen
@@ -1,4 +1,25 @@
+from functools import lru_cache
+
+from config_cli_gui.configtypes.color import Color
+from config_cli_gui.configtypes.font import Font
+from PIL import ImageFont
+
+
 # --- geometry helpers -----------------------------------------------------
 def mm_to_px(mm: float | int, dpi: float | int = 300) -> int:
     """Convert millimeters to pixels based on DPI."""
     return int(round(float(mm) * dpi / 25.4))
+
+
+# --- font helpers ---------------------------------------------------------
+def get_image_font(font: Font, dpi: float | int) -> ImageFont.FreeTypeFont:
+    """
+    Cached Font.get_image_font(): the font file is loaded once per font, size and dpi
+    and reused for all pages (and all jobs of a batch run).
+    """
+    return _load_image_font(font.name, float(font.size), float(dpi))
+
+
+@lru_cache(maxsize=64)
+def _load_image_font(name: str, size: float, dpi: float) -> ImageFont.FreeTypeFont:
+    return Font(name, size, Color(0, 0, 0)).get_image_font(dpi)
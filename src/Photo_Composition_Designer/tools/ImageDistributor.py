@@ -1,14 +1,29 @@
+import math
 import random
+from bisect import bisect_left, bisect_right
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from Photo_Composition_Designer.common.AssignmentManifest import AssignmentManifest
 from Photo_Composition_Designer.common.Photo import Photo
 
 
 class ImageDistributor:
+    # Standard-Obergrenze der Abweichung von der Zielgröße in distribute_optimal
+    MAX_DEFAULT_DEVIATION = 32
+
     def __init__(self, photos: list[Photo], distributions_count: int):
         self.photos = photos
-        self.sorted_photos = sorted(photos, key=lambda photo: photo.get_date() or datetime.min)
+
+        # Datum jedes Fotos nur einmal lesen (EXIF), danach parallel zu sorted_photos halten
+        dated_photos = sorted(
+            ((photo.get_date() or datetime.min, idx, photo) for idx, photo in enumerate(photos)),
+            key=lambda item: (item[0], item[1]),
+        )
+        self.sorted_photos = [photo for _, _, photo in dated_photos]
+        self.sorted_dates: list[datetime] = [date for date, _, _ in dated_photos]
 
         self.distribution_count = distributions_count
 
@@ -72,13 +87,13 @@ class ImageDistributor:
         Bilder eines Tages können auf mehrere Gruppen aufgeteilt werden.
         """
         grouped_images = []
-        date_groups = defaultdict(list)
+        date_groups = defaultdict(deque)
 
         # Gruppiere Bilder nach ihrem Datum
-        for img in self.sorted_photos:
-            date_groups[img.get_date()].append(img)
+        for date, img in zip(self.sorted_dates, self.sorted_photos):
+            date_groups[date].append(img)
 
-        sorted_dates = sorted(date_groups.keys())
+        sorted_dates = deque(sorted(date_groups.keys()))
         remaining_images = sum(len(v) for v in date_groups.values())
         remaining_groups = self.distribution_count
 
@@ -88,9 +103,9 @@ class ImageDistributor:
             current_date = sorted_dates[0]
 
             # Füge das erste Bild des Tages hinzu
-            current_group.append(date_groups[current_date].pop(0))
+            current_group.append(date_groups[current_date].popleft())
             if not date_groups[current_date]:
-                sorted_dates.pop(0)  # Datum entfernen, wenn keine Bilder mehr vorhanden sind
+                sorted_dates.popleft()  # Datum entfernen, wenn keine Bilder mehr vorhanden sind
 
             while sorted_dates:
                 next_date = sorted_dates[0]
@@ -105,9 +120,9 @@ class ImageDistributor:
                     # Gruppe hat das erlaubte Maximum erreicht
                     break
                 else:
-                    current_group.append(date_groups[next_date].pop(0))
+                    current_group.append(date_groups[next_date].popleft())
                     if not date_groups[next_date]:
-                        sorted_dates.pop(0)
+                        sorted_dates.popleft()
 
             grouped_images.append(current_group)
             remaining_images -= len(current_group)
@@ -120,6 +135,73 @@ class ImageDistributor:
 
         return grouped_images
 
+    def distribute_optimal(
+        self, max_deviation: int | None = None, day_split_penalty: float | None = None
+    ) -> list[list[Photo]]:
+        """
+        Verteilt die sortierten Bilder global optimal auf zusammenhängende Gruppen.
+
+        Minimiert per dynamischer Programmierung die Summe der quadratischen Abweichungen
+        von der Zielgröße n / k und bestraft jede Gruppengrenze, die einen Tag aufteilt.
+        Die Gruppengröße ist auf Zielgröße ± max_deviation begrenzt. Pro Gruppe wird nur
+        über die w = 2·max_deviation + 1 erlaubten Größen iteriert, jeweils mit Vektoren
+        der Länge n + 1: Laufzeit O(n·k·w), Speicher O(n·k).
+        Das Ergebnis ist deterministisch.
+
+        Args:
+            max_deviation: Erlaubte Abweichung von der Zielgröße pro Gruppe.
+                Standard: die Hälfte der Zielgröße, mindestens 2 und höchstens
+                MAX_DEFAULT_DEVIATION.
+            day_split_penalty: Kosten für das Aufteilen eines Tages auf zwei Gruppen,
+                in Einheiten der quadratischen Abweichung. Standard: die Zielgröße.
+        """
+        n = len(self.sorted_photos)
+        k = self.distribution_count
+        if k <= 0:
+            return []
+        if n == 0:
+            return [[] for _ in range(k)]
+
+        target = n / k
+        if max_deviation is None:
+            max_deviation = max(2, min(math.ceil(target / 2), self.MAX_DEFAULT_DEVIATION))
+        if day_split_penalty is None:
+            day_split_penalty = target
+
+        min_size = max(0, math.floor(target) - max_deviation)
+        max_size = min(n, math.ceil(target) + max_deviation)
+
+        # Strafe für Grenzen vor Bild i, wenn Bild i-1 und i vom selben Tag sind
+        days = np.array([date.toordinal() for date in self.sorted_dates])
+        split_penalty = np.zeros(n + 1)
+        split_penalty[1:n] = np.where(days[1:] == days[:-1], day_split_penalty, 0.0)
+
+        cost = np.full(n + 1, np.inf)
+        cost[0] = 0.0
+        choices = np.zeros((k, n + 1), dtype=np.int32)
+
+        for group in range(k):
+            best = np.full(n + 1, np.inf)
+            # best[i] = min über size von cost[i - size] + (size - target)²; bei
+            # Gleichstand gewinnt die größere Gruppe
+            for size in range(max_size, min_size - 1, -1):
+                candidate = cost[: n + 1 - size] + (size - target) ** 2
+                better = candidate < best[size:]
+                best[size:][better] = candidate[better]
+                choices[group, size:][better] = size
+            cost = best + split_penalty if group < k - 1 else best
+
+        # Rückverfolgung der optimalen Gruppengrößen
+        grouped_images = []
+        end = n
+        for group in range(k - 1, -1, -1):
+            size = int(choices[group, end])
+            grouped_images.append(self.sorted_photos[end - size : end])
+            end -= size
+        grouped_images.reverse()
+
+        return grouped_images
+
     def get_monday_of_same_week(self, date: datetime) -> datetime:
         return date - timedelta(days=date.weekday())
 
@@ -131,24 +213,32 @@ class ImageDistributor:
         return date1.isocalendar()[:2] == date2.isocalendar()[:2]
 
     def distribute_by_week(self, start_date: datetime) -> list[list[Photo]]:
+        """
+        Ordnet jedes Foto der Kalenderwoche (ab start_date) zu, in die sein Datum fällt.
+        Die Wochengrenzen werden per Binärsuche im sortierten Datums-Array bestimmt.
+        """
         grouped_images = []
+        days = [date.toordinal() for date in self.sorted_dates]
 
         for week in range(self.distribution_count):
             week_start = start_date + timedelta(weeks=week)
             week_end = week_start + timedelta(days=6)
 
             # Fotos auswählen, die in diese Woche passen
-            photos_in_week = [
-                photo
-                for photo in self.sorted_photos
-                if week_start.date() <= photo.get_date().date() <= week_end.date()
-            ]
+            first = bisect_left(days, week_start.toordinal())
+            last = bisect_right(days, week_end.toordinal())
 
-            # Entferne gefilterte Fotos aus der Hauptliste
-            self.sorted_photos = [
-                photo for photo in self.sorted_photos if photo not in photos_in_week
-            ]
-
-            grouped_images.append(photos_in_week)
+            grouped_images.append(self.sorted_photos[first:last])
 
         return grouped_images
+
+    def create_manifest(
+        self, grouped_images: list[list[Photo]], start_date: datetime
+    ) -> AssignmentManifest:
+        """
+        Erzeugt ein Zuordnungs-Manifest (virtuelle Wochenordner) aus einer Verteilung,
+        sodass die Bilder nicht in Wochenordner kopiert werden müssen.
+        """
+        return AssignmentManifest.from_groups(
+            grouped_images, start_date, weeks_count=self.distribution_count
+        )
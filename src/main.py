@@ -7,9 +7,6 @@ Automatically detects whether to run CLI or GUI based on how the application is
 import os
 import sys
 
-import Photo_Composition_Designer.cli.cli as _force_cli_import
-import Photo_Composition_Designer.gui.gui as _force_gui_import
-
 
 def is_console_attached():
     """
@@ -100,7 +97,10 @@ def main():
 def run_cli():
     """Launch the CLI interface."""
     try:
-        _force_cli_import.main()
+        # imported on demand: the CLI does not need to load the GUI toolkit and vice versa
+        import Photo_Composition_Designer.cli.cli as cli
+
+        cli.main()
     except ImportError as e:
         print(f"Error importing CLI module: {e}")
         sys.exit(1)
@@ -111,7 +111,9 @@ def run_cli():
 
 def run_gui():
     try:
-        _force_gui_import.main()
+        import Photo_Composition_Designer.gui.gui as gui
+
+        gui.main()
     except Exception as e:
         print(f"Error running GUI: {e}")
         print("Falling back to CLI interface...")
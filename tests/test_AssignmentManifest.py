@@ -0,0 +1,61 @@
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from Photo_Composition_Designer.common.AssignmentManifest import AssignmentManifest, ManifestWeek
+from Photo_Composition_Designer.common.Photo import Photo
+
+
+def create_mock_photo(file_path: Path):
+    mock_photo = MagicMock(spec=Photo)
+    mock_photo.file_path = file_path
+    return mock_photo
+
+
+@pytest.mark.parametrize("suffix", [".json", ".csv"])
+def test_manifest_roundtrip(tmp_path, suffix):
+    library = tmp_path / "library"
+    files = [library / "2025" / "01" / f"img_{i}.jpg" for i in range(3)]
+    outside_file = tmp_path.parent / "elsewhere.jpg"
+
+    manifest = AssignmentManifest(
+        [
+            ManifestWeek("00_Dec-29", files[:2], "First week"),
+            ManifestWeek("01_Jan-05", []),
+            ManifestWeek("02_Jan-12", [files[2], outside_file]),
+        ]
+    )
+    manifest_file = manifest.save(library / f"manifest{suffix}")
+
+    loaded = AssignmentManifest.load(manifest_file)
+
+    assert loaded.week_names() == ["00_Dec-29", "01_Jan-05", "02_Jan-12"]
+    assert loaded.get("00_Dec-29").files == [f.resolve() for f in files[:2]]
+    assert loaded.get("00_Dec-29").description == "First week"
+    assert loaded.get("01_Jan-05").files == []
+    assert loaded.get("02_Jan-12").files == [files[2].resolve(), outside_file.resolve()]
+    assert loaded.index("02_Jan-12") == 2
+
+
+def test_manifest_stores_relative_paths(tmp_path):
+    file = tmp_path / "sub" / "img.jpg"
+    manifest = AssignmentManifest([ManifestWeek("00_Dec-29", [file])])
+    manifest_file = manifest.save(tmp_path / "manifest.json")
+
+    assert '"sub/img.jpg"' in manifest_file.read_text(encoding="utf-8")
+
+
+def test_manifest_from_groups():
+    groups = [[create_mock_photo(Path("a.jpg")), create_mock_photo(Path("b.jpg"))], []]
+    manifest = AssignmentManifest.from_groups(groups, datetime(2025, 12, 29), weeks_count=3)
+
+    assert manifest.week_names() == ["00_Dec-29", "01_Jan-05", "02_Jan-12"]
+    assert manifest.get("00_Dec-29").files == [Path("a.jpg"), Path("b.jpg")]
+    assert len(manifest) == 3
+
+
+def test_manifest_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        AssignmentManifest.load(tmp_path / "missing.json")
@@ -2,6 +2,7 @@ import holidays
 import pytest
 
 from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.image import CalendarRenderer as calendar_renderer
 from Photo_Composition_Designer.image.CalendarRenderer import CalendarRenderer
 
 from .TestHelper import temp_dir
@@ -132,3 +133,45 @@ def test_get_combined_holidays_includes_subdivision_holidays():
     sample_date = next(iter(subdiv_only))
     assert sample_date in combined
     assert combined.get(sample_date) == sn.get(sample_date)
+
+
+def test_holiday_table_is_cached(tmp_path, monkeypatch):
+    from datetime import date
+
+    monkeypatch.setattr(calendar_renderer, "HOLIDAY_CACHE_DIR", tmp_path)
+    calendar_renderer.load_holidays.cache_clear()
+    try:
+        built = CalendarRenderer.get_combined_holidays(2025, "DE", ["SN"], language="de_DE")
+        assert len(list(tmp_path.glob("DE-SN-2025-de-*.json"))) == 1
+
+        # a new process (empty memory cache) loads the table from disk
+        calendar_renderer.load_holidays.cache_clear()
+
+        def fail(*args):
+            raise AssertionError("holiday table rebuilt")
+
+        monkeypatch.setattr(calendar_renderer, "_build_holidays", fail)
+        loaded = CalendarRenderer.get_combined_holidays(2025, "DE", ["SN"], language="de_DE")
+        assert dict(loaded) == dict(built)
+        assert "Neujahr" in loaded.get(date(2025, 1, 1))
+        # same process: no file access
+        assert calendar_renderer.load_holidays.cache_info().hits == 0
+        CalendarRenderer.get_combined_holidays(2025, "DE", ["SN"], language="de_DE")
+        assert calendar_renderer.load_holidays.cache_info().hits == 1
+    finally:
+        calendar_renderer.load_holidays.cache_clear()
+
+
+def test_partial_holiday_table_is_not_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(calendar_renderer, "HOLIDAY_CACHE_DIR", tmp_path)
+    calendar_renderer.load_holidays.cache_clear()
+    try:
+        # "XX" is no subdivision of DE: its holidays are missing from the table
+        table = calendar_renderer.load_holidays(2025, "DE", ("SN", "XX"), "de")
+        assert table
+        assert not list(tmp_path.glob("*.json"))
+
+        calendar_renderer.load_holidays(2025, "DE", ("SN",), "de")
+        assert len(list(tmp_path.glob("*.json"))) == 1
+    finally:
+        calendar_renderer.load_holidays.cache_clear()
@@ -1,7 +1,17 @@
+import random
+from operator import itemgetter
+
 import pytest
 from PIL import Image, ImageDraw, ImageFont
 
-from Photo_Composition_Designer.image.CollageRenderer import CollageRenderer
+from Photo_Composition_Designer.image.CollageRenderer import (
+    CollageRenderer,
+    linear_partition,
+    linear_partition_batch,
+    linear_partition_table,
+    rounded_corner_mask,
+)
+from Photo_Composition_Designer.image.ObjectDetector import Detection
 
 from .TestHelper import temp_dir
 
@@ -124,3 +134,200 @@ def test_generate_different_layouts(num_images, layout, temp_dir):
 
     # Optionally save for debugging:
     collage.save(temp_dir / f"{num_images}_{'_'.join(layout)}.jpg")
+
+
+# ────────────────────────────────────────────────────────────────
+# Linear partition: NumPy table vs. reference implementation
+# ────────────────────────────────────────────────────────────────
+def reference_linear_partition_table(seq, k):
+    n = len(seq)
+    table = [[0] * k for x in range(n)]
+    solution = [[0] * (k - 1) for x in range(n - 1)]
+    for i in range(n):
+        table[i][0] = seq[i] + (table[i - 1][0] if i else 0)
+    for j in range(k):
+        table[0][j] = seq[0]
+    for i in range(1, n):
+        for j in range(1, k):
+            table[i][j], solution[i - 1][j - 1] = min(
+                ((max(table[x][j - 1], table[i][0] - table[x][0]), x) for x in range(i)),
+                key=itemgetter(0),
+            )
+    return table, solution
+
+
+def test_linear_partition_table_matches_reference():
+    rng = random.Random(7)
+    for _ in range(200):
+        n = rng.randint(1, 20)
+        k = rng.randint(1, 6)
+        # mix of floats and small integers to provoke ties
+        seq = [rng.choice([rng.random() * 3, rng.randint(1, 3)]) for _ in range(n)]
+
+        table, solution = linear_partition_table(seq, k)
+        expected_table, expected_solution = reference_linear_partition_table(seq, k)
+
+        assert table.tolist() == expected_table
+        assert solution.tolist() == expected_solution
+
+
+def test_linear_partition_batch():
+    seq = [1.5, 0.7, 0.7, 1.5, 1.5, 0.7, 1.3, 0.9]
+    data = [f"img{i}" for i in range(len(seq))]
+    ks = [0, 1, 2, 3, 5, 9]
+
+    batch = linear_partition_batch(seq, ks, data)
+
+    assert set(batch) == set(ks)
+    for k in ks:
+        assert list(batch[k]) == list(linear_partition(seq, k, data))
+    assert [len(row) for row in batch[3]] == [3, 2, 3]
+
+
+# ────────────────────────────────────────────────────────────────
+# Layout search: scored candidates and memoization
+# ────────────────────────────────────────────────────────────────
+@pytest.mark.parametrize("layout", [group_6, group_9, group_11])
+def test_layout_search_not_worse_than_heuristic(layout):
+    images = [create_test_image(i, t) for i, t in enumerate(layout)]
+    generator = CollageRenderer(width=500, height=300, spacing=10)
+
+    candidates = generator._layoutCandidates(images, 500, 300)
+    heuristic = generator._buildLayoutCandidate(images, 500, 300, next(candidates))
+    best = generator._generateLayout(images, 500, 300)
+
+    assert generator._scoreLayout(best, 500, 300) <= generator._scoreLayout(heuristic, 500, 300)
+
+
+def test_layout_choice_is_cached():
+    generator = CollageRenderer(width=500, height=300, spacing=10)
+    first = generator.generate([create_test_image(i, t) for i, t in enumerate(group_9)])
+    assert len(generator._layout_choice_cache) == 1
+
+    # new image objects with identical geometry reuse the cached choice
+    second = generator.generate([create_test_image(i, t) for i, t in enumerate(group_9)])
+    assert len(generator._layout_choice_cache) == 1
+    assert first.tobytes() == second.tobytes()
+
+
+class CornerDetector:
+    """Finds a person in the left or right half, depending on the image's first pixel."""
+
+    def detect(self, image):
+        w, h = image.size
+        x = 0 if image.getpixel((0, 0))[0] > 128 else w / 2
+        return [Detection("person", 0.9, (x, 0, x + w / 2, h))]
+
+
+def test_layout_choice_depends_on_detections():
+    generator = CollageRenderer(width=500, height=300, spacing=10, object_detector=CornerDetector())
+    left = [create_test_image(i, t) for i, t in enumerate(group_9)]
+    generator.generate(left)
+    generator.generate([create_test_image(i, t) for i, t in enumerate(group_9)])
+    assert len(generator._layout_choice_cache) == 1
+
+    # same sizes and importance, but the subjects are elsewhere: scored separately
+    right = [Image.new("RGB", img.size, (0, 0, 0)) for img in left]
+    generator.generate(right)
+    assert len(generator._layout_choice_cache) == 2
+
+
+def test_image_memo_ignores_recycled_ids():
+    generator = CollageRenderer(width=500, height=300, spacing=10)
+    old, new = create_test_image(0, "L"), create_test_image(1, "P")
+    # an entry left behind by another image that had the same id
+    generator._importance[id(new)] = (old, 5.0)
+
+    assert generator._calculateImageImportance(new) == 1.0
+    assert generator._calculateImageImportance(old) == 1.0
+
+    generator.generate([old, new])
+    assert generator._importance == {}
+    assert generator._detections == {}
+    assert generator._partition_cache == {}
+
+
+def test_linear_partition_more_groups_than_items():
+    assert linear_partition([1.0, 2.0], 3, ["a", "b"]) == [["a"], ["b"]]
+
+
+# ────────────────────────────────────────────────────────────────
+# Rounded corners: cached masks, applied once per collage
+# ────────────────────────────────────────────────────────────────
+def test_rounded_corner_mask_is_cached():
+    rounded_corner_mask.cache_clear()
+    mask = rounded_corner_mask(120, 80, 10)
+
+    assert mask.mode == "L"
+    assert mask.size == (120, 80)
+    assert mask.getpixel((0, 0)) == 255
+    assert mask.getpixel((60, 40)) == 0
+    assert rounded_corner_mask(120, 80, 10) is mask
+    assert rounded_corner_mask.cache_info().hits == 1
+
+
+def test_generate_with_rounded_corners():
+    background = (200, 200, 0)
+    generator = CollageRenderer(
+        width=500, height=300, spacing=10, color=background, rounded_corners=True
+    )
+    collage = generator.generate([create_test_image(i, t) for i, t in enumerate(group_6)])
+
+    assert collage.mode == "RGB"
+    assert collage.getpixel((0, 0)) == background
+    assert collage.getpixel((499, 299)) == background
+    assert collage.getpixel((10, 10)) != background
+
+
+# ────────────────────────────────────────────────────────────────
+# Rendering directly into a target canvas
+# ────────────────────────────────────────────────────────────────
+def test_generate_into_canvas():
+    images = [create_test_image(i, t) for i, t in enumerate(group_9)]
+    generator = CollageRenderer(
+        width=500, height=300, spacing=10, color=(200, 200, 0), rounded_corners=True
+    )
+    standalone = generator.generate(images)
+
+    page = Image.new("RGB", (600, 400), (0, 0, 255))
+    result = generator.generate(images, canvas=page, offset=(40, 30))
+
+    assert result is page
+    assert page.crop((40, 30, 540, 330)).tobytes() == standalone.tobytes()
+    assert page.getpixel((39, 29)) == (0, 0, 255)
+    assert page.getpixel((540, 330)) == (0, 0, 255)
+
+
+# ────────────────────────────────────────────────────────────────
+# Validation without decoding, per-cell decode of file based images
+# ────────────────────────────────────────────────────────────────
+def test_file_images_are_not_decoded_by_validation(tmp_path):
+    paths = []
+    for i, t in enumerate(group_6):
+        path = tmp_path / f"img_{i}.jpg"
+        create_test_image(i, t).save(path)
+        paths.append(path)
+    images = [Image.open(path) for path in paths]
+
+    generator = CollageRenderer(width=500, height=300, spacing=10)
+    assert generator._filter_valid(images) == images
+    collage = generator.generate(images)
+
+    assert collage.size == (500, 300)
+    # the caller's images are still lazy: pixels were decoded from separate handles
+    assert all(img.tile for img in images)
+
+
+def test_truncated_file_leaves_cell_empty(tmp_path):
+    background = (200, 200, 0)
+    good = tmp_path / "good.jpg"
+    Image.effect_noise((600, 400), 64).convert("RGB").save(good)
+    truncated = tmp_path / "truncated.jpg"
+    data = good.read_bytes()
+    truncated.write_bytes(data[: len(data) // 2])
+
+    generator = CollageRenderer(width=500, height=300, spacing=10, color=background)
+    collage = generator.generate([Image.open(good), Image.open(truncated)])
+
+    assert collage.size == (500, 300)
+    assert background in {collage.getpixel((100, 150)), collage.getpixel((400, 150))}
@@ -1,7 +1,12 @@
+import shutil
 from pathlib import Path
 
+from PIL import Image
+
+from Photo_Composition_Designer.common.AssignmentManifest import AssignmentManifest, ManifestWeek
 from Photo_Composition_Designer.config.config import ConfigParameterManager
 from Photo_Composition_Designer.core.base import CompositionDesigner
+from Photo_Composition_Designer.tools.ImageDistributor import ImageDistributor
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
@@ -31,3 +36,130 @@ class TestCompositionDesigner:
         designer = CompositionDesigner(config)
 
         designer.generate_compositions_from_folders()
+
+    def test_generate_from_assignment_manifest(self, tmp_path):
+        """
+        Renders virtual week folders defined by an assignment manifest
+        directly from the original photo files.
+        """
+        photos_dir = PROJECT_ROOT / "images"
+        library_dir = tmp_path / "library"
+        library_dir.mkdir()
+
+        manifest = AssignmentManifest(
+            [
+                ManifestWeek("00_Dec-22", [photos_dir / "title" / "image_02.jpg"]),
+                ManifestWeek(
+                    "01_Dec-29",
+                    [
+                        photos_dir / "week_4" / "image_08.jpg",
+                        photos_dir / "week_4" / "image_09.jpg",
+                    ],
+                    "Manifest description",
+                ),
+                ManifestWeek("02_Jan-05", []),
+            ]
+        )
+        manifest_file = manifest.save(library_dir / "manifest.json")
+
+        config = ConfigParameterManager(persist_last_used=False)
+        config.size.dpi.value = 30
+        config.size.jpgQuality.value = 20
+        config.layout.objectRecognition.value = False
+        config.layout.generatePdf.value = False
+        config.general.photoDirectory.value = str(library_dir)
+        config.general.assignmentManifest.value = str(manifest_file)
+
+        designer = CompositionDesigner(config)
+        assert designer.get_week_names() == ["00_Dec-22", "01_Dec-29", "02_Jan-05"]
+
+        designer.generate_compositions_from_folders()
+
+        output_files = sorted(p.name for p in designer.outputDir.glob("*.jpg"))
+        assert output_files == ["00_Dec-22.jpg", "01_Dec-29.jpg"]
+        # no week folders are created in the library
+        assert not any(p.is_dir() for p in library_dir.iterdir())
+
+    def test_manifest_relative_to_config_file(self, tmp_path, monkeypatch):
+        """
+        Relative paths in a config file refer to the directory of the config file,
+        not to the working directory.
+        """
+        project_dir = tmp_path / "project"
+        (project_dir / "photos").mkdir(parents=True)
+        AssignmentManifest(
+            [ManifestWeek("00_Dec-22", [PROJECT_ROOT / "images" / "title" / "image_02.jpg"])]
+        ).save(project_dir / "manifest.json")
+
+        config = ConfigParameterManager(persist_last_used=False)
+        config.layout.objectRecognition.value = False
+        config.general.photoDirectory.value = "photos"
+        config.general.assignmentManifest.value = "manifest.json"
+        config.save_to_file(str(project_dir / "config.yaml"))
+
+        monkeypatch.chdir(tmp_path)
+        config = ConfigParameterManager(str(project_dir / "config.yaml"), persist_last_used=False)
+        designer = CompositionDesigner(config)
+
+        assert designer.photoDir == (project_dir / "photos").resolve()
+        assert designer.manifest_path == (project_dir / "manifest.json").resolve()
+        assert designer.get_week_names() == ["00_Dec-22"]
+
+    def test_distribute_twice_recursive(self, tmp_path):
+        """
+        Distributing again with nested folders enabled does not pick up the copies
+        in the week folders of the first distribution. Other folders are scanned,
+        even if their names look similar to week folders.
+        """
+        photos_dir = tmp_path / "photos"
+        shutil.copytree(PROJECT_ROOT / "images" / "week_1", photos_dir / "2024" / "05")
+        shutil.copytree(PROJECT_ROOT / "images" / "week_4", photos_dir / "2024_Italy-01")
+        photo_count = len(list(photos_dir.glob("*/**/*.jpg")))
+
+        config = ConfigParameterManager(persist_last_used=False)
+        config.layout.objectRecognition.value = False
+        config.general.photoDirectory.value = str(photos_dir)
+        config.general.recursiveScan.value = True
+        start_date = config.calendar.startDate.value
+
+        for _ in range(2):
+            designer = CompositionDesigner(config)
+            photos = designer.get_photos_to_distribute()
+            assert len(photos) == photo_count
+            groups = ImageDistributor(photos, 2).distribute_equally()
+            folders = designer.copy_to_week_folders(groups, start_date, 2)
+
+        assert [folder.name for folder in folders] == [
+            AssignmentManifest.week_name(week, start_date) for week in range(2)
+        ]
+        assert sum(len(list(folder.iterdir())) for folder in folders) == photo_count
+
+    def test_extra_resolutions(self, tmp_path):
+        """
+        Writes downscaled versions of each page from the same render.
+        """
+        photos_dir = PROJECT_ROOT / "images"
+        manifest_file = AssignmentManifest(
+            [ManifestWeek("00_Dec-22", [photos_dir / "title" / "image_02.jpg"])]
+        ).save(tmp_path / "manifest.json")
+
+        config = ConfigParameterManager(persist_last_used=False)
+        config.size.dpi.value = 60
+        config.layout.objectRecognition.value = False
+        config.layout.generatePdf.value = False
+        config.general.photoDirectory.value = str(tmp_path)
+        config.general.assignmentManifest.value = str(manifest_file)
+        config.output.extraResolutions.value = "web:30,thumb:15,large:90"
+
+        designer = CompositionDesigner(config)
+        # larger than the page: skipped
+        assert [r.name for r in designer.output_resolutions] == ["web", "thumb"]
+
+        designer.generate_compositions_from_folders()
+
+        with Image.open(designer.outputDir / "00_Dec-22.jpg") as page:
+            page_size = page.size
+        for name, factor in (("web", 2), ("thumb", 4)):
+            with Image.open(designer.outputDir / name / "00_Dec-22.jpg") as image:
+                assert image.size == (round(page_size[0] / factor), round(page_size[1] / factor))
+        assert not (designer.outputDir / "large").exists()
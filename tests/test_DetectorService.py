@@ -0,0 +1,131 @@
+import pickle
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from Photo_Composition_Designer.image.DetectorService import DetectorService
+from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector
+
+
+class FakeSession:
+    """ONNX session stand-in with a dynamic batch dimension: one person per image."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="images", shape=["batch", 3, 640, 640])]
+
+    def run(self, output_names, feed):
+        batch = len(feed["images"])
+        return [
+            np.tile(np.array([[[160, 160, 480, 480, 0.9, 0]]], dtype=np.float32), (batch, 1, 1))
+        ]
+
+
+class FakeDetector(ObjectDetector):
+    """Created in the (spawned) server process, so the session is replaced there."""
+
+    def __init__(self, **kwargs):
+        import onnxruntime as ort
+
+        ort.InferenceSession = FakeSession
+        super().__init__(**kwargs)
+
+
+class FailingOnceSession(FakeSession):
+    """The first inference run fails, e.g. an out of memory error of the provider."""
+
+    failed = False
+
+    def run(self, output_names, feed):
+        if not FailingOnceSession.failed:
+            FailingOnceSession.failed = True
+            raise MemoryError("out of memory")
+        return super().run(output_names, feed)
+
+
+class FailingOnceDetector(ObjectDetector):
+    def __init__(self, **kwargs):
+        import onnxruntime as ort
+
+        ort.InferenceSession = FailingOnceSession
+        super().__init__(**kwargs)
+
+
+def _service(tmp_path, detector_class=FakeDetector, **kwargs) -> DetectorService:
+    return DetectorService(
+        {"cache_dir": tmp_path, "model_path": "fake.onnx"},
+        detector_class=detector_class,
+        **kwargs,
+    )
+
+
+def test_remote_detect_matches_local(monkeypatch, tmp_path):
+    image = Image.new("RGB", (1280, 960), (40, 80, 120))
+
+    with _service(tmp_path / "server") as service:
+        remote = service.client().detect(image)
+        # a second client (e.g. another worker) is answered from the shared cache
+        assert service.client().detect(image) == remote
+        stats = service.stats()
+
+    assert stats["requests"] == 2
+    assert stats["cache_hits"] == 1
+    assert stats["inferences"] == 1
+
+    import onnxruntime as ort
+
+    monkeypatch.setattr(ort, "InferenceSession", FakeSession)
+    local = ObjectDetector(model_path="fake.onnx", cache_dir=tmp_path / "local").detect(image)
+    assert remote == local
+    assert remote[0].class_name == "person"
+
+
+def test_concurrent_requests_are_batched(tmp_path):
+    images = [Image.new("RGB", (800, 600), (i * 40, 0, 0)) for i in range(4)]
+    results = [None] * len(images)
+
+    with _service(tmp_path, batch_size=4, batch_timeout=1.0) as service:
+        clients = [service.client() for _ in images]
+
+        def run(i):
+            results[i] = clients[i].detect(images[i])
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(images))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = service.stats()
+
+    assert all(len(result) == 1 for result in results)
+    assert stats["inferences"] == 4
+    assert stats["batches"] < 4
+
+
+def test_client_is_picklable(tmp_path):
+    with _service(tmp_path) as service:
+        client = service.client()
+        client.detect(Image.new("RGB", (640, 480)))
+
+        copy = pickle.loads(pickle.dumps(client))
+        assert copy.detect(Image.new("RGB", (640, 480))) == client.detect(
+            Image.new("RGB", (640, 480))
+        )
+
+    assert not service.running
+
+
+def test_failed_batch_is_reported_to_client(tmp_path):
+    with _service(tmp_path, detector_class=FailingOnceDetector) as service:
+        client = service.client()
+        with pytest.raises(RuntimeError, match="out of memory"):
+            client.detect(Image.new("RGB", (640, 480), (255, 0, 0)))
+
+        # the server keeps serving after the failed batch
+        assert len(client.detect(Image.new("RGB", (640, 480), (0, 255, 0)))) == 1
+        assert service.running
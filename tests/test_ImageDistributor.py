@@ -1,4 +1,8 @@
+import time
+import tracemalloc
 from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -130,3 +134,102 @@ class TestImageDistributor:
         assert len(distributed_images[11]) == 3
         assert len(distributed_images[12]) == 4
         assert len(distributed_images[13]) == 1
+
+    def test_create_manifest(self):
+        photos = [self.create_mock_photo(date) for date in self.image_data.values()]
+        for idx, photo in enumerate(photos):
+            photo.file_path = Path(f"image_{idx}.jpg")
+        distributor = ImageDistributor(photos, 6)
+        distributed_images = distributor.distribute_equally()
+
+        manifest = distributor.create_manifest(distributed_images, datetime(2024, 12, 30))
+
+        assert len(manifest) == 6
+        assert manifest.week_names()[0] == "00_Dec-30"
+        assert sum(len(week.files) for week in manifest) == 30
+        assert manifest.weeks[0].files == [photo.file_path for photo in distributed_images[0]]
+
+    def test_distribute_by_week_reads_dates_once(self):
+        photos = [self.create_mock_photo(date) for date in self.image_data.values()]
+        distributor = ImageDistributor(photos, 55)
+        distributor.distribute_by_week(datetime(2024, 12, 30, 1, 1, 1))
+        distributor.distribute_group_matching_dates()
+
+        for photo in photos:
+            assert photo.get_date.call_count == 1
+
+    def test_distribute_by_week_keeps_order(self):
+        photos = [self.create_mock_photo(date) for date in self.image_data.values()]
+        distributor = ImageDistributor(photos, 55)
+        distributed_images = distributor.distribute_by_week(datetime(2024, 12, 30))
+
+        flattened = [photo for group in distributed_images for photo in group]
+        dates = [photo.get_date() for photo in flattened]
+        assert dates == sorted(dates)
+        # repeated calls yield the same result
+        assert distributor.distribute_by_week(datetime(2024, 12, 30)) == distributed_images
+
+    def test_distribute_optimal(self):
+        photos = [self.create_mock_photo(date) for date in self.image_data.values()]
+        distributor = ImageDistributor(photos, 6)
+        distributed_images = distributor.distribute_optimal()
+
+        assert len(distributed_images) == 6
+        assert sum(len(group) for group in distributed_images) == 30
+        # Reihenfolge bleibt erhalten
+        flattened = [photo for group in distributed_images for photo in group]
+        assert flattened == distributor.sorted_photos
+        # Ergebnis ist reproduzierbar
+        assert distributor.distribute_optimal() == distributed_images
+        # Die Gruppengröße bleibt im erlaubten Fenster um die Zielgröße 5
+        assert all(3 <= len(group) <= 7 for group in distributed_images)
+
+    def test_distribute_optimal_keeps_days_together(self):
+        # 5 Tage mit 2, 4, 3, 3, 3 Bildern auf 5 Gruppen (Zielgröße 3)
+        day_sizes = {6: 2, 7: 4, 8: 3, 9: 3, 10: 3}
+        dates = [
+            datetime(2025, 1, day, 9 + hour)
+            for day, size in day_sizes.items()
+            for hour in range(size)
+        ]
+        photos = [self.create_mock_photo(date) for date in dates]
+        distributor = ImageDistributor(photos, 5)
+
+        # ohne Strafe: exakt gleich große Gruppen, Tage werden aufgeteilt
+        distributed_images = distributor.distribute_optimal(day_split_penalty=0)
+        assert [len(group) for group in distributed_images] == [3, 3, 3, 3, 3]
+
+        # mit Strafe: jeder Tag bildet genau eine Gruppe
+        distributed_images = distributor.distribute_optimal(day_split_penalty=10)
+        assert [len(group) for group in distributed_images] == [2, 4, 3, 3, 3]
+        for group in distributed_images:
+            assert len({photo.get_date().date() for photo in group}) == 1
+
+    def test_distribute_optimal_large_library(self):
+        # 10k Fotos auf 2 Gruppen: das Größenfenster bleibt klein, es werden keine
+        # (n+1)×w Matrizen angelegt
+        photos = [
+            SimpleNamespace(get_date=lambda i=i: datetime(2024, 1, 1) + timedelta(hours=i))
+            for i in range(10_000)
+        ]
+        distributor = ImageDistributor(photos, 2)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        distributed_images = distributor.distribute_optimal()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # die Grenze liegt am nächsten Tageswechsel (24 Fotos pro Tag)
+        assert [len(group) for group in distributed_images] == [4992, 5008]
+        assert elapsed < 5.0
+        assert peak < 10 * 1024 * 1024
+
+    def test_distribute_optimal_more_groups_than_photos(self):
+        photos = [self.create_mock_photo(date) for date in list(self.image_data.values())[:3]]
+        distributor = ImageDistributor(photos, 5)
+        distributed_images = distributor.distribute_optimal()
+
+        assert len(distributed_images) == 5
+        assert sum(len(group) for group in distributed_images) == 3
@@ -0,0 +1,86 @@
+from PIL import Image
+
+from Photo_Composition_Designer.image.CollageRenderer import CollageRenderer
+from Photo_Composition_Designer.image.ImageSource import ImageSource
+from Photo_Composition_Designer.image.ObjectDetector import Detection
+
+
+def _save_image(path, size, color=(100, 150, 240)):
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def test_size_from_header(tmp_path):
+    source = ImageSource(_save_image(tmp_path / "landscape.jpg", (300, 200)))
+
+    assert source.size == (300, 200)
+    assert source.aspect == 1.5
+
+
+def test_known_size_skips_header(tmp_path):
+    # e.g. size taken from a metadata index: the file is not touched
+    source = ImageSource(tmp_path / "missing.jpg", size=(200, 300))
+
+    assert (source.width, source.height) == (200, 300)
+
+
+def test_open_decodes_on_demand(tmp_path):
+    source = ImageSource(_save_image(tmp_path / "red.png", (40, 30), (255, 0, 0)))
+
+    with source.open() as image:
+        assert image.getpixel((20, 15)) == (255, 0, 0)
+
+
+def test_collage_from_image_sources(tmp_path):
+    sources = [
+        ImageSource(_save_image(tmp_path / f"img_{i}.jpg", size))
+        for i, size in enumerate([(300, 200), (200, 300), (300, 200), (300, 200)])
+    ]
+
+    collage = CollageRenderer(width=500, height=300, spacing=10).generate(sources)
+
+    assert collage.size == (500, 300)
+    # cells were decoded and pasted onto the black background
+    assert collage.getbbox() is not None
+
+
+class FakeDetector:
+    """Finds a person in the center of every image."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect(self, image):
+        self.calls.append(image.size)
+        w, h = image.size
+        return [Detection("person", 0.9, (w / 4, h / 4, 3 * w / 4, 3 * h / 4))]
+
+
+def test_collage_from_image_sources_with_detector(tmp_path):
+    sources = [
+        ImageSource(_save_image(tmp_path / f"img_{i}.jpg", size))
+        for i, size in enumerate([(300, 200), (200, 300), (300, 200), (300, 200)])
+    ]
+    detector = FakeDetector()
+
+    collage = CollageRenderer(width=500, height=300, spacing=10, object_detector=detector).generate(
+        sources
+    )
+
+    assert collage.size == (500, 300)
+    assert collage.getbbox() is not None
+    # the scores of the layout search and the smart crop share one detection per image
+    assert len(detector.calls) == len(sources)
+
+
+def test_corrupted_source_is_removed(tmp_path):
+    broken = tmp_path / "broken.png"
+    _save_image(broken, (40, 30))
+    data = bytearray(broken.read_bytes())
+    data[data.index(b"IDAT") + 6] ^= 0xFF  # image data no longer matches its CRC
+    broken.write_bytes(bytes(data))
+
+    generator = CollageRenderer(width=500, height=300, spacing=10)
+    good = ImageSource(_save_image(tmp_path / "good.png", (40, 30)))
+
+    assert generator._filter_valid([good, ImageSource(broken)]) == [good]
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+from PIL import Image
+
+from Photo_Composition_Designer.core.ImageWriter import ImageWriter
+
+
+class BlockingImage:
+    """Stand-in page whose save() blocks until released."""
+
+    def __init__(self, release: threading.Event, saved: list):
+        self.release = release
+        self.saved = saved
+
+    def save(self, path, **kwargs):
+        self.release.wait(5)
+        self.saved.append(path)
+
+
+def test_pages_are_written(tmp_path):
+    with ImageWriter(max_workers=2) as writer:
+        for i in range(4):
+            writer.submit(Image.new("RGB", (64, 48), (i * 50, 0, 0)), tmp_path / f"{i}.jpg")
+
+    for i in range(4):
+        with Image.open(tmp_path / f"{i}.jpg") as image:
+            assert image.size == (64, 48)
+
+
+def test_backpressure_limits_pending_pages(tmp_path):
+    release = threading.Event()
+    saved = []
+    writer = ImageWriter(max_workers=1, max_pending=2)
+    submitted = []
+
+    def produce():
+        for i in range(4):
+            writer.submit(BlockingImage(release, saved), tmp_path / f"{i}.jpg")
+            submitted.append(i)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join(0.3)
+
+    # one page encoding, one waiting: the producer is blocked on the third page
+    assert producer.is_alive()
+    assert submitted == [0, 1]
+
+    release.set()
+    producer.join(5)
+    writer.close()
+    assert submitted == [0, 1, 2, 3]
+    assert len(saved) == 4
+
+
+def test_encoding_error_is_raised(tmp_path):
+    with pytest.raises(OSError):
+        with ImageWriter() as writer:
+            writer.submit(Image.new("RGB", (8, 8)), tmp_path / "missing" / "page.jpg")
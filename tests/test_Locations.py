@@ -40,3 +40,19 @@ class TestLocations:
 
         # Assert that the parsed output matches the expected result
         assert dict(locations.items()) == expected
+
+    def test_find_in_name(self, sample_file):
+        locations = Locations(sample_file)
+        locations["bad schandau"] = (50.9177, 14.1537)
+        locations["dresden altstadt"] = (51.0525, 13.7408)
+
+        assert locations.find_in_name("IMG_1234 Leipzig-Zentrum.jpg") == (51.3397, 12.3731)
+        assert locations.find_in_name("2024-05-01 Bad Schandau.jpg") == (50.9177, 14.1537)
+        # the first location in the name wins, the longer one at the same position
+        assert locations.find_in_name("chemnitz dresden.jpg") == (50.8278, 12.9214)
+        assert locations.find_in_name("Dresden Altstadt.jpg") == (51.0525, 13.7408)
+        assert locations.find_in_name("Dresden Neustadt.jpg") == (51.0504, 13.7373)
+        # whole words only
+        assert locations.find_in_name("dresdener_stollen.jpg") is None
+        assert locations.find_in_name("IMG_0001.jpg") is None
+        assert Locations("missing.ini").find_in_name("dresden.jpg") is None
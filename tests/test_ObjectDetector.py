@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -98,3 +99,226 @@ def test_object_detector_caching(temp_dir):
     detector3 = ObjectDetector(confidence_threshold=0.5, cache_dir=temp_dir)
     detector3.detect(dummy_image)
     assert mock_session.run.call_count == 2
+
+
+def _mock_detector(monkeypatch, temp_dir, output):
+    import onnxruntime as ort
+
+    mock_session = MagicMock()
+    mock_input = MagicMock()
+    mock_input.name = "input"
+    mock_session.get_inputs.return_value = [mock_input]
+    mock_session.run = MagicMock(return_value=[np.array([output], dtype=np.float32)])
+    monkeypatch.setattr(ort, "InferenceSession", lambda *args, **kwargs: mock_session)
+
+    detector = ObjectDetector(confidence_threshold=0.5, cache_dir=temp_dir)
+    detector.clear_cache()
+    return detector, mock_session
+
+
+def test_letterbox_preprocessing(monkeypatch, temp_dir):
+    detector, session = _mock_detector(monkeypatch, temp_dir, [[0, 0, 1, 1, 0.1, 0]])
+
+    # 1280x640 -> scaled to 640x320, padded by 160 rows at top and bottom
+    image = Image.new("RGB", (1280, 640), (255, 0, 0))
+    detector.detect(image)
+
+    tensor = session.run.call_args[0][1]["input"]
+    assert tensor.shape == (1, 3, 640, 640)
+    assert tensor.dtype == np.float32
+    assert np.allclose(tensor[0, :, :160, :], 114 / 255)
+    assert np.allclose(tensor[0, :, 480:, :], 114 / 255)
+    assert np.allclose(tensor[0, :, 160:480, :], [[[1.0]], [[0.0]], [[0.0]]])
+
+    # the input buffer is reused for the next image
+    detector.detect(Image.new("RGB", (640, 1280), (0, 0, 255)))
+    assert session.run.call_args[0][1]["input"] is tensor
+
+
+def test_letterbox_bbox_mapping(monkeypatch, temp_dir):
+    # box in model coordinates: x 100..300, y 200..360 inside the letterboxed image
+    detector, _ = _mock_detector(monkeypatch, temp_dir, [[100, 200, 300, 360, 0.9, 0]])
+
+    detections = detector.detect(Image.new("RGB", (1280, 640), (10, 20, 30)))
+
+    assert len(detections) == 1
+    # scale 0.5, vertical padding 160
+    assert detections[0].bbox == (200.0, 80.0, 600.0, 400.0)
+
+
+def test_reduced_jpeg_decode(monkeypatch, temp_dir):
+    detector, session = _mock_detector(monkeypatch, temp_dir, [[0, 0, 1, 1, 0.1, 0]])
+    path = Path(temp_dir) / "large.jpg"
+    Image.new("RGB", (4000, 3000), (0, 200, 0)).save(path)
+
+    with Image.open(path) as image:
+        loaded_rgb = detector._load_rgb(image, (640, 480))
+        detector.detect(image)
+
+        # decoded at 1/4 scale, the caller's image is neither decoded nor resized
+        assert loaded_rgb.size == (1000, 750)
+        assert image.size == (4000, 3000)
+        assert image.tile
+    assert session.run.call_count == 1
+
+
+def test_vectorized_postprocessing(monkeypatch, temp_dir):
+    detector, _ = _mock_detector(monkeypatch, temp_dir, [[0, 0, 1, 1, 0.1, 0]])
+    output = np.array(
+        [
+            [10, 10, 110, 110, 0.9, 0],  # person
+            [12, 12, 112, 112, 0.8, 0],  # overlapping person -> suppressed by NMS
+            [12, 12, 112, 112, 0.7, 16],  # dog at the same place: other class, kept
+            [300, 300, 400, 400, 0.4, 2],  # below threshold
+            [300, 300, 400, 400, 0.9, 7],  # truck: not a wanted class
+            [-20, 600, 50, 700, 0.6, 2],  # car, partially outside the image
+        ],
+        dtype=np.float32,
+    )
+
+    detections = detector._postprocess(output, 1.0, 0, 0, 640, 640)
+    assert [d.class_name for d in detections] == ["person", "person", "dog", "car"]
+    assert detections[-1].bbox == (0.0, 600.0, 50.0, 640.0)
+
+    detector.nms_iou_threshold = 0.5
+    detections = detector._postprocess(output, 1.0, 0, 0, 640, 640)
+    assert [(d.class_name, round(d.confidence, 1)) for d in detections] == [
+        ("person", 0.9),
+        ("dog", 0.7),
+        ("car", 0.6),
+    ]
+
+
+def test_postprocessing_many_candidates(monkeypatch, temp_dir):
+    detector, _ = _mock_detector(monkeypatch, temp_dir, [[0, 0, 1, 1, 0.1, 0]])
+    rng = np.random.default_rng(3)
+    output = np.zeros((8400, 6), dtype=np.float32)
+    output[:, :2] = rng.uniform(0, 600, (8400, 2))
+    output[:, 2:4] = output[:, :2] + rng.uniform(5, 40, (8400, 2))
+    output[:, 4] = rng.uniform(0, 1, 8400)
+    output[:, 5] = rng.integers(0, 80, 8400)
+
+    detections = detector._postprocess(output, 1.0, 0, 0, 640, 640)
+
+    expected = (output[:, 4] >= 0.5) & np.isin(output[:, 5], list(ObjectDetector.WANTED_CLASSES))
+    assert len(detections) == int(expected.sum()) > 0
+    assert all(d.confidence >= 0.5 for d in detections)
+
+
+def _capture_session(monkeypatch):
+    import onnxruntime as ort
+
+    captured = {}
+    mock_session = MagicMock()
+    mock_session.get_inputs.return_value = [MagicMock()]
+
+    def create_session(model_path, sess_options=None, providers=None):
+        captured["model_path"] = model_path
+        captured["options"] = sess_options
+        return mock_session
+
+    monkeypatch.setattr(ort, "InferenceSession", create_session)
+    return captured
+
+
+def test_session_options(monkeypatch, temp_dir):
+    import onnxruntime as ort
+
+    captured = _capture_session(monkeypatch)
+    ObjectDetector(
+        cache_dir=temp_dir,
+        intra_op_threads=3,
+        inter_op_threads=2,
+        execution_mode="parallel",
+        graph_optimization="basic",
+    )
+
+    options = captured["options"]
+    assert options.intra_op_num_threads == 3
+    assert options.inter_op_num_threads == 2
+    assert options.execution_mode == ort.ExecutionMode.ORT_PARALLEL
+    assert options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+
+
+def test_thread_counts_for_parallel_workers(monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+
+    assert ObjectDetector.resolve_thread_counts(0, 0, workers=1) == (0, 0)
+    assert ObjectDetector.resolve_thread_counts(0, 0, workers=4) == (2, 1)
+    assert ObjectDetector.resolve_thread_counts(0, 0, workers=16) == (1, 1)
+    assert ObjectDetector.resolve_thread_counts(3, 2, workers=4) == (3, 2)
+
+
+def test_optimized_model_cache(monkeypatch, temp_dir):
+    import onnxruntime as ort
+
+    captured = _capture_session(monkeypatch)
+    model = Path(temp_dir) / "model.onnx"
+    model.write_bytes(b"model")
+    optimized = Path(temp_dir) / "optimized" / "model.ort.onnx"
+
+    # first run: ONNX Runtime writes the optimized model
+    ObjectDetector(model_path=str(model), cache_dir=temp_dir, optimized_model_path=optimized)
+    assert captured["model_path"] == str(model)
+    assert captured["options"].optimized_model_filepath == str(optimized)
+
+    # later runs load the optimized model without optimizing it again
+    optimized.write_bytes(b"optimized")
+    ObjectDetector(model_path=str(model), cache_dir=temp_dir, optimized_model_path=optimized)
+    assert captured["model_path"] == str(optimized)
+    assert (
+        captured["options"].graph_optimization_level == ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    )
+
+
+def test_from_config(monkeypatch):
+    import onnxruntime as ort
+
+    from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+    captured = _capture_session(monkeypatch)
+    config = ConfigParameterManager(persist_last_used=False)
+    config.detector.intraOpThreads.value = 2
+    config.detector.graphOptimization.value = "extended"
+
+    ObjectDetector.from_config(config)
+
+    assert captured["options"].intra_op_num_threads == 2
+    assert (
+        captured["options"].graph_optimization_level
+        == ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    )
+
+
+def test_model_precision_switch(monkeypatch, tmp_path):
+    captured = _capture_session(monkeypatch)
+    monkeypatch.chdir(tmp_path)
+
+    # quantized model not created yet -> fall back to FP32
+    assert ObjectDetector.resolve_model_path("int8") == ObjectDetector.MODEL_PATHS["fp32"]
+
+    int8_model = Path(ObjectDetector.MODEL_PATHS["int8"])
+    int8_model.parent.mkdir(parents=True)
+    int8_model.write_bytes(b"int8")
+    assert ObjectDetector.resolve_model_path("int8") == ObjectDetector.MODEL_PATHS["int8"]
+
+    from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+    config = ConfigParameterManager(persist_last_used=False)
+    config.detector.modelPrecision.value = "int8"
+    detector = ObjectDetector.from_config(config)
+
+    assert captured["model_path"] == ObjectDetector.MODEL_PATHS["int8"]
+    # detections of the quantized model are cached separately
+    assert detector._cache_tag == int8_model.stem
+
+
+def test_prepare_input_matches_detect(monkeypatch, temp_dir):
+    detector, session = _mock_detector(monkeypatch, temp_dir, [[0, 0, 1, 1, 0.1, 0]])
+    image = Image.new("RGB", (900, 600), (30, 60, 90))
+
+    detector.detect(image)
+
+    tensor = ObjectDetector.prepare_input(image)
+    assert tensor is not detector._input_buffer
+    assert np.array_equal(tensor, session.run.call_args[0][1]["input"])
@@ -0,0 +1,112 @@
+import io
+
+import pytest
+from PIL import Image
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.core.OutputFormat import OutputFormat, OutputResolution
+
+
+def _page() -> Image.Image:
+    image = Image.linear_gradient("L").resize((320, 200)).convert("RGB")
+    image.paste((200, 30, 30), (40, 40, 120, 90))
+    return image
+
+
+def _encode(output_format: OutputFormat, image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, **output_format.save_options(300))
+    return buffer.getvalue()
+
+
+def _config(**values) -> ConfigParameterManager:
+    config = ConfigParameterManager(persist_last_used=False)
+    for name, value in values.items():
+        getattr(config.output, name).value = value
+    return config
+
+
+def test_default_matches_baseline_jpeg():
+    config = _config()
+    page = _page()
+
+    legacy = io.BytesIO()
+    page.save(legacy, format="JPEG", quality=config.size.jpgQuality.value, dpi=(300, 300))
+
+    output_format = OutputFormat.from_config(config)
+    assert output_format.extension == ".jpg"
+    assert _encode(output_format, page) == legacy.getvalue()
+
+
+@pytest.mark.parametrize(
+    "values, pil_format, lossless",
+    [
+        ({"outputFormat": "jpg", "jpgProgressive": True, "jpgOptimize": True}, "JPEG", False),
+        ({"outputFormat": "webp"}, "WEBP", False),
+        ({"outputFormat": "webp", "webpLossless": True}, "WEBP", True),
+        ({"outputFormat": "png", "pngCompressLevel": 9}, "PNG", True),
+        ({"outputFormat": "tiff", "tiffCompression": "tiff_adobe_deflate"}, "TIFF", True),
+    ],
+)
+def test_formats(values, pil_format, lossless):
+    page = _page()
+    data = _encode(OutputFormat.from_config(_config(**values)), page)
+
+    with Image.open(io.BytesIO(data)) as image:
+        assert image.format == pil_format
+        assert image.size == page.size
+        if lossless:
+            assert image.convert("RGB").tobytes() == page.tobytes()
+        if values.get("jpgProgressive"):
+            assert image.info.get("progressive")
+
+
+def test_icc_profile_is_embedded(tmp_path):
+    for output_format in ("jpg", "webp", "png", "tiff"):
+        data = _encode(
+            OutputFormat.from_config(_config(outputFormat=output_format, iccProfile="sRGB")),
+            _page(),
+        )
+        with Image.open(io.BytesIO(data)) as image:
+            assert image.info.get("icc_profile"), output_format
+
+    profile = tmp_path / "printer.icc"
+    profile.write_bytes(b"icc-profile")
+    output_format = OutputFormat.from_config(_config(iccProfile=str(profile)))
+    assert output_format.save_options()["icc_profile"] == b"icc-profile"
+
+
+def test_output_format_is_hashable():
+    output_format = OutputFormat.from_config(_config(outputFormat="webp"))
+
+    assert output_format == OutputFormat("webp", dict(output_format.options))
+    assert len({output_format, OutputFormat.from_config(_config(outputFormat="webp"))}) == 1
+
+    # the returned options are a copy
+    output_format.save_options()["quality"] = 1
+    assert output_format.save_options()["quality"] != 1
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        OutputFormat("gif")
+
+
+def test_parse_output_resolutions():
+    resolutions = OutputResolution.parse_list(" web:96, thumb:24 ,")
+    assert resolutions == [OutputResolution("web", 96), OutputResolution("thumb", 24)]
+    assert OutputResolution.parse_list("") == []
+    assert resolutions[0].scaled_size((2551, 1819), 300) == (816, 582)
+
+    for invalid in (
+        "web",
+        "web:0",
+        "web:x",
+        ":96",
+        "web:96,web:48",
+        "../web:96",
+        "a/b:96",
+        "..:96",
+    ):
+        with pytest.raises(ValueError):
+            OutputResolution.parse_list(invalid)
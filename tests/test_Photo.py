@@ -5,7 +5,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 from PIL import Image
 
-from Photo_Composition_Designer.common.Photo import Photo
+from Photo_Composition_Designer.common.Photo import (
+    READ_AHEAD_PER_WORKER,
+    Photo,
+    get_photos_from_dir,
+    iter_photos,
+    scan_photos,
+)
 
 EXAMPLE_IMAGE_1 = Path(__file__).parent.parent / "images" / "week_4" / "image_08.jpg"
 EXAMPLE_IMAGE_2 = Path(__file__).parent.parent / "images" / "week_4" / "image_09.jpg"
@@ -78,3 +84,74 @@ def test_get_date_exif():
     photo = Photo(EXAMPLE_IMAGE_2)
     date = photo.get_date()
     assert date == datetime(2023, 7, 31, 18, 54, 56)
+
+
+def test_get_image_source():
+    """Testet, ob eine ImageSource mit der Bildgröße aus dem Header zurückgegeben wird."""
+    photo = Photo(EXAMPLE_IMAGE_1)
+    source = photo.get_image_source()
+    with Image.open(EXAMPLE_IMAGE_1) as img:
+        assert source.size == img.size
+
+
+def test_scan_photos():
+    """Testet das parallele Einlesen der Metadaten: Reihenfolge bleibt erhalten."""
+    files = [EXAMPLE_IMAGE_5, EXAMPLE_IMAGE_1, EXAMPLE_IMAGE_2]
+    photos = scan_photos(files, max_workers=3)
+
+    assert [photo.file_path for photo in photos] == files
+    assert all(photo._metadata is not None for photo in photos)
+    assert photos[2].metadata.date == datetime(2023, 7, 31, 18, 54, 56)
+    with Image.open(EXAMPLE_IMAGE_1) as img:
+        assert photos[1].metadata.size == img.size
+    assert photos[1].get_image_source().size == img.size
+
+    with pytest.raises(FileNotFoundError):
+        scan_photos([EXAMPLE_IMAGE_1, Path("non_existent_image.jpg")])
+    photos = scan_photos([Path("non_existent_image.jpg"), EXAMPLE_IMAGE_1], missing_ok=True)
+    assert [photo.file_path for photo in photos] == [EXAMPLE_IMAGE_1]
+
+
+def test_iter_photos_reads_ahead_a_bounded_window():
+    consumed = []
+
+    def files():
+        for i in range(1000):
+            consumed.append(i)
+            yield (EXAMPLE_IMAGE_1, EXAMPLE_IMAGE_2)[i % 2]
+
+    photos = iter_photos(files(), max_workers=2)
+    first, second = next(photos), next(photos)
+    assert [first.file_path, second.file_path] == [EXAMPLE_IMAGE_1, EXAMPLE_IMAGE_2]
+    assert len(consumed) <= 2 * READ_AHEAD_PER_WORKER + 2
+
+    photos.close()
+    assert len(consumed) < 1000
+
+
+def test_scan_photos_skips_unreadable_file(tmp_path):
+    unreadable = tmp_path / "unreadable.jpg"
+    unreadable.mkdir()  # exists, but open() fails
+
+    photos = scan_photos([EXAMPLE_IMAGE_1, unreadable, EXAMPLE_IMAGE_2], max_workers=2)
+    assert [photo.file_path for photo in photos] == [EXAMPLE_IMAGE_1, EXAMPLE_IMAGE_2]
+
+
+def test_get_photos_from_dir_reads_metadata():
+    photos = get_photos_from_dir(EXAMPLE_IMAGE_1.parent)
+    assert [photo.file_path.name for photo in photos] == sorted(
+        file.name for file in EXAMPLE_IMAGE_1.parent.glob("*.jpg")
+    )
+    assert all(photo._metadata is not None for photo in photos)
+
+
+def test_get_photos_from_dir_trusts_scanned_files(monkeypatch):
+    """Files found by the directory scan are not checked for existence again."""
+    checked = []
+    exists = Path.exists
+    monkeypatch.setattr(Path, "exists", lambda self: checked.append(self) or exists(self))
+
+    photos = get_photos_from_dir(EXAMPLE_IMAGE_1.parent)
+    monkeypatch.undo()
+    assert EXAMPLE_IMAGE_1 in [photo.file_path for photo in photos]
+    assert checked == []
@@ -0,0 +1,71 @@
+import types
+from pathlib import Path
+
+import pytest
+
+from Photo_Composition_Designer.common.Photo import get_photos_from_dir
+from Photo_Composition_Designer.common.PhotoScanner import PhotoScanner
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def library(tmp_path):
+    for name in (
+        "c.JPG",
+        "f_edit.jpg",
+        "notes.txt",
+        "2024/05/a.jpg",
+        "2024/06/b.webp",
+        "raw/e.tif",
+        ".thumbnails/x.jpg",
+    ):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    return tmp_path
+
+
+def _names(scanner, folder):
+    return [path.relative_to(folder).as_posix() for path in scanner.iter_files(folder)]
+
+
+def test_scan(library):
+    scanner = PhotoScanner()
+    assert isinstance(scanner.iter_files(library), types.GeneratorType)
+    assert _names(scanner, library) == ["c.JPG", "f_edit.jpg"]
+    assert scanner.subfolders(library) == ["2024", "raw"]
+
+    recursive = PhotoScanner(recursive=True)
+    assert _names(recursive, library) == [
+        "c.JPG",
+        "f_edit.jpg",
+        "2024/05/a.jpg",
+        "2024/06/b.webp",
+        "raw/e.tif",
+    ]
+
+
+def test_scan_patterns(library):
+    scanner = PhotoScanner(recursive=True, exclude=("*_edit.jpg", "raw"))
+    assert _names(scanner, library) == ["c.JPG", "2024/05/a.jpg", "2024/06/b.webp"]
+    assert scanner.subfolders(library) == ["2024"]
+
+    scanner = PhotoScanner(recursive=True, include=("2024/05/*", "c.*"))
+    assert _names(scanner, library) == ["c.JPG", "2024/05/a.jpg"]
+
+
+def test_scanner_from_config():
+    config = ConfigParameterManager(persist_last_used=False)
+    config.general.recursiveScan.value = True
+    config.general.includePatterns.value = "IMG_*, 2024/*"
+    config.general.excludePatterns.value = ""
+
+    scanner = PhotoScanner.from_config(config)
+    assert scanner.recursive
+    assert scanner.include == ("IMG_*", "2024/*")
+    assert scanner.exclude == ()
+
+    photos = get_photos_from_dir(PROJECT_ROOT / "images", scanner=PhotoScanner(recursive=True))
+    assert len(photos) == len(list((PROJECT_ROOT / "images").rglob("*.jpg")))
@@ -0,0 +1,78 @@
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.core.base import CompositionDesigner
+from Photo_Composition_Designer.core.PhotoWatcher import PhotoWatcher
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+IMAGES = PROJECT_ROOT / "images"
+
+
+def _designer(tmp_path: Path) -> CompositionDesigner:
+    photos_dir = tmp_path / "photos"
+    for week in ("week_1", "week_2"):
+        shutil.copytree(IMAGES / week, photos_dir / week)
+
+    config = ConfigParameterManager(persist_last_used=False)
+    config.size.dpi.value = 20
+    config.layout.objectRecognition.value = False
+    config.layout.generatePdf.value = True
+    config.general.photoDirectory.value = str(photos_dir)
+    return CompositionDesigner(config)
+
+
+def test_update_renders_changed_weeks_only(tmp_path):
+    designer = _designer(tmp_path)
+    designer.generate_compositions_from_folders()
+    watcher = PhotoWatcher(designer, interval=0.05, debounce=0)
+    week_1 = designer.outputDir / "week_1.jpg"
+    week_1_written = week_1.stat().st_mtime_ns
+
+    assert watcher.update() == []
+
+    shutil.copy(IMAGES / "week_3" / "image_07.jpg", designer.photoDir / "week_2")
+    assert watcher.update() == ["week_2"]
+    assert week_1.stat().st_mtime_ns == week_1_written
+
+    # a new week after the others, a new week before the others shifts their dates
+    shutil.copytree(IMAGES / "week_3", designer.photoDir / "week_3")
+    assert watcher.update() == ["week_3"]
+    shutil.copytree(IMAGES / "title", designer.photoDir / "week_0")
+    assert watcher.update() == ["week_0", "week_1", "week_2", "week_3"]
+
+    # removed weeks lose their page, the following weeks move, the PDF is regenerated
+    pdf_written = (designer.outputDir / "output.pdf").stat().st_mtime_ns
+    shutil.rmtree(designer.photoDir / "week_2")
+    assert watcher.update() == ["week_3"]
+    assert not (designer.outputDir / "week_2.jpg").exists()
+    assert (designer.outputDir / "output.pdf").stat().st_mtime_ns > pdf_written
+
+
+def test_run_debounces_bursts(tmp_path, monkeypatch):
+    designer = _designer(tmp_path)
+    watcher = PhotoWatcher(designer, interval=0.02, debounce=0.3)
+    updates = []
+    update = watcher.update
+    monkeypatch.setattr(watcher, "update", lambda: updates.append(update()))
+
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+    try:
+        # a burst of changes is rendered once
+        for image in sorted((IMAGES / "week_4").glob("*.jpg")):
+            shutil.copy(image, designer.photoDir / "week_1")
+            time.sleep(0.05)
+        deadline = time.monotonic() + 20
+        while not updates and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.2)
+    finally:
+        watcher.stop()
+        thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert updates == [["week_1"]]
+    assert (designer.outputDir / "week_1.jpg").exists()
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
 from PIL import Image
 
 from Photo_Composition_Designer.image.ObjectDetector import ObjectDetector
@@ -86,3 +89,38 @@ def test_smart_crop(temp_dir):
                 visualized_image.save(temp_dir / visualized_image_name)
 
                 print(f"Processed {image_file.name} for {width}x{height}. Saved to {temp_dir}")
+
+
+def ssim(image_a: Image.Image, image_b: Image.Image, window: int = 7) -> float:
+    """Mean structural similarity of the luminance channels (uniform window)."""
+    a = np.asarray(image_a.convert("L"), dtype=np.float64)
+    b = np.asarray(image_b.convert("L"), dtype=np.float64)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    wa = sliding_window_view(a, (window, window))
+    wb = sliding_window_view(b, (window, window))
+    mean_a, mean_b = wa.mean(axis=(-1, -2)), wb.mean(axis=(-1, -2))
+    var_a, var_b = wa.var(axis=(-1, -2)), wb.var(axis=(-1, -2))
+    cov = (wa * wb).mean(axis=(-1, -2)) - mean_a * mean_b
+
+    ssim_map = ((2 * mean_a * mean_b + c1) * (2 * cov + c2)) / (
+        (mean_a**2 + mean_b**2 + c1) * (var_a + var_b + c2)
+    )
+    return float(ssim_map.mean())
+
+
+@pytest.mark.parametrize("target_size", [(480, 300), (300, 300), (200, 600)])
+def test_fast_downscale_quality(target_size):
+    """
+    The two-stage downscale (integer reduce + LANCZOS) must stay visually equivalent
+    to a single LANCZOS pass, also for large (about 8x) reductions.
+    """
+    image = Image.open("images/week_7_testimages_4/fietzfotos-london-2928889_1920.jpg")
+    image = image.convert("RGB").resize((3840, 2444), Image.Resampling.BICUBIC)
+
+    reference, reference_box = SmartCrop(fast_downscale=False).crop(image, *target_size)
+    fast, fast_box = SmartCrop(fast_downscale=True).crop(image, *target_size)
+
+    assert fast.size == reference.size == target_size
+    assert fast_box == reference_box
+    assert ssim(fast, reference) > 0.98
@@ -0,0 +1,150 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from Photo_Composition_Designer.cli import batch
+from Photo_Composition_Designer.cli.batch import BatchRunner, load_jobs, main
+from Photo_Composition_Designer.common.AssignmentManifest import AssignmentManifest, ManifestWeek
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _write_job(job_dir: Path, photo: str) -> Path:
+    """A small job: one page from one photo, config next to its library."""
+    library_dir = job_dir / "library"
+    library_dir.mkdir(parents=True)
+    AssignmentManifest([ManifestWeek("00_Dec-22", [PROJECT_ROOT / "images" / photo])]).save(
+        library_dir / "manifest.json"
+    )
+
+    config = ConfigParameterManager(persist_last_used=False)
+    config.size.dpi.value = 30
+    config.layout.objectRecognition.value = False
+    config.layout.generatePdf.value = False
+    config.geo.usePhotoLocationMaps.value = False
+    # relative to the config file
+    config.general.photoDirectory.value = "library"
+    config.general.assignmentManifest.value = "library/manifest.json"
+    config.general.locationsConfig.value = str(PROJECT_ROOT / "locations_en.ini")
+    config.general.anniversariesConfig.value = str(PROJECT_ROOT / "anniversaries.ini")
+
+    config_file = job_dir / "config.yaml"
+    config.save_to_file(str(config_file))
+    return config_file
+
+
+def test_load_jobs(tmp_path):
+    config_file = _write_job(tmp_path / "family", "title/image_02.jpg")
+    manifest = tmp_path / "jobs.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {"config": "family/config.yaml", "overrides": {"size__dpi": 20}},
+                    {"name": "club", "config": "family/config.yaml"},
+                ]
+            }
+        )
+    )
+
+    jobs = load_jobs([config_file, manifest])
+
+    assert [job.name for job in jobs] == ["family", "jobs-1", "club"]
+    assert jobs[1].config_file == config_file.resolve()
+
+    config = jobs[1].load_config()
+    assert config.size.dpi.value == 20
+    # relative paths stay as written and resolve against the config file
+    assert config.general.photoDirectory.value == Path("library")
+    assert config.resolve_path(config.general.photoDirectory.value) == (
+        tmp_path / "family" / "library"
+    )
+
+
+def test_batch_run_with_failure(tmp_path, capsys):
+    first = _write_job(tmp_path / "first", "title/image_02.jpg")
+    second = _write_job(tmp_path / "second", "week_4/image_08.jpg")
+
+    exit_code = main([str(first), str(tmp_path / "missing.yaml"), str(second)])
+
+    assert exit_code == 1
+    assert (tmp_path / "first" / "collages" / "00_Dec-22.jpg").exists()
+    assert (tmp_path / "second" / "collages" / "00_Dec-22.jpg").exists()
+
+    summary = capsys.readouterr().out
+    assert "FAILED" in summary
+    assert "2 of 3 jobs succeeded" in summary
+
+
+def test_config_is_loaded_once_per_job(tmp_path, monkeypatch):
+    jobs = load_jobs([_write_job(tmp_path / "first", "title/image_02.jpg")])
+    loaded = []
+    load_config = batch.BatchJob.load_config
+    monkeypatch.setattr(
+        batch.BatchJob, "load_config", lambda job: loaded.append(job.name) or load_config(job)
+    )
+
+    results = BatchRunner().run(jobs)
+
+    assert results[0].ok, results
+    assert loaded == ["first"]
+
+
+def test_batch_run_parallel(tmp_path):
+    jobs = load_jobs(
+        [
+            _write_job(tmp_path / "first", "title/image_02.jpg"),
+            _write_job(tmp_path / "second", "week_4/image_08.jpg"),
+        ]
+    )
+
+    results = BatchRunner(workers=2).run(jobs)
+
+    assert [result.name for result in results] == ["first", "second"]
+    assert all(result.ok for result in results), results
+    assert (tmp_path / "second" / "collages" / "00_Dec-22.jpg").exists()
+
+
+def test_parallel_workers_share_cores(tmp_path, monkeypatch):
+    """Without the detector service, each worker's own session gets cpus // workers threads."""
+    import onnxruntime as ort
+
+    sessions = []
+
+    class EmptySession:
+        def __init__(self, model_path, sess_options=None, providers=None):
+            sessions.append(sess_options)
+
+        def get_inputs(self):
+            return [SimpleNamespace(name="images", shape=[1, 3, 640, 640])]
+
+        def run(self, output_names, feed):
+            return [np.zeros((len(feed["images"]), 0, 6), dtype=np.float32)]
+
+    def unavailable(service):
+        raise RuntimeError("no service")
+
+    monkeypatch.setattr(ort, "InferenceSession", EmptySession)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+    monkeypatch.setattr(batch.DetectorService, "start", unavailable)
+    # workers as threads, so the patched session is used in them
+    monkeypatch.setattr(
+        batch, "ProcessPoolExecutor", lambda workers, mp_context: ThreadPoolExecutor(workers)
+    )
+
+    overrides = {"layout__objectRecognition": True}
+    jobs = load_jobs([_write_job(tmp_path / name, "title/image_02.jpg") for name in "ab"])
+    for job in jobs:
+        job.overrides = overrides
+
+    results = BatchRunner(workers=4).run(jobs)
+
+    assert all(result.ok for result in results), results
+    assert len(sessions) == 2
+    assert all(options.intra_op_num_threads == 2 for options in sessions)
+    assert all(options.inter_op_num_threads == 1 for options in sessions)
@@ -0,0 +1,41 @@
+import shutil
+from pathlib import Path
+
+from Photo_Composition_Designer.config.config import ConfigParameterManager
+from Photo_Composition_Designer.core.base import CompositionDesigner
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_paths_relative_to_config_file(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    (project_dir / "photos").mkdir(parents=True)
+    shutil.copy(PROJECT_ROOT / "locations_en.ini", project_dir / "places.ini")
+
+    config = ConfigParameterManager(persist_last_used=False)
+    config.layout.objectRecognition.value = False
+    config.general.photoDirectory.value = "photos"
+    config.general.locationsConfig.value = "places.ini"
+    config.save_to_file(str(project_dir / "config.yaml"))
+
+    # started from another directory
+    work_dir = tmp_path / "work"
+    (work_dir / "only_here").mkdir(parents=True)
+    monkeypatch.chdir(work_dir)
+    config = ConfigParameterManager(str(project_dir / "config.yaml"), persist_last_used=False)
+    designer = CompositionDesigner(config)
+
+    assert designer.photoDir == (project_dir / "photos").resolve()
+    assert config.resolve_path("places.ini") == (project_dir / "places.ini").resolve()
+    assert len(designer.locations) > 0
+    # paths that do not exist next to the config file refer to the working directory
+    assert config.resolve_path("only_here") == (work_dir / "only_here").resolve()
+    assert config.resolve_path(tmp_path) == tmp_path.resolve()
+
+
+def test_paths_without_config_file_refer_to_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = ConfigParameterManager(persist_last_used=False)
+
+    assert config.config_dir is None
+    assert config.resolve_path("photos") == (tmp_path / "photos").resolve()